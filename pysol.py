@@ -23,19 +23,22 @@
 # import pychecker.checker
 import sys
 
-# Initialise basics and read command line and settings.
-from pysollib.init import init
-init()
+# The solver pool workers (see pysollib/solverpool.py) import this file
+# again on platforms which spawn new processes, so nothing is run then.
+if __name__ == '__main__':
+    # Initialise basics and read command line and settings.
+    from pysollib.init import init
+    init()
 
-# Setup and Load the main process modules.
-# IMPORTANT: The set of modules to load depends on the settings
-# and command line options. Therfore import of pysollib.main
-# HAS TO BE after call to init().
-# See docs/README.SOURCE.
-# Flake8 test would complain here E402, so disabled
-from pysollib.main import main  # noqa: E402,I202
+    # Setup and Load the main process modules.
+    # IMPORTANT: The set of modules to load depends on the settings
+    # and command line options. Therfore import of pysollib.main
+    # HAS TO BE after call to init().
+    # See docs/README.SOURCE.
+    # Flake8 test would complain here E402, so disabled
+    from pysollib.main import main  # noqa: E402,I202
 
-# Execute it.
-# import profile
-# profile.run("main(sys.argv)")
-sys.exit(main(sys.argv))
+    # Execute it.
+    # import profile
+    # profile.run("main(sys.argv)")
+    sys.exit(main(sys.argv))
@@ -767,19 +767,25 @@ class PysolMenubar(PysolMenubarTk):
         if self.game.getHintClass() is not None:
             self._mDemo(mixed=0)
 
+    def mFastDemo(self, *args):
+        if self._cancelDrag():
+            return
+        if self.game.getHintClass() is not None:
+            self._mDemo(mixed=0, fast=True)
+
     def mMixedDemo(self, *args):
         if self._cancelDrag():
             return
         self._mDemo(mixed=1)
 
-    def _mDemo(self, mixed):
+    def _mDemo(self, mixed, fast=False):
         if self.changed():
             # only ask if there have been no demo moves or hints yet
             if self.game.stats.demo_moves == 0 and self.game.stats.hints == 0:
                 if not self.game.areYouSure(_("Play demo")):
                     return
         # self.app.demo_counter = 0
-        self.game.startDemo(mixed=mixed)
+        self.game.startDemo(mixed=mixed, fast=fast)
 
     def mReplay(self, *args):
         if self._cancelDrag():
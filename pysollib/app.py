@@ -69,6 +69,7 @@ from pysollib.resource import Tile, TileManager
 from pysollib.settings import DEBUG
 from pysollib.settings import PACKAGE, VERSION_TUPLE  # , WIN_SYSTEM
 from pysollib.settings import TOOLKIT
+from pysollib.solvercache import SolverCache
 from pysollib.speech import Speech
 from pysollib.util import IMAGE_EXTENSIONS
 from pysollib.winsystems import TkSettings
@@ -128,6 +129,7 @@ class Application:
         self.cardset_manager = CardsetManager()
         self.cardset = None             # current cardset
         self.cardsets_cache = {}
+        self.solver_cache = None        # see getSolverCache()
         self.tabletile_manager = TileManager()
         self.tabletile_index = 0        # current table tile
         self.sample_manager = SampleManager()
@@ -1215,6 +1217,17 @@ class Application:
     def getGamesForSolver(self):
         return self.gdb.getGamesForSolver()
 
+    def getSolverCache(self):
+        # the cache of solver results, or None if it is disabled
+        max_size = self.opt.solver_cache_size * 1024
+        if max_size <= 0:
+            return None
+        if self.solver_cache is None:
+            self.solver_cache = SolverCache(
+                os.path.join(self.dn.config, 'solver-cache'))
+        self.solver_cache.max_size = max_size
+        return self.solver_cache
+
     #
     # plugins
     #
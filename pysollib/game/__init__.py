@@ -35,9 +35,16 @@ from pysol_cards.cards import ms_rearrange
 from pysol_cards.random import random__int2str
 
 from pysollib.game.dump import pysolDumpGame
+from pysollib.game.snapshot import SnapshotSet, zobristStackHash
 from pysollib.gamedb import GI
 from pysollib.help import help_about
-from pysollib.hint import DefaultHint, HINT_LEVEL_SOLVER, HINT_LEVEL_STUCK
+from pysollib.hint import DeadlockCheck, DefaultHint
+from pysollib.hint import HINT_LEVEL_DEMO, HINT_LEVEL_LOOKAHEAD
+from pysollib.hint import HINT_LEVEL_PLAYER, HINT_LEVEL_SOLVER
+from pysollib.hint import HINT_LEVEL_STUCK
+from pysollib.hint import HintCache, LookaheadHint, MoveTargetIndex
+from pysollib.hint import STUCK_LOST, STUCK_NO_MOVES, STUCK_UNKNOWN
+from pysollib.hint import STUCK_WAIT
 from pysollib.mfxutil import Image, ImageTk, USE_PIL
 from pysollib.mfxutil import Struct, SubclassResponsibility, destruct
 from pysollib.mfxutil import format_time, print_err
@@ -245,7 +252,7 @@ def _highlightCards__calc_item(canvas, delta, cw, ch, s, c1, c2, color):
     # print c1, c2, x1, y1, x2, y2
     x1, x2 = x1-delta[0], x2+delta[1]
     y1, y2 = y1-delta[2], y2+delta[3]
-    if TOOLKIT == 'tk':
+    if TOOLKIT in ('tk', 'headless'):
         r = MfxCanvasRectangle(canvas, x1, y1, x2, y2,
                                width=4, fill=None, outline=color)
         if tkraise:
@@ -269,7 +276,7 @@ def _highlightCards__calc_item(canvas, delta, cw, ch, s, c1, c2, color):
 def _highlightEmptyStack__calc_item(canvas, delta, cw, ch, s, color):
     x1, y1 = s.x, s.y
     x2, y2 = x1 + cw, y1 + ch
-    if TOOLKIT == 'tk':
+    if TOOLKIT in ('tk', 'headless'):
         r = MfxCanvasRectangle(canvas, x1, y1, x2, y2,
                                width=4, fill=None, outline=color)
     elif TOOLKIT == 'kivy':
@@ -410,6 +417,15 @@ class GameHints(NewStruct):
     level = attr.ib(default=-1)
 
 
+@attr.s
+class GameHintPrefetch(NewStruct):
+    timer = attr.ib(default=None)
+    key = attr.ib(default=None)         # see getHintCacheKey()
+    stuck = attr.ib(default=None)       # iterHints() of the stuck check
+    hints = attr.ib(default=None)       # iterHints() of the player hints
+    deadlock = attr.ib(default=None)    # iterCheck() of DeadlockCheck
+
+
 @attr.s
 class GameStatsStruct(NewStruct):
     hints = attr.ib(default=0)                  # number of hints consumed
@@ -541,6 +557,21 @@ class Game:
     # the format for a saved game changed (see also canLoadGame())
     GAME_VERSION = 1
 
+    # the number of snapshots (see updateSnapshots()) remembered per game
+    SNAPSHOTS_MAXLEN = 10000
+
+    # the number of positions whose hints are remembered (see getHints())
+    HINT_CACHE_MAXLEN = 256
+
+    # the longest time (in seconds) an idle task of the hint prefetch may
+    # block the user interface, see prefetchHintsEvent()
+    HINT_PREFETCH_SLICE = 0.01
+
+    # a fast-forward demo repaints the table after this many moves or
+    # this many seconds, whichever comes first (see playFastDemoMoves())
+    FAST_DEMO_MOVES = 25
+    FAST_DEMO_REFRESH = 0.1
+
     # only basic initialization here
     def __init__(self, gameinfo):
         self.preview = 0
@@ -561,8 +592,17 @@ class Game:
         self.stackmap = {}              # dict with (x,y) tuples as key
         self.allstacks = []
         self.sn_groups = []  # snapshot groups; list of list of similar stacks
-        self.snapshots = []
-        self.failed_snapshots = []
+        self.snapshot_hash = 0  # incremental hash of the current position
+        self.model_only = False  # see enterModelOnly()
+        self.model_search = False  # see ModelSearch
+        self.model_only_view = None
+        self.snapshots = SnapshotSet(maxlen=self.SNAPSHOTS_MAXLEN)
+        self.failed_snapshots = SnapshotSet(maxlen=self.SNAPSHOTS_MAXLEN)
+        self.hint_cache = HintCache(maxlen=self.HINT_CACHE_MAXLEN)
+        # the results of DeadlockCheck
+        self.stuck_cache = HintCache(maxlen=self.HINT_CACHE_MAXLEN)
+        self.hint_prefetch = GameHintPrefetch()
+        self.movable_piles = {}  # see getTopPile()
         self.stackdesc_list = []
         self.keyboard_selected_stack = None
         self.keyboard_select_count = 1
@@ -772,6 +812,7 @@ class Game:
         self.busy = old_busy
 
     def destruct(self):
+        self.stopHintPrefetch()
         # help breaking circular references
         for obj in self.cards:
             destruct(obj)
@@ -781,19 +822,25 @@ class Game:
 
     # Do not destroy game structure (like stacks and cards) here !
     def reset(self, restart=0):
+        self.stopHintPrefetch()
         self.filename = ""
         self.demo = None
         self.solver = None
         self.hints = GameHints()
         self.saveinfo = GameSaveInfo()
         self.loadinfo = GameLoadInfo()
-        self.snapshots = []
-        self.failed_snapshots = []
+        self.snapshot_hash = 0
+        self.snapshots = SnapshotSet(maxlen=self.SNAPSHOTS_MAXLEN)
+        self.failed_snapshots = SnapshotSet(maxlen=self.SNAPSHOTS_MAXLEN)
+        self.movable_piles = {}
         # local statistics are reset on each game restart
         self.stats = GameStatsStruct()
         self.startMoves()
         if restart:
             return
+        # the hints of a restarted game can be used again
+        self.hint_cache.clear()
+        self.stuck_cache.clear()
         # global statistics survive a game restart
         self.gstats = GameGlobalStatsStruct()
         self.gsaveinfo = GameGlobalSaveInfo()
@@ -872,7 +919,10 @@ class Game:
             self.startGame()
         self.startMoves()
         for stack in self.allstacks:
+            # startGame() may have placed cards without atomic moves
+            stack.resetMovableRuns()
             stack.updateText()
+        self.resetSnapshotHash()
         self.updateSnapshots()
         self.updateText()
         self.updateStatus(moves=(0, 0))
@@ -910,16 +960,16 @@ class Game:
         assert len(self.allstacks) == len(game.loadinfo.stacks)
         old_state = game.moves.state
         game.moves.state = self.S_RESTORE
+        old_model_only = self.enterModelOnly()
         for i, cur_stack in enumerate(self.allstacks):
             for t in game.loadinfo.stacks[i]:
                 card_id, face_up = t
                 card = self.cards[card_id]
-                if face_up:
-                    card.showFace()
-                else:
-                    card.showBack()
-                cur_stack.addCard(card)
+                card.face_up = face_up
+                cur_stack.addCardModel(card)
+        self.leaveModelOnly(old_model_only)
         game.moves.state = old_state
+        self.resetSnapshotHash()
         # 4) update settings
         for stack_id, cap in self.saveinfo.stack_caps:
             # print stack_id, cap
@@ -1169,8 +1219,64 @@ class Game:
     def leaveState(self, old_state):
         self.moves.state = old_state
 
+    # In model-only mode the atomic moves only change the card lists
+    # and the face state of the cards - no animation, no canvas updates.
+    # The view is rebuilt once when leaving that mode.
+    def enterModelOnly(self):
+        old_model_only = self.model_only
+        if not old_model_only:
+            # remember what the view currently shows
+            stacks = {}
+            for stack in self.allstacks:
+                for card in stack.cards:
+                    stacks[card.id] = stack
+            self.model_only_view = dict(
+                (card.id, (stacks.get(card.id), card.face_up))
+                for card in self.cards)
+            self.model_only = True
+        return old_model_only
+
+    def leaveModelOnly(self, old_model_only):
+        if self.model_only and not old_model_only:
+            self.model_only = False
+            self.rebuildView()
+
+    def rebuildView(self):
+        # bring the view back in sync with the model
+        old_view, self.model_only_view = self.model_only_view, None
+        stacks = {}
+        for stack in self.allstacks:
+            for card in stack.cards:
+                stacks[card.id] = stack
+        for card in self.cards:
+            old_stack, face_up = old_view[card.id]
+            stack = stacks.get(card.id)
+            if stack is not old_stack:
+                if old_stack is not None:
+                    card.item.dtag(old_stack.group)
+                if stack is not None:
+                    card.item.addtag(stack.group)
+            if card.face_up != face_up:
+                # the image of the card still shows the old side
+                face_up, card.face_up = card.face_up, face_up
+                if face_up:
+                    card.showFace()
+                else:
+                    card.showBack()
+        for stack in self.allstacks:
+            stack.unshadeStack()
+            for card in stack.cards:
+                card.tkraise()
+                stack._position(card)
+            stack.updatePositions()
+            stack.refreshView()
+            stack.updateText()
+            if stack.is_filled:
+                stack._shadeStack()
+
     def getSnapshotHash(self):
         # generate hash (unique string) of current move
+        # (slow; see getSnapshot() for the incremental version)
         sn = []
         for stack in self.allstacks:
             s = []
@@ -1180,11 +1286,27 @@ class Game:
         sn = '-'.join(sn)
         return sn
 
-    def getSnapshot(self):
-        # optimisation
-        sn = hash(self.getSnapshotHash())
+    def calcSnapshotHash(self):
+        # compute the Zobrist hash of the current position from scratch
+        sn = 0
+        for stack in self.allstacks:
+            sn ^= zobristStackHash(stack)
         return sn
 
+    def resetSnapshotHash(self):
+        # must be called whenever cards were placed without atomic moves
+        self.snapshot_hash = self.calcSnapshotHash()
+
+    def updateSnapshotHash(self, stack, start=0, cards=None):
+        # toggle the cards stack.cards[start:] in or out of the hash;
+        # atomic moves call this both before and after they change
+        # the cards of a stack (see move.py)
+        self.snapshot_hash ^= zobristStackHash(stack, start, cards)
+
+    def getSnapshot(self):
+        # optimisation: the hash is kept up to date by the atomic moves
+        return self.snapshot_hash
+
     def createSnGroups(self):
         # group stacks by class and cap
         sg = {}
@@ -1201,13 +1323,7 @@ class Game:
         self.sn_groups = sg
 
     def updateSnapshots(self):
-        sn = self.getSnapshot()
-        if sn in self.snapshots:
-            # self.updateStatus(snapshot=True)
-            pass
-        else:
-            self.snapshots.append(sn)
-            # self.updateStatus(snapshot=False)
+        self.snapshots.add(self.getSnapshot())
 
     # Create all cards for the game.
     def createCards(self, progress=None):
@@ -2338,6 +2454,19 @@ class Game:
     def getHintClass(self):
         return self.Hint_Class
 
+    # the class of the solver returned by getPositionSolver() (or None),
+    # see pysollib/games/wastesolver.py
+    PositionSolver_Class = None
+    position_solver = None
+
+    # a solver that runs in the game itself, used by DeadlockCheck (or
+    # None); it has an iterSolve(time_budget) like Mahjongg_Solver
+    def getPositionSolver(self):
+        if self.position_solver is None and \
+                self.PositionSolver_Class is not None:
+            self.position_solver = self.PositionSolver_Class(self)
+        return self.position_solver
+
     def getStrictness(self):
         return 0
 
@@ -2443,6 +2572,8 @@ class Game:
         won, status, updated = self.getWinStatus()
         if not won:
             return False
+        if self.model_search:
+            return True
         self.finishMove()       # just in case
         if self.preview:
             return True
@@ -2461,6 +2592,9 @@ class Game:
             time_str = self.getTime()
         self.finished = True
         self.updateMenus()
+        if not self.app.opt.display_win_message:
+            # e.g. the headless engine (see HeadlessApp)
+            return True
         # Avoid a modal win dialog while iconified — it can prevent restore.
         if TOOLKIT != 'kivy' and self._isMainWindowIconic():
             self._pending_win_status = status
@@ -2584,7 +2718,7 @@ class Game:
 
     # handles autofaceup, autodrop and autodeal
     def autoPlay(self, autofaceup=-1, autodrop=-1, autodeal=-1, sound=True):
-        if self.demo:
+        if self.demo or self.model_search:
             return 0
         old_busy, self.busy = self.busy, 1
         if autofaceup < 0:
@@ -2771,7 +2905,7 @@ class Game:
         hi = []
         for si in stackinfo:
             for s in si[0]:
-                pile = s.getPile()
+                pile = self.getTopPile(s)
                 if pile and len(pile) >= si[1]:
                     hi.append((s, pile[0], pile[-1], col))
         if not hi:
@@ -2892,11 +3026,159 @@ class Game:
             # if self.solver is None:
             # return None
             return self.solver.getHints(taken_hint)
+        if level == HINT_LEVEL_LOOKAHEAD:
+            time_budget = self.app.opt.demo_lookahead / 1000.0 or None
+            hint = LookaheadHint(self, level, time_budget=time_budget)
+            return hint.getHints(taken_hint)
         hint_class = self.getHintClass()
         if hint_class is None:
             return None
-        hint = hint_class(self, level)      # call constructor
-        return hint.getHints(taken_hint)    # and return all hints
+        if not hint_class.CACHE_HINTS or (taken_hint and taken_hint[6]):
+            hint = hint_class(self, level)      # call constructor
+            return hint.getHints(taken_hint)    # and return all hints
+        # revisited positions (after undo, redo or restart) get the
+        # hints computed before
+        key = self.getHintCacheKey(level)
+        hints = self.hint_cache.get(key)
+        if hints is None and self.hint_prefetch.hints is not None and \
+                key == self.hint_prefetch.key:
+            # finish the hints computed while idle
+            for hints in self.hint_prefetch.hints:
+                pass
+            self.hint_prefetch.hints = None
+        if hints is None:
+            hint = hint_class(self, level)
+            hints = hint.getHints(taken_hint)
+        if hints is None:
+            return None
+        self.hint_cache.put(key, hints)
+        return list(hints)
+
+    def getHintCacheKey(self, level):
+        # all that the hints may depend on: the cards (see getSnapshot()),
+        # the redeals, the stack caps and the game specific vars
+        state = self.getState()
+        return (level, self.getSnapshot(), self.s.talon.round,
+                len(self.saveinfo.stack_caps),
+                repr(state) if state else None)
+
+    #
+    # Hint prefetch: after a move, the stuck check and the hints that
+    # showHint() shows (level 0) are computed in steps by idle tasks, so
+    # that neither the move nor the first `H' has to wait for them.
+    #
+
+    def startHintPrefetch(self, stuck_check=True):
+        self.stopHintPrefetch()
+        hint_class = self.getHintClass()
+        if (hint_class is None or self.demo or self.preview or
+                self.model_only or self.finished or TOOLKIT == 'kivy'):
+            if stuck_check:
+                self.updateStuck()
+            return
+        p = self.hint_prefetch
+        p.key = key = self.getHintCacheKey(HINT_LEVEL_PLAYER)
+        if stuck_check:
+            if (self.Stuck_Class is not None and
+                    self.Stuck_Class.CACHE_HINTS and
+                    self.hint_cache.get(
+                        self.getHintCacheKey(HINT_LEVEL_STUCK)) is None):
+                p.stuck = self.Stuck_Class.__class__(
+                    self, HINT_LEVEL_STUCK).iterHints()
+            else:
+                self.updateStuck()
+                if p.key is not key:
+                    # a new game was started
+                    return
+                self._startDeadlockCheck()
+        hints = self.hint_cache.get(key)
+        if hints is None:
+            p.hints = hint_class(self, HINT_LEVEL_PLAYER).iterHints()
+        else:
+            self._setPrefetchedHints(hints)
+        if (p.stuck is not None or p.hints is not None or
+                p.deadlock is not None):
+            p.timer = after_idle(self.top, self.prefetchHintsEvent)
+
+    def _startDeadlockCheck(self):
+        # after the stuck check has found moves; see DeadlockCheck
+        p = self.hint_prefetch
+        budget = self.app.opt.stuck_time_budget / 1000.0
+        if self.stuck or budget <= 0 or not DeadlockCheck.canCheck(self):
+            return
+        state = self.stuck_cache.get(self.getHintCacheKey(HINT_LEVEL_STUCK))
+        if state is None:
+            p.deadlock = DeadlockCheck(self, budget).iterCheck()
+        else:
+            self.updateStuck(state)
+
+    def stopHintPrefetch(self):
+        p = self.hint_prefetch
+        if p.timer:
+            after_cancel(p.timer)
+        if p.deadlock is not None:
+            # stop the solver
+            p.deadlock.close()
+        p.timer = p.key = p.stuck = p.hints = p.deadlock = None
+
+    def prefetchHintsEvent(self, *args):
+        p = self.hint_prefetch
+        p.timer = None
+        if self.busy or self.moves.current or \
+                self.moves.state != self.S_PLAY:
+            # in the middle of a move; try again later
+            p.timer = after(self.top, 100, self.prefetchHintsEvent)
+            return
+        if self.getHintCacheKey(HINT_LEVEL_PLAYER) != p.key:
+            self.stopHintPrefetch()
+            return
+        key = p.key
+        end = uclock() + self.HINT_PREFETCH_SLICE
+        while (p.stuck is not None or p.hints is not None or
+               p.deadlock is not None):
+            if uclock() >= end:
+                p.timer = after_idle(self.top, self.prefetchHintsEvent)
+                return
+            if p.stuck is not None:
+                hints = next(p.stuck, [])
+                if hints is not None:
+                    p.stuck = None
+                    # for getStuck()
+                    self.hint_cache.put(
+                        self.getHintCacheKey(HINT_LEVEL_STUCK), hints)
+                    self.updateStuck()
+                    if p.key is not key:
+                        # a new game was started
+                        return
+                    self._startDeadlockCheck()
+            elif p.hints is not None:
+                hints = next(p.hints, [])
+                if hints is not None:
+                    p.hints = None
+                    if self.getHintClass().CACHE_HINTS:
+                        self.hint_cache.put(key, hints)
+                    self._setPrefetchedHints(hints)
+            else:
+                state = next(p.deadlock, STUCK_UNKNOWN)
+                if state == STUCK_WAIT:
+                    # the solver runs in a thread
+                    p.timer = after(self.top, 100, self.prefetchHintsEvent)
+                    return
+                if state is not None:
+                    p.deadlock = None
+                    self.stuck_cache.put(
+                        self.getHintCacheKey(HINT_LEVEL_STUCK), state)
+                    self.updateStuck(state)
+                    if p.key is not key:
+                        # a new game was started
+                        return
+        self.stopHintPrefetch()
+
+    def _setPrefetchedHints(self, hints):
+        if self.hints.list is None:
+            self.hints.level = HINT_LEVEL_PLAYER
+            self.hints.list = list(hints)
+            self.hints.index = 0
 
     # give a hint
     def showHint(self, level=0, sleep=1.5, taken_hint=None):
@@ -3008,25 +3290,35 @@ class Game:
     # Demo - uses showHint()
     #
 
-    def startDemo(self, mixed=1, level=2):
+    def startDemo(self, mixed=1, level=2, fast=False):
+        # fast: fast-forward without animations, hint arrows and sleeps
         assert level >= 2               # needed for flip/deal hints
         if not self.top:
             return
-        self.demo = Struct(
+        self.demo = self.createDemo(mixed, level, fast)
+        self.hints.list = None
+        self.createDemoInfoText()
+        self.createDemoLogo()
+        after_idle(self.top, self.demoEvent)  # schedule first move
+
+    # the state of a demo; when hint_times is a list, playOneDemoMove()
+    # appends the time taken by each hint to it
+    def createDemo(self, mixed=0, level=2, fast=False):
+        if level == HINT_LEVEL_DEMO and self.app.opt.demo_lookahead:
+            level = HINT_LEVEL_LOOKAHEAD
+        return Struct(
             level=level,
             mixed=mixed,
-            sleep=self.app.opt.timeouts['demo'],
+            fast=fast,
+            sleep=0 if fast else self.app.opt.timeouts['demo'],
             last_deal=[],
-            snapshots=[],
+            snapshots=SnapshotSet(),
             hint=None,
             keypress=None,
             start_demo_moves=self.stats.demo_moves,
             info_text=None,
+            hint_times=None,
         )
-        self.hints.list = None
-        self.createDemoInfoText()
-        self.createDemoLogo()
-        after_idle(self.top, self.demoEvent)  # schedule first move
 
     def stopDemo(self, event=None):
         if not self.demo:
@@ -3061,9 +3353,10 @@ class Game:
         self.demo = Struct(
             level=2,
             mixed=0,
+            fast=False,
             sleep=self.app.opt.timeouts['demo'],
             last_deal=[],
-            snapshots=[],
+            snapshots=SnapshotSet(),
             hint=None,
             keypress=None,
             start_demo_moves=self.stats.demo_moves,
@@ -3171,8 +3464,11 @@ class Game:
         if getattr(self.demo, 'replay', False):
             after_idle(self.top, self.replayEvent)
             return
-        finished = self.playOneDemoMove(self.demo)
-        self.finishMove()
+        if self.demo.fast:
+            finished = self.playFastDemoMoves(self.demo)
+        else:
+            finished = self.playOneDemoMove(self.demo)
+            self.finishMove()
         self.top.update_idletasks()
         self.hints.list = None
         player_moves = self.getPlayerMoves()
@@ -3266,7 +3562,7 @@ class Game:
                 if self.nextGameFlags(id) == 0:
                     self.endGame()
                     self.newGame(autoplay=0)
-                    self.startDemo(mixed=demo.mixed)
+                    self.startDemo(mixed=demo.mixed, fast=demo.fast)
                 else:
                     self.endGame()
                     self.stopDemo()
@@ -3295,7 +3591,10 @@ class Game:
             if self._autoDeal(sound=False):
                 return 0
         # display a hint
+        t = uclock()
         h = self.showHint(demo.level, sleep, taken_hint=demo.hint)
+        if demo.hint_times is not None:
+            demo.hint_times.append(uclock() - t)
         demo.hint = h
         if not h:
             return 1
@@ -3316,21 +3615,36 @@ class Game:
                 demo.last_deal.append(c)
             else:                       # new version, based on snapshots
                 # check snapshot
-                sn = self.getSnapshot()
-                if sn in demo.snapshots:
+                if not demo.snapshots.add(self.getSnapshot()):
                     # not unique
                     return 1
-                demo.snapshots.append(sn)
         elif from_stack == to_stack:
             # a flip-move
-            from_stack.flipMove(animation=True)
+            from_stack.flipMove(animation=not demo.fast)
             demo.last_deal = []
         else:
             # a move-move
-            from_stack.moveMove(ncards, to_stack, frames=-1)
+            from_stack.moveMove(ncards, to_stack,
+                                frames=0 if demo.fast else -1)
             demo.last_deal = []
         return 0
 
+    # play demo moves in a row while in a fast-forward demo event; the
+    # caller repaints the table and handles key presses in between
+    def playFastDemoMoves(self, demo):
+        end = uclock() + self.FAST_DEMO_REFRESH
+        old_a, self.app.opt.animations = self.app.opt.animations, 0
+        try:
+            for i in range(self.FAST_DEMO_MOVES):
+                finished = self.playOneDemoMove(demo)
+                self.finishMove()
+                if finished or self.isGameWon() or uclock() >= end:
+                    break
+                self.hints.list = None
+        finally:
+            self.app.opt.animations = old_a
+        return finished
+
     def createDemoInfoText(self):
         # TODO - the text placement is not fully ok
         if DEBUG:
@@ -3409,56 +3723,118 @@ class Game:
         self.demo_logo = self.app.gimages.demo[int(n)]
         self.canvas.setTopImage(self.demo_logo)
 
-    def _iterMovablePiles(self, stack):
-        # Yield every face-up suffix pile the stack may move (longest first).
+    #
+    # legal moves
+    #
+
+    def _getMovablePilesEntry(self, stack):
+        # [key, top pile, all piles or None] of a stack of the game;
+        # canMoveCards() may depend on other stacks (e.g. the number
+        # of free cells), so an entry is only valid for one position
+        key = (self.snapshot_hash, self.s.talon.round,
+               len(self.saveinfo.stack_caps))
+        entry = self.movable_piles.get(stack.id)
+        if entry is None or entry[0] != key:
+            entry = [key, stack.getPile(), None]
+            self.movable_piles[stack.id] = entry
+        return entry
+
+    def getTopPile(self, stack):
+        # same as stack.getPile(), but cached until the position changes;
+        # the pile must not be modified
+        if stack is not self.allstacks[stack.id]:
+            # a cloned stack of the hints
+            return stack.getPile()
+        return self._getMovablePilesEntry(stack)[1]
+
+    def getMovablePiles(self, stack):
+        # all piles the stack may move, longest first (they are all
+        # suffixes of the top pile); cached like getTopPile()
+        if stack is not self.allstacks[stack.id]:
+            return self._findMovablePiles(stack, stack.getPile())
+        entry = self._getMovablePilesEntry(stack)
+        if entry[2] is None:
+            entry[2] = self._findMovablePiles(stack, entry[1])
+        return entry[2]
+
+    def _findMovablePiles(self, stack, top):
+        if not top:
+            return ()
+        piles = [top]
         cards = stack.cards
-        if not cards:
-            return
-        start = 0
-        for i, c in enumerate(cards):
-            if c.face_up:
-                start = i
-                break
-        piles = []
-        for i in range(start, len(cards)):
+        for i in range(len(cards) - len(top) + 1, len(cards)):
             pile = cards[i:]
             if stack.canMoveCards(pile):
                 piles.append(pile)
-        for pile in reversed(piles):
-            yield pile
+        return tuple(piles)
+
+    def iterLegalMoves(self, from_stacks=None, to_stacks=None):
+        # yield (ncards, from_stack, to_stack) for each move that can be
+        # made in the current position, using the conventions of the
+        # hints:
+        #   move a pile     ncards > 0, from_stack is not to_stack
+        #   flip a card     (1, stack, stack)
+        #   deal/redeal     (0, talon, None)
+        # the position must not be changed while iterating
+        if from_stacks is None:
+            from_stacks = self.sg.dropstacks
+        if to_stacks is None:
+            to_stacks = self.allstacks
+        index = MoveTargetIndex(to_stacks)
+        for r in from_stacks:
+            for pile in self.getMovablePiles(r):
+                for t in index.getTargets(pile[0]):
+                    if t is not r and t.acceptsCards(r, pile):
+                        yield (len(pile), r, t)
+        for s in from_stacks:
+            if s.canFlipCard():
+                yield (1, s, s)
+        if self.canDealCards():
+            yield (0, self.s.talon, None)
 
     def getStuck(self):
-        h = self.Stuck_Class.getHints(None) or []
+        if self.Stuck_Class.CACHE_HINTS:
+            key = self.getHintCacheKey(HINT_LEVEL_STUCK)
+            h = self.hint_cache.get(key)
+            if h is None:
+                h = self.Stuck_Class.getHints(None) or []
+                self.hint_cache.put(key, h)
+        else:
+            h = self.Stuck_Class.getHints(None) or []
         if h:
-            self.failed_snapshots = []
+            self.failed_snapshots.clear()
             return True
         if not self.canDealCards():
             return False
         # No table/waste moves, but dealing (or a waste redeal) is still
         # possible. Remember this layout; if we return here after dealing
         # through the talon/waste with no progress, treat as stuck.
-        sn = self.getSnapshot()
-        if sn in self.failed_snapshots:
-            return False
-        self.failed_snapshots.append(sn)
-        return True
+        return self.failed_snapshots.add(self.getSnapshot())
 
-    def updateStuck(self):
-        # stuck
+    def updateStuck(self, state=None):
+        # state is one of the STUCK_* of hint.py; by default the position
+        # is only checked for moves (the rest is up to DeadlockCheck)
         if self.finished or self.Stuck_Class is None or self.isGameWon() != 0:
             return
-        if self.getStuck():
+        if state is None:
+            state = STUCK_UNKNOWN if self.getStuck() else STUCK_NO_MOVES
+        if state not in (STUCK_NO_MOVES, STUCK_LOST):
             text = ''
             self.stuck = False
         else:
-            text = 'x'
+            if state == STUCK_NO_MOVES:
+                text = 'x'
+                msg = _("\nThere are no moves left...\n")
+            else:
+                text = '!'
+                msg = _("\nThis game can no longer be won...\n")
             if (not self.stuck and not self.demo and
                     self.app.opt.stuck_notification):
                 self.playSample("gamelost", priority=1000)
-                self.updateStatus(stuck='x')
+                self.updateStatus(stuck=text)
                 d = MfxMessageDialog(
                     self.top, title=_("You are Stuck"), bitmap="info",
-                    text=_("\nThere are no moves left...\n"),
+                    text=msg,
                     strings=(_("&New game"), _("&Restart"), None,
                              _("&Cancel")))
                 if TOOLKIT != 'kivy':
@@ -3595,7 +3971,9 @@ class Game:
     # Finish the current move.
     def finishMove(self):
         current, moves, stats = self.moves.current, self.moves, self.stats
-        if not current:
+        if not current or self.model_search:
+            # the moves of a search are taken back by the search that
+            # made them (see ModelSearch)
             return 0
         # invalidate hints
         self.hints.list = None
@@ -3656,8 +4034,7 @@ class Game:
         self.updateStatus(moves=(moves.index, self.stats.total_moves))
         self.updateMenus()
         self.updatePlayTime(do_after=0)
-        if not undo:
-            self.updateStuck()
+        self.startHintPrefetch(stuck_check=not undo)
         reset_solver_dialog()
 
         return 1
@@ -3681,7 +4058,8 @@ class Game:
         self.updateStatus(moves=(self.moves.index, self.stats.total_moves))
         self.updateMenus()
         self.updateStatus(stuck='')
-        self.failed_snapshots = []
+        self.failed_snapshots.clear()
+        self.startHintPrefetch(stuck_check=False)
         reset_solver_dialog()
 
     def redo(self):
@@ -3703,7 +4081,7 @@ class Game:
         self.updateText()
         self.updateStatus(moves=(self.moves.index, self.stats.total_moves))
         self.updateMenus()
-        self.updateStuck()
+        self.startHintPrefetch()
         reset_solver_dialog()
 
     #
@@ -3943,8 +4321,9 @@ class Game:
             game.gsaveinfo.__dict__.update(gsaveinfo.__dict__)
         moves = pload(GameMoves)
         game.moves.__dict__.update(moves.__dict__)
-        snapshots = pload(list)
-        game.snapshots = snapshots
+        snapshots = pload()
+        validate(isinstance(snapshots, (list, bytes)), err_txt)
+        game.snapshots.loadData(snapshots)
         if 0 <= bookmark <= 1:
             gstats = pload(GameGlobalStatsStruct)
             game.gstats.__dict__.update(gstats.__dict__)
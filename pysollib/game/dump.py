@@ -46,7 +46,7 @@ def pysolDumpGame(game_, p, bookmark=0):
         p.dump(game_.saveinfo)
         p.dump(game_.gsaveinfo)
     p.dump(game_.moves)
-    p.dump(game_.snapshots)
+    p.dump(game_.snapshots.dumpData())
     if 0 <= bookmark <= 1:
         if bookmark == 0:
             game_.gstats.saved += 1
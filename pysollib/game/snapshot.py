@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------
+
+import sys
+from array import array
+from collections import OrderedDict
+
+
+# ************************************************************************
+# * Zobrist hashing of game positions
+# *
+# * Every (stack, position, suit, rank, face_up) tuple is mapped to a
+# * fixed pseudo-random 64-bit key, and the hash of a position is the
+# * XOR of the keys of all its cards. As XOR is its own inverse, a move
+# * only has to XOR the keys of the cards it touches out of the hash
+# * and the keys of their new places back in (see Game.updateSnapshotHash
+# * and move.py), so the position hash is always available in O(1).
+# ************************************************************************
+
+SNAPSHOT_HASH_MASK = 0xFFFFFFFFFFFFFFFF
+
+_zobrist_keys = {}
+
+
+def _splitmix64(x):
+    # a fast, well distributed 64-bit mixing function; keys derived
+    # this way do not depend on the order in which they are requested,
+    # so snapshots are stable across sessions (and save files)
+    x = (x + 0x9E3779B97F4A7C15) & SNAPSHOT_HASH_MASK
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & SNAPSHOT_HASH_MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & SNAPSHOT_HASH_MASK
+    return x ^ (x >> 31)
+
+
+def zobristKey(stack_id, pos, card):
+    n = (((stack_id * 4096 + pos) * 16 + card.suit) * 256 + card.rank) * 2
+    if card.face_up:
+        n += 1
+    try:
+        return _zobrist_keys[n]
+    except KeyError:
+        key = _zobrist_keys[n] = _splitmix64(n)
+        return key
+
+
+def zobristStackHash(stack, start=0, cards=None):
+    # XOR of the keys of stack.cards[start:], or of the given cards
+    # as if they were placed on the stack starting at position start
+    h = 0
+    stack_id = stack.id
+    if cards is None:
+        cards = stack.cards
+        if start < 0:
+            start = max(0, len(cards) + start)
+        cards = cards[start:]
+    for pos, card in enumerate(cards, start):
+        h ^= zobristKey(stack_id, pos, card)
+    return h
+
+
+# ************************************************************************
+# * An ordered set of snapshots with O(1) membership test and an
+# * optional limit; when full the oldest snapshots are dropped first.
+# ************************************************************************
+
+class SnapshotSet:
+    def __init__(self, snapshots=(), maxlen=None):
+        self.maxlen = maxlen
+        self._snapshots = OrderedDict()
+        for sn in snapshots:
+            self.add(sn)
+
+    def __contains__(self, sn):
+        return sn in self._snapshots
+
+    def __iter__(self):
+        return iter(self._snapshots)
+
+    def __len__(self):
+        return len(self._snapshots)
+
+    def __repr__(self):
+        return '%s(%r, maxlen=%r)' % (self.__class__.__name__,
+                                      list(self), self.maxlen)
+
+    def add(self, sn):
+        # return False if sn is already known
+        snapshots = self._snapshots
+        if sn in snapshots:
+            return False
+        snapshots[sn] = None
+        if self.maxlen is not None and len(snapshots) > self.maxlen:
+            snapshots.popitem(last=False)
+        return True
+
+    def clear(self):
+        self._snapshots.clear()
+
+    #
+    # save/load; snapshots are saved as a packed array of little
+    # endian 64-bit integers, old save files contain a plain list
+    #
+
+    def dumpData(self):
+        a = array('Q', self._snapshots)
+        if sys.byteorder != 'little':
+            a.byteswap()
+        return a.tobytes()
+
+    def loadData(self, data):
+        self.clear()
+        if isinstance(data, list):
+            for sn in data:
+                self.add(sn & SNAPSHOT_HASH_MASK)
+            return
+        a = array('Q')
+        a.frombytes(data)
+        if sys.byteorder != 'little':
+            a.byteswap()
+        for sn in a:
+            self.add(sn)
@@ -360,6 +360,8 @@ class TrustyTwelve_Hint(AbstractHint):
     def computeHints(self):
         game = self.game
         for r in game.s.rows:
+            if not r.cards:
+                continue
             for t in game.s.rows:
                 if r is t:
                     continue
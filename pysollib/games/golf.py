@@ -25,6 +25,7 @@ import pysollib.game
 from pysollib.game import Game
 from pysollib.gamedb import GI, GameInfo, registerGame
 from pysollib.games.pileon import FourByFour_Hint
+from pysollib.games.wastesolver import Golf_Solver, WasteSolver_HintMethods
 from pysollib.hint import AbstractHint, CautiousDefaultHint, DefaultHint
 from pysollib.hint import BlackHoleSolverWrapper
 from pysollib.layout import Layout
@@ -53,8 +54,9 @@ from pysollib.util import ACE, ANY_RANK, ANY_SUIT, DIAMOND, KING, NO_RANK, \
         RANKS, SUITS, UNLIMITED_REDEALS
 
 
-class Golf_Hint(AbstractHint):
-    # FIXME: this is very simple
+class Golf_Hint(WasteSolver_HintMethods, AbstractHint):
+    # FIXME: this is very simple (but the winning move is found, see
+    # WasteSolver_HintMethods)
 
     def computeHints(self):
         game = self.game
@@ -135,6 +137,7 @@ class Golf_RowStack(BasicRowStack):
 class Golf(Game):
     Solver_Class = BlackHoleSolverWrapper(preset='golf', base_rank=0,
                                           queens_on_kings=True)
+    PositionSolver_Class = Golf_Solver
     Talon_Class = Golf_Talon
     Waste_Class = Golf_Waste
     Hint_Class = Golf_Hint
@@ -353,6 +356,7 @@ class KingsWay_Reserve(ReserveStack):
 
 class KingsWay(Golf):
     Solver_Class = None
+    PositionSolver_Class = None
 
     Talon_Class = KingsWay_Talon
     Waste_Class = KingsWay_Waste
@@ -407,6 +411,7 @@ class Elevator_RowStack(Golf_RowStack):
 
 
 class Elevator(RelaxedGolf):
+    PositionSolver_Class = None
 
     #
     # game layout
@@ -507,6 +512,7 @@ class BlackHole(Game):
         BlackHole_RowStack, max_accept=0, max_cards=3)
     Hint_Class = Golf_Hint
     Solver_Class = BlackHoleSolverWrapper(preset='black_hole')
+    PositionSolver_Class = Golf_Solver
 
     FOUNDATIONS = 1
 
@@ -1357,6 +1363,7 @@ class FirTree_GameMethods:
 
 class ThreeFirTrees(Golf, FirTree_GameMethods):
     Hint_Class = CautiousDefaultHint
+    PositionSolver_Class = None
     Waste_Class = Golf_Waste
 
     def createGame(self):
@@ -22,6 +22,7 @@
 # ---------------------------------------------------------------------------
 
 from pysollib.game import Game
+from pysollib.game.snapshot import SNAPSHOT_HASH_MASK
 from pysollib.gamedb import GI, GameInfo, registerGame
 from pysollib.layout import Layout
 from pysollib.mygettext import _
@@ -160,6 +161,9 @@ class HitOrMiss(Game):
         # if the game is stuck.
         return Game.getSnapshotHash(self) + str(self.rank)
 
+    def getSnapshot(self):
+        return hash((Game.getSnapshot(self), self.rank)) & SNAPSHOT_HASH_MASK
+
     def parseGameInfo(self):
         return RANKS[self.rank]
 
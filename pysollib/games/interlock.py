@@ -69,7 +69,7 @@ class Interlock_Hint(Yukon_Hint):
 
     def step010b_getPiles(self, stack):
         if hint_level_is_stuck(self.level):
-            p = stack.getPile()
+            p = self.game.getTopPile(stack)
             return (p, ) if p else ()
         return Yukon_Hint.step010b_getPiles(self, stack)
 
@@ -25,8 +25,7 @@ import pysollib.game
 from pysollib.game import Game
 from pysollib.gamedb import GI, GameInfo, registerGame
 from pysollib.games.canfield import CanfieldRush_Talon
-from pysollib.games.solvable_seeds.klondike_solvable_seeds import \
-        SOLVABLE_SEEDS
+from pysollib.games.solvable_seeds.seedindex import loadSeedIndex
 from pysollib.hint import CautiousDefaultHint
 from pysollib.hint import FreeCellSolverWrapper
 from pysollib.hint import KlondikeType_Hint
@@ -113,11 +112,15 @@ class Klondike(Game):
 
 class KlondikeAlwaysSolvable(Klondike):
     # picks a known-solvable seed for a fresh deal; leaves explicit
-    # seeds (e.g. "enter game number") alone
+    # seeds (e.g. "enter game number") alone. The seeds in klondike.seeds
+    # are all >= 32000, or they'd deal a different game than what was
+    # actually solved (see construct_random() in pysolrandom.py).
     def createRandom(self, random):
-        if random is None and SOLVABLE_SEEDS:
-            seed = self.app.gamerandom.choice(SOLVABLE_SEEDS)
-            random = construct_random(str(seed))
+        if random is None:
+            seeds = loadSeedIndex('klondike')
+            if seeds:
+                seed = self.app.gamerandom.choice(seeds)
+                random = construct_random(str(seed))
         Game.createRandom(self, random)
 
 
@@ -389,7 +389,7 @@ class LarasGame(Game):
         self.updateText()
         self.updateStatus(moves=(self.moves.index, self.stats.total_moves),
                           stuck='')
-        self.failed_snapshots = []
+        self.failed_snapshots.clear()
         self.updateMenus()
 
     def redo(self):
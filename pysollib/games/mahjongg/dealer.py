@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------
+
+
+# ************************************************************************
+# * Mahjongg_Dealer - solvable Mahjongg deals
+# *
+# * A deal is built backwards: starting with the filled layout, two free
+# * positions are taken away at a time, as if a pair of tiles had been
+# * removed, until the layout is empty. The tiles are then put in
+# * matching pairs on the position pairs, so removing the pairs in the
+# * same order solves the deal.
+# *
+# * Like Mahjongg_FreeTiles, the number of tiles above, left and right
+# * of each position is counted, and taking a position away only updates
+# * the counters of its neighbours, so a try is O(number of tiles). A
+# * try fails if the last tiles block each other (e.g. a tower of
+# * tiles); it is then tried again, MAX_TRIES times at most.
+# ************************************************************************
+
+class Mahjongg_Dealer:
+    MAX_TRIES = 100
+
+    def __init__(self, rows):
+        # rows: the row stacks of the game (with a blockmap)
+        self.rows = rows
+        index = dict((r, i) for i, r in enumerate(rows))
+        n = len(rows)
+        self.above = [[index[s] for s in r.blockmap.above] for r in rows]
+        self.left = [[index[s] for s in r.blockmap.left] for r in rows]
+        self.right = [[index[s] for s in r.blockmap.right] for r in rows]
+        # the positions which a position blocks from below, right and left
+        self.blocks_below = [[] for i in range(n)]
+        self.blocks_right = [[] for i in range(n)]
+        self.blocks_left = [[] for i in range(n)]
+        for i in range(n):
+            for j in self.above[i]:
+                self.blocks_below[j].append(i)
+            for j in self.left[i]:
+                self.blocks_right[j].append(i)
+            for j in self.right[i]:
+                self.blocks_left[j].append(i)
+
+    def getRemovalOrder(self, positions, random):
+        # take the positions (indexes of rows) away in pairs of free
+        # positions; returns the list of pairs, or None if this try got
+        # stuck
+        n = len(self.rows)
+        occupied = [False] * n
+        for i in positions:
+            occupied[i] = True
+        above = [0] * n
+        left = [0] * n
+        right = [0] * n
+        for i in positions:
+            above[i] = sum(occupied[j] for j in self.above[i])
+            left[i] = sum(occupied[j] for j in self.left[i])
+            right[i] = sum(occupied[j] for j in self.right[i])
+        free = [i for i in positions
+                if not above[i] and not (left[i] and right[i])]
+        # the index of each free position in free
+        where = dict((p, k) for k, p in enumerate(free))
+
+        def take(k):
+            # remove free[k] from free in O(1)
+            p, last = free[k], free.pop()
+            if last != p:
+                free[k] = last
+                where[last] = k
+            del where[p]
+            return p
+
+        order = []
+        remaining = len(positions)
+        while remaining:
+            if len(free) < 2:
+                return None
+            a = take(random.randrange(0, len(free)))
+            b = take(random.randrange(0, len(free)))
+            order.append((a, b))
+            occupied[a] = occupied[b] = False
+            for p in (a, b):
+                for counts, blocked in ((above, self.blocks_below[p]),
+                                        (left, self.blocks_right[p]),
+                                        (right, self.blocks_left[p])):
+                    for i in blocked:
+                        counts[i] -= 1
+                        if (occupied[i] and i not in where and
+                                not above[i] and not (left[i] and right[i])):
+                            where[i] = len(free)
+                            free.append(i)
+            remaining -= 2
+        return order
+
+    def canDeal(self, cards, positions, getMatchKey):
+        # if the cards can be put in matching pairs on the positions
+        if len(cards) != len(positions):
+            return False
+        kinds = {}
+        for c in cards:
+            key = getMatchKey(c)
+            kinds[key] = kinds.get(key, 0) + 1
+        return not [n for n in kinds.values() if n % 2]
+
+    def findRemovalOrder(self, positions, random, max_tries=None):
+        if len(positions) % 2:
+            return None
+        for i in range(max_tries or self.MAX_TRIES):
+            order = self.getRemovalOrder(positions, random)
+            if order is not None:
+                return order
+        return None
+
+    def dealPairs(self, cards, positions, order, random, getMatchKey,
+                  easy=False):
+        # put the cards in matching pairs on the position pairs of order;
+        # returns the list of the cards of the positions, or None if the
+        # cards can't be paired. In an easy deal all tiles of a kind are
+        # removed one pair after the other.
+        if len(cards) != len(positions):
+            return None
+        kinds = {}
+        for c in cards:
+            kinds.setdefault(getMatchKey(c), []).append(c)
+        kinds = [kinds[key] for key in sorted(kinds)]
+        for tiles in kinds:
+            if len(tiles) % 2:
+                return None
+            random.shuffle(tiles)
+        if easy:
+            random.shuffle(kinds)
+        pairs = [tiles[i:i+2] for tiles in kinds
+                 for i in range(0, len(tiles), 2)]
+        if not easy:
+            random.shuffle(pairs)
+        deal = {}
+        for (a, b), (c1, c2) in zip(order, pairs):
+            deal[a], deal[b] = c1, c2
+        return [deal[p] for p in positions]
+
+    def createDeal(self, cards, positions, random, getMatchKey, easy=False,
+                   max_tries=None):
+        # deal cards on positions (indexes of rows) so that the game can
+        # be won; returns the list of the cards of the positions, or None
+        # if no solvable deal was found
+        order = self.findRemovalOrder(positions, random, max_tries)
+        if order is None:
+            return None
+        return self.dealPairs(cards, positions, order, random, getMatchKey,
+                              easy)
@@ -22,11 +22,13 @@
 # ---------------------------------------------------------------------------
 
 import re
-import time
 
 from pysollib.game import Game
 from pysollib.gamedb import GI, GameInfo, registerGame
-from pysollib.hint import AbstractHint
+from pysollib.games.mahjongg.dealer import Mahjongg_Dealer
+from pysollib.games.mahjongg.solver import Mahjongg_Solver
+from pysollib.hint import AbstractHint, hint_level_is_demo_or_above
+from pysollib.hint import hint_level_is_stuck
 from pysollib.layout import Layout
 from pysollib.mfxutil import Image, Struct, kwdefault
 from pysollib.mygettext import _
@@ -34,47 +36,183 @@ from pysollib.mygettext import ungettext
 from pysollib.pysoltk import ANCHOR_NW, EVENT_HANDLED, bind
 from pysollib.pysoltk import MfxCanvasImage, MfxCanvasText
 from pysollib.pysoltk import MfxMessageDialog
-from pysollib.settings import DEBUG, TOOLKIT
+from pysollib.settings import TOOLKIT
 from pysollib.stack import \
         InitialDealTalonStack, \
         OpenStack
 from pysollib.util import ANY_SUIT, NO_RANK
 
 
-def _count_pairs(in_n):
-    """Returns the number of unordered pairs of n elements: (n choose 2)"""
-    return in_n * (in_n - 1) // 2
-
-
 # ************************************************************************
 # *
 # ************************************************************************
 
 class Mahjongg_Hint(AbstractHint):
-    # FIXME: no intelligence whatsoever is implemented here
-    def computeHints(self):
+    # the pairs are scored by the tiles they free, and the solver (see
+    # Mahjongg_Solver) says which pair wins and which pairs lose. The
+    # solver searches for TIME_BUDGET before the hints of the demo, and
+    # in the hint prefetch (iterHints()); showHint() does not wait for
+    # it and takes what the solver already knows of the position.
+    TIME_BUDGET = 0.1           # seconds per position
+
+    SCORE_WINNING = 100000
+    SCORE_LOSING = 1
+
+    def getHints(self, taken_hint=None):
+        search = hint_level_is_demo_or_above(self.level)
+        for hints in self.iterHints(taken_hint, search=search):
+            pass
+        return hints
+
+    def iterHints(self, taken_hint=None, search=True):
+        solver = self.game.mahjongg_solver
+        if (search and solver is not None and
+                not hint_level_is_stuck(self.level) and
+                not (taken_hint and taken_hint[6])):
+            yield from solver.iterSolve(self.TIME_BUDGET)
+        yield from AbstractHint.iterHints(self, taken_hint)
+
+    def iterComputeHints(self):
         game = self.game
-        # get free stacks
-        stacks = []
-        for r in game.s.rows:
-            if r.cards and not r.basicIsBlocked():
-                stacks.append(r)
+        solver = game.mahjongg_solver
+        if solver is None or hint_level_is_stuck(self.level):
+            self.computeHints()
+            yield
+            return
+        occupied = solver.update()
+        winning = solver.getSolutionMove(occupied)
+        for score, r, t in self._iterPairs():
+            move = (1 << r.id) | (1 << t.id)
+            if winning is not None and winning & move == move:
+                score += self.SCORE_WINNING
+            elif solver.isLost(occupied ^ move):
+                score = self.SCORE_LOSING
+            self.addHint(score, 1, r, t)
+
+    def computeHints(self):
+        for score, r, t in self._iterPairs():
+            self.addHint(score, 1, r, t)
+
+    def _iterPairs(self):
         # find matching tiles
-        i = 0
-        for r in stacks:
-            for t in stacks[i+1:]:
-                if game.cardsMatch(r.cards[0], t.cards[0]):
-                    # simple scoring...
-                    # score = 10000 + r.id + t.id
-                    rb = r.blockmap
-                    tb = t.blockmap
-                    score = \
-                        10000 + \
-                        1000 * (len(rb.below) + len(tb.below)) + \
-                        len(rb.all_left) + len(rb.all_right) + \
-                        len(tb.all_left) + len(tb.all_right)
-                    self.addHint(score, 1, r, t)
-            i += 1
+        for r, t in self.game.free_tiles.getPairs():
+            # simple scoring...
+            # score = 10000 + r.id + t.id
+            rb = r.blockmap
+            tb = t.blockmap
+            score = \
+                10000 + \
+                1000 * (len(rb.below) + len(tb.below)) + \
+                len(rb.all_left) + len(rb.all_right) + \
+                len(tb.all_left) + len(tb.all_right)
+            yield score, r, t
+
+
+# ************************************************************************
+# * Mahjongg_FreeTiles - the free tiles of a game, kept up to date while
+# * tiles are removed and put back (also by undo and redo)
+# *
+# * A tile is blocked by a tile on top of it, or by tiles on both its
+# * left and its right side. Instead of looking at the blockmap every
+# * time, the number of tiles above, left and right of each tile is
+# * counted, and the row stacks call update() whenever their tile comes
+# * or goes. The free tiles are kept in buckets of matching tiles (see
+# * AbstractMahjonggGame.getMatchKey()), so the matching pairs are found
+# * in O(number of pairs).
+# ************************************************************************
+
+class Mahjongg_FreeTiles:
+    def __init__(self, game, rows):
+        self.game = game
+        self.rows = rows
+        n = max(r.id for r in rows) + 1
+        # the stacks which a tile blocks from below, right and left
+        self.blocks_below = [()] * n
+        self.blocks_right = [()] * n
+        self.blocks_left = [()] * n
+        blocks = dict((r, ([], [], [])) for r in rows)
+        for r in rows:
+            bm = r.blockmap
+            for i, stacks in enumerate((bm.above, bm.left, bm.right)):
+                for s in stacks:
+                    blocks[s][i].append(r)
+        for r in rows:
+            below, right, left = blocks[r]
+            self.blocks_below[r.id] = tuple(below)
+            self.blocks_right[r.id] = tuple(right)
+            self.blocks_left[r.id] = tuple(left)
+        self.rebuild()
+
+    def rebuild(self):
+        # start from scratch, e.g. after cards were placed without
+        # atomic moves
+        n = len(self.blocks_below)
+        self.occupied = [False] * n
+        self.above = [0] * n
+        self.left = [0] * n
+        self.right = [0] * n
+        self.free = {}                  # free stack -> match key
+        self.buckets = {}               # match key -> set of free stacks
+        for r in self.rows:
+            self.update(r)
+
+    def update(self, stack):
+        # the tile of stack was removed or put back
+        i = stack.id
+        occupied = bool(stack.cards)
+        if occupied != self.occupied[i]:
+            self.occupied[i] = occupied
+            d = 1 if occupied else -1
+            for counts, stacks in ((self.above, self.blocks_below[i]),
+                                   (self.left, self.blocks_right[i]),
+                                   (self.right, self.blocks_left[i])):
+                for s in stacks:
+                    counts[s.id] += d
+                    self._updateFree(s)
+        self._updateFree(stack)
+
+    def _updateFree(self, stack):
+        key = None
+        if stack.cards and not self.isBlocked(stack):
+            key = self.game.getMatchKey(stack.cards[0])
+        old_key = self.free.get(stack)
+        if key == old_key:
+            return
+        if old_key is not None:
+            self.buckets[old_key].discard(stack)
+            del self.free[stack]
+        if key is not None:
+            self.buckets.setdefault(key, set()).add(stack)
+            self.free[stack] = key
+
+    def isBlocked(self, stack):
+        i = stack.id
+        return bool(self.above[i] or (self.left[i] and self.right[i]))
+
+    def isFree(self, stack):
+        return stack in self.free
+
+    def getFreeStacks(self):
+        return sorted(self.free, key=lambda s: s.id)
+
+    def getMatching(self, stack):
+        # the other free stacks whose tile matches the tile of stack
+        key = self.free.get(stack)
+        if key is None:
+            return []
+        return sorted((s for s in self.buckets[key] if s is not stack),
+                      key=lambda s: s.id)
+
+    def getPairs(self):
+        # all pairs of matching free tiles, in the order of the stacks
+        for r in self.getFreeStacks():
+            for t in self.getMatching(r):
+                if t.id > r.id:
+                    yield r, t
+
+    def countPairs(self):
+        # the number of pairs which can be removed at the same time
+        return sum(len(b) // 2 for b in self.buckets.values())
 
 
 # ************************************************************************
@@ -130,6 +268,9 @@ class Mahjongg_RowStack(OpenStack):
         OpenStack.__init__(self, x, y, game, **cap)
 
     def basicIsBlocked(self):
+        free_tiles = self.game.free_tiles
+        if free_tiles is not None:
+            return free_tiles.isBlocked(self)
         # any of above blocks
         for stack in self.blockmap.above:
             if stack.cards:
@@ -151,6 +292,53 @@ class Mahjongg_RowStack(OpenStack):
             return 0
         return self.game.cardsMatch(self.cards[0], cards[-1])
 
+    # keep the free tiles of the game up to date (see Mahjongg_FreeTiles)
+
+    def _updateFreeTiles(self):
+        free_tiles = self.game.free_tiles
+        if free_tiles is not None:
+            free_tiles.update(self)
+
+    def addCard(self, card, unhide=1, update=1):
+        OpenStack.addCard(self, card, unhide=unhide, update=update)
+        self._updateFreeTiles()
+        return card
+
+    def removeCard(self, card=None, unhide=1, update=1, update_positions=0):
+        card = OpenStack.removeCard(self, card, unhide=unhide, update=update,
+                                    update_positions=update_positions)
+        self._updateFreeTiles()
+        return card
+
+    def addCardModel(self, card):
+        OpenStack.addCardModel(self, card)
+        self._updateFreeTiles()
+        return card
+
+    def removeCardModel(self, card=None):
+        card = OpenStack.removeCardModel(self, card)
+        self._updateFreeTiles()
+        return card
+
+    def highlightMatchingCards(self, event):
+        # Mahjongg special: only the free tiles of the same kind match
+        free_tiles = self.game.free_tiles
+        if free_tiles is None:
+            return OpenStack.highlightMatchingCards(self, event)
+        if self._findCard(event) < 0 or not free_tiles.isFree(self):
+            return 0
+        stacks = free_tiles.getMatching(self)
+        if not stacks:
+            self.game.highlightNotMatching()
+            return 0
+        col_1 = self.game.app.opt.colors['cards_1']
+        col_2 = self.game.app.opt.colors['cards_2']
+        info = [(s, s.cards[0], s.cards[0], col_1) for s in stacks]
+        info.append((self, self.cards[0], self.cards[0], col_2))
+        self.game.stats.highlight_cards += 1
+        return self.game._highlightCards(
+            info, self.game.app.opt.timeouts['highlight_cards'])
+
     def canFlipCard(self):
         return 0
 
@@ -361,6 +549,11 @@ class AbstractMahjonggGame(Game):
     Hint_Class = Mahjongg_Hint
     RowStack_Class = Mahjongg_RowStack
 
+    # see createGame(); in Shisen-Sho the tiles that can be connected
+    # (see Shisen_Connections)
+    free_tiles = None
+    mahjongg_solver = None
+
     GAME_VERSION = 3
 
     NCARDS = 144
@@ -752,6 +945,9 @@ class AbstractMahjonggGame(Game):
         for r in s.rows:
             r.blockmap.all_left = tuple(r.blockmap.all_left.keys())
             r.blockmap.all_right = tuple(r.blockmap.all_right.keys())
+        self.free_tiles = Mahjongg_FreeTiles(self, s.rows)
+        self.dealer = Mahjongg_Dealer(s.rows)
+        self.mahjongg_solver = Mahjongg_Solver(self, s.rows)
 
         # create other stacks
         for i in range(4):
@@ -760,7 +956,7 @@ class AbstractMahjonggGame(Game):
                     x = l.XM+i*cardw
                     y = l.YM+fdyy+j*cardh
                 else:
-                    if TOOLKIT == 'tk':
+                    if TOOLKIT in ('tk', 'headless'):
                         x = -l.XS-self.canvas.xmargin
                         y = l.YM+dyy
                     elif TOOLKIT == 'kivy':
@@ -794,211 +990,29 @@ class AbstractMahjonggGame(Game):
     def _shuffleHook(self, cards):
         if self.app.opt.mahjongg_create_solvable == 0:
             return cards
-        # try to create a solvable game
-        if self.app.opt.mahjongg_create_solvable == 1:
-            # easy
-            return self._shuffleHook1(cards[:])
-        # hard
-        new_cards = self._shuffleHook2(self.s.rows, cards)
-        if new_cards is None:
+        # create a solvable game; the cards are dealt from the end
+        # (see startGame()). The tries of the dealer fail by chance, so
+        # it tries again with a new removal order until it has a deal,
+        # unless the tiles can't be paired at all.
+        if not self.dealer.canDeal(cards, list(range(len(self.s.rows))),
+                                   self.getMatchKey):
             return cards
-        return new_cards
-
-    def _shuffleHook1(self, cards):
-        # old version; it generate a very easy layouts
-        old_cards = cards[:]
-        rows = self.s.rows
-
-        def is_blocked(s, new_cards):
-            # any of above blocks
-            for stack in s.blockmap.above:
-                if new_cards[stack.id] is None:
-                    return True
-            # any of left blocks - but we can try right as well
-            for stack in s.blockmap.left:
-                if new_cards[stack.id] is None:
-                    break
-            else:
-                return False
-            # any of right blocks
-            for stack in s.blockmap.right:
-                if new_cards[stack.id] is None:
-                    return True
-            return False
-
-        def create_solvable(cards, new_cards):
-            if not cards:
-                return new_cards
-            # select two matching cards
-            c1 = cards[0]
-            del cards[0]
-            c2 = None
-            for i in range(len(cards)):
-                if self.cardsMatch(c1, cards[i]):
-                    c2 = cards[i]
-                    del cards[i]
-                    break
-            #
-            free_stacks = []            # none-blocked stacks
-            for r in rows:
-                if new_cards[r.id] is None and not is_blocked(r, new_cards):
-                    free_stacks.append(r)
-            if len(free_stacks) < 2:
-                return None             # try another way
-            #
-            old_pairs = []
-            for j in range(_count_pairs(len(free_stacks))):
-                nc = new_cards[:]
-                while True:
-                    # create uniq pair
-                    r1 = self.random.randrange(0, len(free_stacks))
-                    r2 = self.random.randrange(0, len(free_stacks)-1)
-                    if r2 >= r1:
-                        r2 += 1
-                    if (r1, r2) not in old_pairs and (r2, r1) not in old_pairs:
-                        old_pairs.append((r1, r2))
-                        break
-                # add two selected cards to new_cards
-                s1 = free_stacks[r1]
-                s2 = free_stacks[r2]
-                nc[s1.id] = c1
-                nc[s2.id] = c2
-                # check if this layout is solvable (backtracking)
-                nc = create_solvable(cards[:], nc)
-                if nc:
-                    return nc
-            return None                 # try another way
-
-        new_cards = create_solvable(cards, [None]*len(cards))
-        if new_cards:
-            new_cards.reverse()
-            return new_cards
-        print('oops! can\'t create a solvable game')
-        return old_cards
-
-    def _shuffleHook2(self, rows, cards):
-
-        start_time = time.time()
-        iters = [0]
-        # limitations
-        max_time = 5.0                  # seconds
-        max_iters = 2*len(cards)
-
-        def is_suitable(stack, cards):
-            for s in stack.blockmap.below:
-                if cards[s.id] == 1:
-                    continue
-                # check if below stacks are non-empty
-                if cards[s.id] is None:
-                    return False
-
-            for s in stack.blockmap.left:
-                if cards[s.id] == 1:
-                    continue
-                if cards[s.id] is None:
-                    for t in s.blockmap.all_left:
-                        if cards[t.id] == 1:
-                            continue
-                        if cards[t.id] is not None:
-                            # we have empty stack between two non-empty
-                            return False
-
-            for s in stack.blockmap.right:
-                if cards[s.id] == 1:
-                    continue
-                if cards[s.id] is None:
-                    for t in s.blockmap.all_right:
-                        if cards[t.id] == 1:
-                            continue
-                        if cards[t.id] is not None:
-                            # we have empty stack between two non-empty
-                            return False
-            return True
-
-        def create_solvable(cards, new_cards):
-            iters[0] += 1
-            if iters[0] > max_iters:
-                return None
-            if time.time() - start_time > max_time:
-                return None
-            if not cards:
+        while True:
+            new_cards = self._createSolvableDeal(cards, self.s.rows)
+            if new_cards is not None:
                 return new_cards
 
-            nc = new_cards[:]
-
-            # select two matching cards
-            c1 = cards[0]
-            del cards[0]
-            c2 = None
-            for i in range(len(cards)):
-                if self.cardsMatch(c1, cards[i]):
-                    c2 = cards[i]
-                    del cards[i]
-                    break
-
-            # find suitable stacks
-            #  suitable_stacks = []
-            #  for r in rows:
-            #      if nc[r.id] is None and is_suitable(r, nc):
-            #          suitable_stacks.append(r)
-            suitable_stacks = [r for r in rows
-                               if nc[r.id] is None and is_suitable(r, nc)]
-
-            old_pairs = []
-            for j in range(_count_pairs(len(suitable_stacks))):
-                if iters[0] > max_iters:
-                    return None
-                if time.time() - start_time > max_time:
-                    return None
-
-                # select two suitable stacks
-                while True:
-                    # create a uniq pair
-                    r1 = self.random.randrange(0, len(suitable_stacks))
-                    r2 = self.random.randrange(0, len(suitable_stacks))
-                    if r1 == r2:
-                        continue
-                    if (r1, r2) not in old_pairs and (r2, r1) not in old_pairs:
-                        old_pairs.append((r1, r2))
-                        break
-                s1 = suitable_stacks[r1]
-                s2 = suitable_stacks[r2]
-                # check if s1 don't block s2
-                nc[s1.id] = c1
-                if not is_suitable(s2, nc):
-                    nc[s1.id] = None
-                    continue
-                nc[s2.id] = c2
-                # check if this layout is solvable (backtracking)
-                ret = create_solvable(cards[:], nc)
-                if ret:
-                    ret = [x for x in ret if x != 1]
-                    return ret
-                nc[s1.id] = nc[s2.id] = None  # try another way
-
+    def _createSolvableDeal(self, cards, rows):
+        # the cards to deal on rows (in reverse order), or None if there
+        # is no solvable deal (see Mahjongg_Dealer)
+        index = dict((r, i) for i, r in enumerate(self.s.rows))
+        deal = self.dealer.createDeal(
+            cards, [index[r] for r in rows], self.random, self.getMatchKey,
+            easy=self.app.opt.mahjongg_create_solvable == 1)
+        if deal is None:
             return None
-
-        new_cards = [None]*len(self.s.rows)  # None - empty stack, 1 - non-used
-        drows = dict.fromkeys(rows)     # optimization
-        for r in self.s.rows:
-            if r not in drows:
-                new_cards[r.id] = 1
-        del drows
-
-        while True:
-            ret = create_solvable(cards[:], new_cards)
-            if DEBUG:
-                print('create_solvable time:', time.time() - start_time)
-            if ret:
-                ret.reverse()
-                return ret
-            if time.time() - start_time > max_time or \
-                    iters[0] <= max_iters:
-                print('oops! can\'t create a solvable game')
-                return None
-            iters = [0]
-        print('oops! can\'t create a solvable game')
-        return None
+        deal.reverse()
+        return deal
 
     def _mahjonggShuffle(self):
         talon = self.s.talon
@@ -1029,7 +1043,7 @@ class AbstractMahjonggGame(Game):
         old_state = self.enterState(self.S_FILL)
         self.saveSeedMove()
 
-        new_cards = self._shuffleHook2(rows, cards)
+        new_cards = self._createSolvableDeal(cards, rows)
         if new_cards is None:
             if TOOLKIT != 'kivy':
                 MfxMessageDialog(self.top, title=_('Warning'),
@@ -1048,11 +1062,9 @@ a solvable configuration.'''),
 
         self.stats.shuffle_moves += 1
         # move new_cards to talon
+        stacks = dict((r.cards[0].id, r) for r in rows)
         for c in new_cards:
-            for r in rows:
-                if r.cards and r.cards[0] is c:
-                    self.moveMove(1, r, talon, frames=0)
-                    break
+            self.moveMove(1, stacks[c.id], talon, frames=0)
         # deal
         for r in rows:
             self.moveMove(1, talon, r, frames=0)
@@ -1075,6 +1087,14 @@ a solvable configuration.'''),
     def isGameWon(self):
         return sum(len(f.cards) for f in self.s.foundations) == self.NCARDS
 
+    def resetSnapshotHash(self):
+        Game.resetSnapshotHash(self)
+        if self.free_tiles is not None:
+            self.free_tiles.rebuild()
+
+    def getPositionSolver(self):
+        return self.mahjongg_solver
+
     def shallHighlightMatch(self, stack1, card1, stack2, card2):
         if stack1.basicIsBlocked() or stack2.basicIsBlocked():
             return 0
@@ -1090,23 +1110,7 @@ a solvable configuration.'''),
         self.texts.info.config(text=t)
 
     def getText(self):
-        # find matching tiles
-        stacks = []
-        for r in self.s.rows:
-            if r.cards and not r.basicIsBlocked():
-                stacks.append(r)
-        f, i = 0, 0
-        for r in stacks:
-            n = 0
-            for t in stacks[i+1:]:
-                if self.cardsMatch(r.cards[0], t.cards[0]):
-                    n += 1
-            # if n == 3: n = 1
-            # elif n == 2: n = 0
-            n = n % 2
-            f += n
-            i += 1
-
+        f = self.free_tiles.countPairs()
         if f == 0:
             f = _('No Free\nMatching\nPairs')
         else:
@@ -1224,6 +1228,15 @@ a solvable configuration.'''),
     # Mahjongg extras
     #
 
+    def getMatchKey(self, card):
+        # two tiles match if they have the same key (see cardsMatch())
+        if card.suit == 3:
+            if card.rank >= 8:
+                return (3, 8)
+            if card.rank >= 4:
+                return (3, 4)
+        return (card.suit, card.rank)
+
     def cardsMatch(self, card1, card2):
         if card1.suit != card2.suit:
             return 0
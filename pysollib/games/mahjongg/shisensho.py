@@ -44,30 +44,149 @@ class Shisen_Hint(AbstractHint):
 
     def computeHints(self):
         game = self.game
-        # get free stacks
-        stacks = []
-        for r in game.s.rows:
-            if r.cards:
-                stacks.append(r)
-        # find matching tiles
-        i = 0
-        for r in stacks:
-            for t in stacks[i+1:]:
-                # if game.cardsMatch(r.cards[0], t.cards[0]):
-                if r.acceptsCards(t, t.cards):
-                    # simple scoring...
-                    if self.TOP_MATCHING:
-                        score = 2000 - r.rown - t.rown
-                    else:
-                        score = 1000 + r.rown + t.rown
-                    self.addHint(score, 1, r, t)
-            i += 1
+        # find the tiles that can be connected (see Shisen_Connections)
+        for r, t in game.free_tiles.getPairs():
+            # simple scoring...
+            if self.TOP_MATCHING:
+                score = 2000 - r.rown - t.rown
+            else:
+                score = 1000 + r.rown + t.rown
+            self.addHint(score, 1, r, t)
 
 
 class NotShisen_Hint(Shisen_Hint):
     TOP_MATCHING = True
 
 
+# ************************************************************************
+# * Shisen_Connections - the pairs of matching tiles that can be connected
+# *
+# * Two tiles are connected by a line with at most two turns through
+# * empty places, which may go round the border (the line itself is
+# * found by Shisen_RowStack.acceptsCards()). Such a line has a middle
+# * segment and two legs parallel to each other, one from each tile;
+# * a leg goes straight from its tile over empty places and may have no
+# * length. So a pair is connected if the legs of both tiles reach a row
+# * (or a column) where the places between them are empty.
+# *
+# * Like Mahjongg_FreeTiles, the row stacks call update() whenever their
+# * tile comes or goes, and the grid of the occupied places is kept up
+# * to date. The pairs are found again once after a change, a kind of
+# * tile at a time: the legs of each tile are found once, and checking
+# * a pair is O(columns + rows).
+# ************************************************************************
+
+class Shisen_Connections:
+    def __init__(self, game, rows):
+        self.game = game
+        self.rows = rows
+        cols, nrows = game.L
+        # the border is a row or column of empty places round the tiles
+        self.width, self.height = cols + 2, nrows + 2
+        # see FourRivers_RowStack
+        self.allow_adjacent = rows[0].allowAdjacent
+        self.rebuild()
+
+    def rebuild(self):
+        self.occupied = [[False] * self.height for x in range(self.width)]
+        for r in self.rows:
+            self.update(r)
+
+    def update(self, stack):
+        # the tile of stack was removed or put back
+        self.occupied[stack.coln + 1][stack.rown + 1] = bool(stack.cards)
+        self.pairs = None
+
+    def _getLegs(self, x, y):
+        # the rows and the columns which the legs from place (x, y) reach
+        occupied = self.occupied
+        column = occupied[x]
+        ys = [y]
+        for step in (-1, 1):
+            i = y + step
+            while 0 <= i < self.height and not column[i]:
+                ys.append(i)
+                i += step
+        xs = [x]
+        for step in (-1, 1):
+            i = x + step
+            while 0 <= i < self.width and not occupied[i][y]:
+                xs.append(i)
+                i += step
+        return set(ys), set(xs)
+
+    def _isClearRow(self, y, x1, x2):
+        # the places between (x1, y) and (x2, y) are empty
+        occupied = self.occupied
+        x1, x2 = min(x1, x2), max(x1, x2)
+        return not any(occupied[x][y] for x in range(x1 + 1, x2))
+
+    def _isClearColumn(self, x, y1, y2):
+        y1, y2 = min(y1, y2), max(y1, y2)
+        return not any(self.occupied[x][y1 + 1:y2])
+
+    def connects(self, a, b, legs_a, legs_b):
+        xa, ya = a.coln + 1, a.rown + 1
+        xb, yb = b.coln + 1, b.rown + 1
+        ys_a, xs_a = legs_a
+        ys_b, xs_b = legs_b
+        for y in ys_a & ys_b:
+            if (y == ya == yb and abs(xa - xb) == 1 and
+                    not self.allow_adjacent):
+                continue
+            if self._isClearRow(y, xa, xb):
+                return True
+        for x in xs_a & xs_b:
+            if (x == xa == xb and abs(ya - yb) == 1 and
+                    not self.allow_adjacent):
+                continue
+            if self._isClearColumn(x, ya, yb):
+                return True
+        return False
+
+    def getPairs(self):
+        # all pairs of tiles that can be connected, in the order of the
+        # stacks
+        if self.pairs is None:
+            kinds = {}
+            for r in self.rows:
+                if r.cards:
+                    key = self.game.getMatchKey(r.cards[0])
+                    kinds.setdefault(key, []).append(r)
+            pairs = []
+            for tiles in kinds.values():
+                if len(tiles) < 2:
+                    continue
+                legs = [self._getLegs(r.coln + 1, r.rown + 1) for r in tiles]
+                for i, r in enumerate(tiles):
+                    for j in range(i + 1, len(tiles)):
+                        if self.connects(r, tiles[j], legs[i], legs[j]):
+                            pairs.append((r, tiles[j]))
+            pairs.sort(key=lambda pair: (pair[0].id, pair[1].id))
+            self.pairs = pairs
+        return self.pairs
+
+    def isFree(self, stack):
+        # any tile may be selected
+        return bool(stack.cards)
+
+    def getMatching(self, stack):
+        # the stacks whose tile can be connected with the tile of stack
+        stacks = [t for r, t in self.getPairs() if r is stack]
+        stacks += [r for r, t in self.getPairs() if t is stack]
+        return sorted(stacks, key=lambda s: s.id)
+
+    def countPairs(self):
+        return len(self.getPairs())
+
+
+class NotShisen_Connections(Shisen_Connections):
+    # the tiles in a row or a column can be connected, whatever is
+    # between them
+    def connects(self, a, b, legs_a, legs_b):
+        return a.coln == b.coln or a.rown == b.rown
+
+
 # ************************************************************************
 # * Shisen-Sho
 # ************************************************************************
@@ -305,6 +424,7 @@ class Shisen_RowStack(Mahjongg_RowStack):
 class AbstractShisenGame(AbstractMahjonggGame):
     Hint_Class = NotShisen_Hint  # Shisen_Hint
     RowStack_Class = Shisen_RowStack
+    Connections_Class = Shisen_Connections
 
     # NCARDS = 144
     GRAVITY = True
@@ -370,6 +490,7 @@ class AbstractShisenGame(AbstractMahjonggGame):
                 self.cols[col].append(stack)
         # from pprint import pprint
         # pprint(self.cols)
+        self.free_tiles = self.Connections_Class(self, s.rows)
 
         # create other stacks
         y = l.YM + dyy
@@ -406,18 +527,7 @@ class AbstractShisenGame(AbstractMahjonggGame):
 
     def getText(self):
         if self.app.opt.shisen_show_matching:
-            # find matching tiles
-            stacks = self.s.rows
-            f, i = 0, 0
-            for r in stacks:
-                i = i + 1
-                if not r.cards:
-                    continue
-                for t in stacks[i:]:
-                    if not t.cards:
-                        continue
-                    if r.acceptsCards(t, t.cards):
-                        f += 1
+            f = self.free_tiles.countPairs()
             if f == 0:
                 f = _('No Free\nMatching\nPairs')
             else:
@@ -503,6 +613,7 @@ class NotShisen_RowStack(Shisen_RowStack):
 class NotShisen_14x6(AbstractShisenGame):
     Hint_Class = NotShisen_Hint
     RowStack_Class = NotShisen_RowStack
+    Connections_Class = NotShisen_Connections
     L = (14, 6)
     NCARDS = 84
 
@@ -510,12 +621,14 @@ class NotShisen_14x6(AbstractShisenGame):
 class NotShisen_18x8(AbstractShisenGame):
     Hint_Class = NotShisen_Hint
     RowStack_Class = NotShisen_RowStack
+    Connections_Class = NotShisen_Connections
     L = (18, 8)
 
 
 class NotShisen_24x12(AbstractShisenGame):
     Hint_Class = NotShisen_Hint
     RowStack_Class = NotShisen_RowStack
+    Connections_Class = NotShisen_Connections
     L = (24, 12)
     NCARDS = 288
 
@@ -0,0 +1,311 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------
+
+import time
+from random import Random
+
+
+# ************************************************************************
+# * Mahjongg_Solver - finds out if the tiles left can all be removed
+# *
+# * A position is the set of the occupied positions, kept as the bits of
+# * an int (bit i is game.s.rows[i]); as the tiles are only taken away,
+# * the tile of a position is known from the deal. The search is depth
+# * first, with the tiles that free most other tiles tried first:
+# *
+# *   - positions that can't be won are remembered (self.lost), also
+# *     from one search to the next, and so are the winning moves of the
+# *     positions on the way to a win (self.solution)
+# *   - tiles of one kind can take each other's place. If all tiles
+# *     left of a kind are free, removing them all can't do any harm, so
+# *     that is the only move tried. Otherwise every pair of the free
+# *     tiles of the kind is a move; the orders in which they can be
+# *     removed lead to the same position, which is then only searched
+# *     once.
+# *   - a move is not made if the last two tiles of a kind would have to
+# *     wait for each other (see _isDeadPair())
+# *   - the search is heavy-tailed: most deals are won at once, but a
+# *     bad first move costs a lot. It starts again with a shuffled
+# *     order after RESTART_POSITIONS positions, then after twice as
+# *     many, and so on.
+# *
+# * The memo is only valid for one deal; a shuffle of the game, or an
+# * undo of it, starts a new one (see update()).
+# *
+# * iterSolve() works in steps and yields between them, like
+# * DeadlockCheck.iterCheck(); the result is one of 'solved', 'unsolved'
+# * and 'unknown', as the solver_state of the solvers of hint.py.
+# ************************************************************************
+
+def _bitCount(n):
+    return bin(n).count('1')
+
+
+class Mahjongg_Solver:
+    MAX_POSITIONS = 200000      # per search
+    RESTART_POSITIONS = 300
+    MAX_LOST = 1000000          # the memo is cleared then
+    STEP_TIME = 0.01            # seconds
+
+    def __init__(self, game, rows):
+        self.game = game
+        self.rows = rows
+        index = dict((r, i) for i, r in enumerate(rows))
+
+        def mask(stacks):
+            m = 0
+            for s in stacks:
+                m |= 1 << index[s]
+            return m
+
+        self.above = [mask(r.blockmap.above) for r in rows]
+        # the positions which must all be taken away before a tile can
+        # be (the tiles above it, and above them, ...)
+        self.under = [None] * len(rows)
+        for i in range(len(rows)):
+            self._getUnder(i)
+        self.left = [mask(r.blockmap.left) for r in rows]
+        self.right = [mask(r.blockmap.right) for r in rows]
+        # the tiles that free most tiles (below them, and in their row)
+        # are tried first
+        covered = [0] * len(rows)
+        for under in self.under:
+            while under:
+                bit = under & -under
+                under ^= bit
+                covered[bit.bit_length() - 1] += 1
+        self.weight = [1 + 10 * covered[i] + len(r.blockmap.all_left) +
+                       len(r.blockmap.all_right)
+                       for i, r in enumerate(rows)]
+        self.kind_ids = {}              # match key -> kind
+        self.kinds = [None] * len(rows)
+        self.kind_masks = {}            # kind -> positions of the kind
+        self.clear()
+
+    def _getUnder(self, i):
+        under = self.under[i]
+        if under is None:
+            under = self.above[i]
+            m = self.above[i]
+            while m:
+                bit = m & -m
+                m ^= bit
+                under |= self._getUnder(bit.bit_length() - 1)
+            self.under[i] = under
+        return under
+
+    def clear(self):
+        self.lost = set()
+        self.solution = {}              # position -> move (a mask)
+
+    def update(self):
+        # note the kinds of the tiles; returns the current position
+        game = self.game
+        occupied = 0
+        changed = False
+        for i, r in enumerate(self.rows):
+            if not r.cards:
+                continue
+            occupied |= 1 << i
+            key = game.getMatchKey(r.cards[0])
+            kind = self.kind_ids.setdefault(key, len(self.kind_ids))
+            if self.kinds[i] != kind:
+                self.kinds[i] = kind
+                changed = True
+        if changed:
+            self.kind_masks = {}
+            for i, kind in enumerate(self.kinds):
+                if kind is not None:
+                    self.kind_masks[kind] = self.kind_masks.get(kind, 0) | \
+                        1 << i
+            self.clear()
+        return occupied
+
+    def getMoves(self, occupied, random=None):
+        # the moves of a position, as masks of the tiles to remove; the
+        # best one is the last (with random, the order is shuffled a bit)
+        above, left, right = self.above, self.left, self.right
+        free = {}
+        m = occupied
+        while m:
+            bit = m & -m
+            m ^= bit
+            i = bit.bit_length() - 1
+            if occupied & above[i] or \
+                    (occupied & left[i] and occupied & right[i]):
+                continue
+            free.setdefault(self.kinds[i], []).append(i)
+        weight = self.weight
+        moves = []
+        for kind, tiles in free.items():
+            n = len(tiles)
+            if n < 2:
+                continue
+            left_of_kind = occupied & self.kind_masks[kind]
+            if n == _bitCount(left_of_kind):
+                return [left_of_kind]
+            for j in range(n):
+                a = tiles[j]
+                for b in tiles[j+1:]:
+                    move = (1 << a) | (1 << b)
+                    rest = left_of_kind ^ move
+                    if rest and self._isDeadPair(occupied ^ move, rest):
+                        continue
+                    moves.append((weight[a] + weight[b], move))
+        if random is not None:
+            moves = [(w * (random.random() + 0.5), move)
+                     for w, move in moves]
+        moves.sort()
+        return [move for w, move in moves]
+
+    def _isDeadKind(self, tiles):
+        # the tiles left of a kind can't all be removed if a tile is
+        # under the only other one, or one of four is under the three
+        # others, or under a tile which is under another one
+        under = self.under
+        tiles = [(1 << i, under[i]) for i in range(tiles.bit_length())
+                 if tiles >> i & 1]
+        if len(tiles) == 2:
+            (a, under_a), (b, under_b) = tiles
+            return bool(under_a & b or under_b & a)
+        if len(tiles) != 4:
+            # (the double sets have eight tiles of a kind)
+            return False
+        for a, under_a in tiles:
+            on_top = [(b, under_b) for b, under_b in tiles
+                      if under_a & b]
+            if len(on_top) == 3:
+                return True
+            for b, under_b in on_top:
+                if any(under_b & c for c, under_c in on_top):
+                    return True
+        return False
+
+    def _isDeadPair(self, occupied, pair):
+        # the last two tiles of a kind must wait for the tiles above
+        # them; if those are also the last two of their kind, these
+        # must wait for the tiles above them, and so on. The position
+        # can't be won if pair has to wait for itself.
+        under, kinds, kind_masks = self.under, self.kinds, self.kind_masks
+        if _bitCount(pair) != 2:
+            return self._isDeadKind(pair)
+        seen = set()
+        todo = [pair]
+        while todo:
+            p = todo.pop()
+            a = p & -p
+            b = p ^ a
+            waits = (under[a.bit_length() - 1] |
+                     under[b.bit_length() - 1]) & occupied
+            while waits:
+                bit = waits & -waits
+                waits ^= bit
+                q = occupied & kind_masks[kinds[bit.bit_length() - 1]]
+                if q == pair:
+                    return True
+                if q not in seen and _bitCount(q) == 2:
+                    seen.add(q)
+                    todo.append(q)
+        return False
+
+    def isDead(self, occupied):
+        # a quick check for some positions that can't be won
+        return any(self._isDeadKind(occupied & tiles)
+                   for tiles in self.kind_masks.values())
+
+    def getSolutionMove(self, occupied):
+        # the move that wins from a position, or None if not known
+        return self.solution.get(occupied)
+
+    def isLost(self, occupied):
+        return occupied in self.lost
+
+    def solve(self, time_budget):
+        it = self.iterSolve(time_budget)
+        while True:
+            try:
+                next(it)
+            except StopIteration as e:
+                return e.value
+
+    def iterSolve(self, time_budget, step_time=None):
+        # search from the current position of the game; yields None
+        # after each step and returns the result
+        occupied = self.update()
+        if not occupied or occupied in self.solution:
+            return 'solved'
+        if occupied in self.lost:
+            return 'unsolved'
+        if self.isDead(occupied):
+            self.lost.add(occupied)
+            return 'unsolved'
+        if len(self.lost) > self.MAX_LOST:
+            self.lost.clear()
+        if step_time is None:
+            step_time = self.STEP_TIME
+        deadline = time.time() + time_budget
+        # the search starts again with a shuffled order of the moves
+        # after limit positions, and then after twice as many, ...
+        random = Random(occupied)
+        limit = self.RESTART_POSITIONS
+        todo = [(occupied, self.getMoves(occupied))]
+        path = []
+        positions = 0
+        while True:
+            end = min(time.time() + step_time, deadline)
+            state, positions = self._searchStep(todo, path, positions,
+                                                limit, end, random)
+            if state is not None:
+                return state
+            if time.time() >= deadline or positions >= self.MAX_POSITIONS:
+                return 'unknown'
+            if positions >= limit:
+                limit = positions + 2 * limit
+                todo = [(occupied, self.getMoves(occupied, random))]
+                path = []
+            yield None
+
+    def _searchStep(self, todo, path, positions, limit, end, random):
+        # returns (result or None, positions searched)
+        lost, solution = self.lost, self.solution
+        while todo:
+            occupied, moves = todo[-1]
+            if not moves:
+                lost.add(occupied)
+                todo.pop()
+                if path:
+                    path.pop()
+                continue
+            move = moves.pop()
+            new = occupied ^ move
+            if not new or new in solution:
+                path.append(move)
+                for (s, moves), m in zip(todo, path):
+                    solution[s] = m
+                return 'solved', positions
+            if new in lost:
+                continue
+            todo.append((new, self.getMoves(new, random)))
+            path.append(move)
+            positions += 1
+            if positions >= limit:
+                return None, positions
+            if not positions & 63 and time.time() >= end:
+                return None, positions
+        return 'unsolved', positions
@@ -23,7 +23,9 @@
 
 from pysollib.game import Game
 from pysollib.gamedb import GI, GameInfo, registerGame
-from pysollib.hint import DefaultHint
+from pysollib.games.wastesolver import Pyramid_Solver, \
+        RelaxedPyramid_Solver, WasteSolver_HintMethods
+from pysollib.hint import DefaultHint, PositionSolverWrapper
 from pysollib.layout import Layout
 from pysollib.mygettext import _
 from pysollib.pysoltk import MfxCanvasText
@@ -50,7 +52,7 @@ from pysollib.util import ANY_RANK, ANY_SUIT, JACK, KING, NO_RANK, QUEEN, \
 # *
 # ************************************************************************
 
-class Pyramid_Hint(DefaultHint):
+class Pyramid_Hint(WasteSolver_HintMethods, DefaultHint):
     # consider moving card to the Talon as well
     def step010(self, dropstacks, rows):
         rows = rows + (self.game.s.talon,)
@@ -169,10 +171,6 @@ class Pyramid_RowStack(Pyramid_StackMethods, OpenStack):
 
     getBottomImage = Stack._getNoneBottomImage
 
-    def copyModel(self, clone):
-        OpenStack.copyModel(self, clone)
-        clone.blockmap = self.blockmap
-
     def canSelect(self):
         return len(self.cards) > 0 and self.cards[-1].face_up
 
@@ -183,6 +181,8 @@ class Pyramid_RowStack(Pyramid_StackMethods, OpenStack):
 
 class Pyramid(Game):
     Hint_Class = Pyramid_Hint
+    Solver_Class = PositionSolverWrapper()
+    PositionSolver_Class = Pyramid_Solver
     Foundation_Class = Pyramid_Foundation
     Talon_Class = StackWrapper(Pyramid_Talon, max_rounds=3, max_accept=1)
     RowStack_Class = Pyramid_RowStack
@@ -325,6 +325,8 @@ class Pyramid(Game):
 # ************************************************************************
 
 class RelaxedPyramid(Pyramid):
+    PositionSolver_Class = RelaxedPyramid_Solver
+
     # the pyramid must be empty
     def isGameWon(self):
         return getNumberOfFreeStacks(self.s.rows) == len(self.s.rows)
@@ -387,6 +389,8 @@ class PyramidDozen_Foundation(AbstractFoundationStack):
 
 
 class PyramidDozen(Giza):
+    Solver_Class = None
+    PositionSolver_Class = None
     RowStack_Class = PyramidDozen_RowStack
     Reserve_Class = StackWrapper(PyramidDozen_Reserve, max_accept=1)
     Foundation_Class = PyramidDozen_Foundation
@@ -428,6 +432,8 @@ class Thirteen(Pyramid):
 # ************************************************************************
 
 class Thirteens(Pyramid):
+    Solver_Class = None
+    PositionSolver_Class = None
     RowStack_Class = Giza_Reserve
     Foundation_Class = Pyramid_Foundation
     Talon_Class = AutoDealTalonStack
@@ -525,6 +531,8 @@ class Elevens_Reserve(ReserveStack):
 
 
 class Elevens(Pyramid):
+    Solver_Class = None
+    PositionSolver_Class = None
 
     RowStack_Class = Elevens_RowStack
     Reserve_Class = Elevens_Reserve
@@ -1207,6 +1215,8 @@ class TripleAlliance2Decks(TripleAlliance):
 # ************************************************************************
 
 class Pharaohs(Pyramid):
+    Solver_Class = None
+    PositionSolver_Class = None
 
     Talon_Class = InitialDealTalonStack
     RowStack_Class = Pyramid_RowStack
@@ -1278,6 +1288,8 @@ class Baroness_RowStack(Giza_Reserve):
 
 
 class Baroness(Pyramid):
+    Solver_Class = None
+    PositionSolver_Class = None
 
     def createGame(self):
         # create layout
@@ -1347,6 +1359,8 @@ class Apophis_RowStack(Pyramid_RowStack):
 
 class Apophis(Pharaohs):
     Hint_Class = Apophis_Hint
+    Solver_Class = PositionSolverWrapper()
+    PositionSolver_Class = Pyramid_Solver
     RowStack_Class = Apophis_RowStack
     Waste_Class = Pyramid_Waste
     Foundation_Class = Pyramid_Foundation
@@ -1433,6 +1447,8 @@ class ElevenTriangle_Waste(ElevenTriangle_StackMethods, Pyramid_Waste):
 
 
 class ElevenTriangle(Apophis):
+    Solver_Class = None
+    PositionSolver_Class = None
     RowStack_Class = ElevenTriangle_RowStack
     Waste_Class = ElevenTriangle_Waste
     Foundation_Class = PyramidDozen_Foundation
@@ -1477,6 +1493,8 @@ class Cheops_RowStack(Cheops_StackMethods, Pyramid_RowStack):
 
 
 class Cheops(Pyramid):
+    Solver_Class = None
+    PositionSolver_Class = None
 
     Foundation_Class = StackWrapper(AbstractFoundationStack, max_accept=0)
     Talon_Class = StackWrapper(Cheops_Talon, max_rounds=1, max_accept=1)
@@ -1645,6 +1663,8 @@ class TwoPyramids(Pyramid):
 # ************************************************************************
 
 class KingTut(RelaxedPyramid):
+    Solver_Class = None
+    PositionSolver_Class = None
 
     def createGame(self):
         layout, s = Layout(self), self.s
@@ -1812,6 +1832,8 @@ class Hurricane_Reserve(Hurricane_StackMethods, OpenStack):
 
 
 class Hurricane(Pyramid):
+    Solver_Class = None
+    PositionSolver_Class = None
     Hint_Class = Hurricane_Hint
     RowStack_Class = Hurricane_RowStack
     Reserve_Class = Hurricane_Reserve
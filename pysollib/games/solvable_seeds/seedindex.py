@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------
+
+import mmap
+import os
+import struct
+from bisect import bisect_right
+
+
+# ************************************************************************
+# * Solvable seed index
+# *
+# * A set of seeds stored as a bitset file: a header with the first seed,
+# * the number of bits and the number of seeds, followed by the bits
+# * (bit i of byte j is seed base + 8 * j + i). The file is memory-mapped
+# * when first used, so loading it costs next to nothing.
+# *
+# * A SeedIndex behaves like a sorted sequence of its seeds: `seed in
+# * index' tests a single bit, and index[k] (and thus random.choice())
+# * finds the k-th seed via a table of the number of seeds in each block
+# * of BLOCK_SIZE bytes.
+# ************************************************************************
+
+SEED_INDEX_MAGIC = b'PySolSd1'
+_HEADER = struct.Struct('<8sQQQ')
+
+_BIT_COUNT = bytes(bin(i).count('1') for i in range(256))
+
+
+class SeedIndex:
+    BLOCK_SIZE = 64
+
+    def __init__(self, filename):
+        self.filename = filename
+        with open(filename, 'rb') as fh:
+            self._data = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.base, self.nbits, self._count = \
+            _HEADER.unpack_from(self._data)
+        if magic != SEED_INDEX_MAGIC:
+            raise ValueError('%s: not a seed index' % filename)
+        self._offset = _HEADER.size
+        self._blocks = None
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, seed):
+        i = seed - self.base
+        if not 0 <= i < self.nbits:
+            return False
+        return bool(self._data[self._offset + (i >> 3)] & (1 << (i & 7)))
+
+    def __iter__(self):
+        data, offset, base = self._data, self._offset, self.base
+        for j in range((self.nbits + 7) >> 3):
+            byte = data[offset + j]
+            while byte:
+                low = byte & -byte
+                yield base + 8 * j + low.bit_length() - 1
+                byte ^= low
+
+    def _getBlocks(self):
+        # number of seeds before each block
+        if self._blocks is None:
+            blocks, n = [], 0
+            start, end = self._offset, len(self._data)
+            for pos in range(start, end, self.BLOCK_SIZE):
+                blocks.append(n)
+                n += sum(_BIT_COUNT[b]
+                         for b in self._data[pos:pos+self.BLOCK_SIZE])
+            self._blocks = blocks
+        return self._blocks
+
+    def __getitem__(self, k):
+        # the k-th seed
+        if k < 0:
+            k += self._count
+        if not 0 <= k < self._count:
+            raise IndexError('seed index out of range')
+        blocks = self._getBlocks()
+        b = bisect_right(blocks, k) - 1
+        k -= blocks[b]
+        j = b * self.BLOCK_SIZE
+        data, offset = self._data, self._offset
+        while True:
+            byte = data[offset + j]
+            n = _BIT_COUNT[byte]
+            if k < n:
+                break
+            k -= n
+            j += 1
+        for i in range(8):
+            if byte & (1 << i):
+                if k == 0:
+                    return self.base + 8 * j + i
+                k -= 1
+
+    def close(self):
+        self._data.close()
+
+
+def writeSeedIndex(filename, seeds):
+    seeds = sorted(set(seeds))
+    base = seeds[0] if seeds else 0
+    nbits = seeds[-1] - base + 1 if seeds else 0
+    bits = bytearray((nbits + 7) >> 3)
+    for seed in seeds:
+        i = seed - base
+        bits[i >> 3] |= 1 << (i & 7)
+    with open(filename, 'wb') as fh:
+        fh.write(_HEADER.pack(SEED_INDEX_MAGIC, base, nbits, len(seeds)))
+        fh.write(bits)
+
+
+# ************************************************************************
+# * The seed indexes shipped with PySol, e.g. loadSeedIndex('klondike')
+# * for klondike.seeds in this directory. They are loaded on first use
+# * and cached; None is returned if there is no index.
+# ************************************************************************
+
+_seed_indexes = {}
+
+
+def loadSeedIndex(name):
+    if name not in _seed_indexes:
+        filename = os.path.join(os.path.dirname(__file__), name + '.seeds')
+        index = None
+        if os.path.exists(filename):
+            index = SeedIndex(filename)
+        _seed_indexes[name] = index
+    return _seed_indexes[name]
@@ -42,6 +42,8 @@ class Ishido_Hint(AbstractHint):
 
     def computeHints(self):
         game = self.game
+        if not game.s.talon.cards:
+            return
         for r in game.s.rows:
             if (not r.cards and
                     game.isValidPlay(r.id,
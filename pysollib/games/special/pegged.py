@@ -36,6 +36,9 @@ from pysollib.util import ANY_SUIT
 
 class Pegged_Hint(AbstractHint):
     # FIXME: no intelligence whatsoever is implemented here
+    # (the scores are random)
+    CACHE_HINTS = False
+
     def computeHints(self):
         game = self.game
         # get free stacks
@@ -99,10 +102,6 @@ class Pegged_RowStack(ReserveStack):
             return None
         return s
 
-    def copyModel(self, clone):
-        ReserveStack.copyModel(self, clone)
-        clone.pos = self.pos
-
     def highlightMatchingCards(self, event):
         self.game.highlightNotMatching()
 
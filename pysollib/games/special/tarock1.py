@@ -347,7 +347,7 @@ class TrumpsRow_Talon(Montana_Talon):
                     r.cards[-1].rank == RBASE and \
                     r.cards[-1].suit != self.game.TRUMPSUIT:
                 in_sequence, suit = 1, r.cards[-1].suit
-            elif r.id == RSTEP * self.game.TRUMPSUIT and \
+            elif r.cards and r.id == RSTEP * self.game.TRUMPSUIT and \
                     r.cards[-1].rank == RBASE and \
                     r.cards[-1].suit == self.game.TRUMPSUIT:
                 in_sequence, suit = 1, self.game.TRUMPSUIT
@@ -68,7 +68,9 @@ class StHelena_Talon(TalonStack):
         if num_cards == 0:          # game already finished
             return 0
         # redeal
+        self.game.updateSnapshotHash(self)
         self.cards.reverse()
+        self.game.updateSnapshotHash(self)
         self.game.nextRoundMove(self)
         self.game.startDealSample()
         for i in range(lr):
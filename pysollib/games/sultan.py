@@ -22,6 +22,7 @@
 # ---------------------------------------------------------------------------
 
 from pysollib.game import Game
+from pysollib.game.snapshot import SNAPSHOT_HASH_MASK
 from pysollib.gamedb import GI, GameInfo, registerGame
 from pysollib.hint import CautiousDefaultHint
 from pysollib.layout import Layout
@@ -585,6 +586,10 @@ class Matrimony(Game):
         # in an identical snapshot.
         return Game.getSnapshotHash(self) + str(self.s.talon.round)
 
+    def getSnapshot(self):
+        sn = hash((Game.getSnapshot(self), self.s.talon.round))
+        return sn & SNAPSHOT_HASH_MASK
+
 
 # ************************************************************************
 # * Picture Patience
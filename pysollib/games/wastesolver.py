@@ -0,0 +1,746 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------
+
+import time
+from random import Random
+
+from pysollib.hint import hint_level_is_demo_or_above, hint_level_is_stuck
+from pysollib.mfxutil import SubclassResponsibility
+from pysollib.stack import DealRowRedealTalonStack, WasteTalonStack
+from pysollib.util import KING
+
+
+# ************************************************************************
+# * In-process solvers of the games where the open cards are played away
+# * one or two at a time: Golf and Black Hole (a card goes onto the
+# * foundation if its rank is next to the top card) and Pyramid (pairs
+# * of rank thirteen and Kings are removed, a card is open when the
+# * cards covering it are gone).
+# *
+# * The cards only ever leave the layout, so a position is known from
+# * the deal and a few numbers, which are packed into an int (see the
+# * subclasses). The search is depth first; the positions that can't
+# * be won are remembered (self.lost) from one search to the next, and
+# * so are the winning moves of the positions on the way to a win
+# * (self.solution). A new deal (or an undo past the start of the
+# * memo) starts a new memo, see getPosition().
+# *
+# * Like the solvers of hint.py, the solvers know the face-down cards.
+# *
+# * iterSolve() works in steps and yields between them, like
+# * DeadlockCheck.iterCheck(); the result is one of 'solved', 'unsolved'
+# * and 'unknown'.
+# ************************************************************************
+
+class AbstractWasteSolver:
+    MAX_LOST = 2000000          # the memo is cleared then
+    RESTART_POSITIONS = 1000
+    STEP_TIME = 0.01            # seconds
+
+    DEAL = -1                   # the move which deals (or redeals)
+
+    def __init__(self, game):
+        self.game = game
+        self.positions = 0      # searched by the last search
+        self.clear()
+
+    def clear(self):
+        self.lost = set()
+        self.solution = {}      # position -> (move, new position)
+
+    # subclass responsibility
+
+    def getPosition(self):
+        # the current position of the game, or None if it can't be
+        # solved
+        raise SubclassResponsibility
+
+    def getMoves(self, position):
+        # a list of (move, new position), the best move last
+        raise SubclassResponsibility
+
+    def isWon(self, position):
+        raise SubclassResponsibility
+
+    def getMoveStacks(self, move):
+        # (ncards, from_stack, to_stack); ncards is 0 for a deal
+        raise SubclassResponsibility
+
+    #
+
+    def getSolutionMove(self, position):
+        # the move that wins from position, or None if not known
+        entry = self.solution.get(position)
+        return entry and entry[0]
+
+    def getSolution(self, position):
+        # the moves that win from position, or None if not known
+        moves = []
+        while not self.isWon(position):
+            entry = self.solution.get(position)
+            if entry is None:
+                return None
+            moves.append(entry[0])
+            position = entry[1]
+        return moves
+
+    def isLost(self, position):
+        return position in self.lost
+
+    def solve(self, time_budget, position=None):
+        it = self.iterSolve(time_budget, position=position)
+        while True:
+            try:
+                next(it)
+            except StopIteration as e:
+                return e.value
+
+    def iterSolve(self, time_budget, step_time=None, position=None,
+                  max_positions=None):
+        # search from position (the current position of the game by
+        # default); yields None after each step and returns the result.
+        # time_budget may be None (no limit).
+        if position is None:
+            position = self.getPosition()
+            if position is None:
+                return 'unknown'
+        # a new memo may be started while a search runs in a thread
+        lost, solution = self.lost, self.solution
+        if self.isWon(position) or position in solution:
+            return 'solved'
+        if position in lost:
+            return 'unsolved'
+        if len(lost) > self.MAX_LOST:
+            lost.clear()
+        if step_time is None:
+            step_time = self.STEP_TIME
+        deadline = None
+        if time_budget is not None:
+            deadline = time.time() + time_budget
+        # like Mahjongg_Solver, the search starts again with a shuffled
+        # order of the moves after limit positions, then after twice as
+        # many, ...
+        random = None
+        limit = self.RESTART_POSITIONS
+        todo = [(position, self._getMoves(position, random))]
+        path = []
+        self.positions = 0
+        while True:
+            end = time.time() + step_time
+            if deadline is not None:
+                end = min(end, deadline)
+            state = self._searchStep(todo, path, end, max_positions, limit,
+                                     random, lost, solution)
+            if state is not None:
+                return state
+            if deadline is not None and time.time() >= deadline:
+                return 'unknown'
+            if self.positions >= limit:
+                limit = self.positions + 2 * limit
+                if random is None:
+                    random = Random(position)
+                todo = [(position, self._getMoves(position, random))]
+                path = []
+            yield None
+
+    def _getMoves(self, position, random):
+        moves = self.getMoves(position)
+        if random is not None and len(moves) > 1:
+            keys = [(i + 1) * (random.random() + 0.5)
+                    for i in range(len(moves))]
+            moves = [m for k, m in sorted(zip(keys, moves))]
+        return moves
+
+    def _searchStep(self, todo, path, end, max_positions, limit, random,
+                    lost, solution):
+        # returns the result, or None if there is more to do
+        isWon, getMoves = self.isWon, self._getMoves
+        positions = self.positions
+        try:
+            while todo:
+                position, moves = todo[-1]
+                if not moves:
+                    lost.add(position)
+                    todo.pop()
+                    if path:
+                        path.pop()
+                    continue
+                entry = moves.pop()
+                new = entry[1]
+                if new in lost:
+                    continue
+                if isWon(new) or new in solution:
+                    path.append(entry)
+                    for (p, m), e in zip(todo, path):
+                        solution[p] = e
+                    return 'solved'
+                todo.append((new, getMoves(new, random)))
+                path.append(entry)
+                positions += 1
+                if max_positions is not None and positions >= max_positions:
+                    return 'unknown'
+                if positions >= limit:
+                    return None
+                if not positions & 255 and time.time() >= end:
+                    return None
+            return 'unsolved'
+        finally:
+            self.positions = positions
+
+
+# ************************************************************************
+# * Golf_Solver - Golf, Black Hole, All in a Row and Binary Star
+# *
+# * The top card of a row goes onto a foundation (the Waste in Golf) if
+# * the foundation accepts it, and in Golf the Talon deals its cards
+# * onto the Waste. A position is the height of each row, the number of
+# * cards dealt and the top card of each foundation.
+# *
+# *   - the cards of the higher rows are played first, and of those the
+# *     cards which open most cards to follow them; dealing comes last
+# *   - a position is given up when the cards left of some ranks (up to
+# *     HALL_SPAN of them) have fewer cards to go onto than there are of
+# *     them in the rows, see _isDead(). The counts of the ranks are kept
+# *     in the bytes of an int, so this is a few additions per position.
+# *   - as in Mahjongg_Solver, the search restarts with a shuffled order
+# *     of the moves, as a bad early move can cost a lot
+# ************************************************************************
+
+class Golf_Solver(AbstractWasteSolver):
+    HALL_SPAN = 5
+
+    def __init__(self, game):
+        AbstractWasteSolver.__init__(self, game)
+        s = game.s
+        self.rows = s.rows
+        self.foundations = s.foundations
+        self.talon = s.talon
+        # only the rank of the top card of a foundation matters; the
+        # cards (by id) are coded by their rank + 1 (0 is no card), and
+        # the jokers of Thieves are wild
+        cards = game.cards
+        nranks = max(c.rank for c in cards) + 1
+        self.joker_code = nranks + 1
+        self.codes = [self.joker_code if c.suit == 4 else c.rank + 1
+                      for c in cards]
+        # the codes each code accepts, as bits
+        mod = s.foundations[0].cap.mod
+        dead_king = game.getStrictness() == 1
+        all_codes = (1 << (nranks + 2)) - 2
+        self.accepts = [all_codes]
+        for rank in range(nranks):
+            if dead_king and rank == KING:
+                accepts = 0
+            else:
+                accepts = sum(1 << (r + 1) for r in set(((rank + 1) % mod,
+                                                         (rank - 1) % mod))
+                              if r < nranks)
+            self.accepts.append(accepts | 1 << self.joker_code)
+        self.accepts.append(all_codes)
+        # see _isDead(): the codes whose next or previous code is
+        # accepted, and the other pairs of (code, accepted code)
+        self.up_lanes = self.down_lanes = self.guards = 0
+        self.other_accepts = []
+        for code, accepts in enumerate(self.accepts):
+            self.guards |= 128 << 8 * code
+            if not code or code == self.joker_code:
+                # see _isDead()
+                continue
+            for c in range(1, self.joker_code):
+                if not accepts >> c & 1:
+                    continue
+                if code == c - 1:
+                    self.up_lanes |= 255 << 8 * code
+                elif code == c + 1:
+                    self.down_lanes |= 255 << 8 * code
+                else:
+                    self.other_accepts.append((code, c))
+        self.accepted = [[c for c in range(1, len(self.accepts))
+                          if accepts >> c & 1] for accepts in self.accepts]
+        self.wild_lanes = 255 | 255 << 8 * self.joker_code
+        self.deal = None        # the row cards and the talon, see _newDeal
+
+    def _newDeal(self, rows, talon):
+        self.deal = (rows, talon)
+        self.clear()
+        nrows = len(rows)
+        height_bits = max(len(r) for r in rows).bit_length()
+        self.height_shifts = [i * height_bits for i in range(nrows)]
+        self.height_mask = (1 << height_bits) - 1
+        self.talon_shift = nrows * height_bits
+        self.talon_mask = (1 << (len(talon) + 1).bit_length()) - 1
+        top_shift = self.talon_shift + self.talon_mask.bit_length()
+        code_bits = self.joker_code.bit_length()
+        self.top_shifts = [top_shift + i * code_bits
+                           for i in range(len(self.foundations))]
+        self.code_mask = (1 << code_bits) - 1
+        # the number of cards of each code in the rows up to each height,
+        # and in the talon from each card on, in the bytes of an int (see
+        # _isDead())
+        codes = self.codes
+        self.row_counts = []
+        for r in rows:
+            counts = [0]
+            for card in r:
+                counts.append(counts[-1] + (1 << 8 * codes[card]))
+            self.row_counts.append(counts)
+        self.talon_counts = [0]
+        for card in reversed(talon):
+            self.talon_counts.append(self.talon_counts[-1] +
+                                     (1 << 8 * codes[card]))
+        self.talon_counts.reverse()
+
+    def getPosition(self):
+        rows = [tuple(c.id for c in r.cards) for r in self.rows]
+        # in the order of dealing
+        talon = tuple(c.id for c in reversed(self.talon.cards))
+        deal = self.deal
+        if deal is None or \
+                any(r != d[:len(r)] for r, d in zip(rows, deal[0])) or \
+                talon != deal[1][len(deal[1]) - len(talon):]:
+            self._newDeal(rows, talon)
+        position = len(self.deal[1]) - len(talon)
+        position <<= self.talon_shift
+        for shift, r in zip(self.height_shifts, rows):
+            position |= len(r) << shift
+        for shift, f in zip(self.top_shifts, self.foundations):
+            if f.cards:
+                position |= self.codes[f.cards[-1].id] << shift
+        return position
+
+    def isWon(self, position):
+        return not position & ((1 << self.talon_shift) - 1)
+
+    def getMoves(self, position):
+        rows, talon = self.deal
+        codes, accepts, code_mask = self.codes, self.accepts, self.code_mask
+        height_mask = self.height_mask
+        tops = [(shift, (position >> shift) & code_mask)
+                for shift in self.top_shifts]
+        heights = [(position >> shift) & height_mask
+                   for shift in self.height_shifts]
+        dealt = (position >> self.talon_shift) & self.talon_mask
+        if self._isDead(heights, dealt, tops):
+            return []
+        moves = []
+        if dealt < len(talon):
+            # deal onto the Waste (the first foundation); last resort
+            shift, top = tops[0]
+            new = position + (1 << self.talon_shift)
+            new += (codes[talon[dealt]] - top) << shift
+            moves.append((-1, (self.DEAL, new)))
+        # the top cards of the rows, and how many there are of each code
+        row_tops = [height and codes[row[height - 1]]
+                    for row, height in zip(rows, heights)]
+        open_codes = [0] * len(accepts)
+        for code in row_tops:
+            open_codes[code] += 1
+        for i, height in enumerate(heights):
+            if not height:
+                continue
+            shift = self.height_shifts[i]
+            code = row_tops[i]
+            for j, (fshift, top) in enumerate(tops):
+                if accepts[top] >> code & 1:
+                    new = position - (1 << shift)
+                    new += (code - top) << fshift
+                    # the higher rows first, then the cards which can be
+                    # followed by more open cards
+                    following = 0
+                    for c in self.accepted[code]:
+                        following += open_codes[c]
+                    if height > 1 and \
+                            accepts[code] >> codes[rows[i][height - 2]] & 1:
+                        following += 1
+                    moves.append((height * 64 + following,
+                                  (i * len(tops) + j, new)))
+        moves.sort(key=lambda m: m[0])
+        return [m[1] for m in moves]
+
+    def _isDead(self, heights, dealt, tops):
+        # each card of a row goes onto another card: one on a foundation
+        # now, or one still to come from the rows or the talon, and each
+        # card is under one card at most. The position can't be won if
+        # there are more cards of a rank in the rows than cards they can
+        # go onto.
+        rows = 0
+        for counts, height in zip(self.row_counts, heights):
+            rows += counts[height]
+        cards = rows + self.talon_counts[dealt]
+        for shift, top in tops:
+            cards += 1 << 8 * top
+        if cards & self.wild_lanes:
+            # an empty foundation or a joker takes any card
+            return False
+        under = ((cards & self.up_lanes) << 8) + \
+            ((cards & self.down_lanes) >> 8)
+        for a, c in self.other_accepts:
+            under += ((cards >> 8 * a) & 255) << 8 * c
+        # a lane of under - rows is negative if its guard bit is gone
+        guards = self.guards
+        if (under + guards - rows) & guards != guards:
+            return True
+        # the same for the ranks r, r + 2, ..., r + 2k, where the cards
+        # of the ranks in between are counted twice
+        shared = (cards & self.up_lanes & self.down_lanes) >> 8
+        demand, supply = rows, under
+        for k in range(1, self.HALL_SPAN):
+            demand += rows >> 16 * k
+            supply += (under >> 16 * k) - (shared >> 16 * (k - 1))
+            if (supply + guards - demand) & guards != guards:
+                return True
+        return False
+
+    def getMoveStacks(self, move):
+        if move == self.DEAL:
+            return 0, self.talon, self.foundations[0]
+        n = len(self.foundations)
+        return 1, self.rows[move // n], self.foundations[move % n]
+
+
+# ************************************************************************
+# * Pyramid_Solver - Pyramid, Giza, Apophis and the like
+# *
+# * Two open cards whose ranks add up to thirteen are removed together,
+# * and a King alone; a card of the pyramid is open when the cards
+# * covering it (its blockmap) are gone. The cards of the Talon are dealt
+# * onto the piles, which are the Waste or the reserves (the Talon deals
+# * one card to each of them in turn); in Pyramid the top card of the
+# * Talon is open as well.
+# *
+# * The cards of the Talon and the piles are kept in an order (a tuple
+# * of card ids): the card at slot k goes onto pile k % len(piles) when
+# * it is dealt. A position is the cards left in the pyramid, the slots
+# * still holding a card, the number of slots dealt, the round and the
+# * order. A redeal of the Waste keeps the order, but a redeal of the
+# * reserves (Apophis) makes a new one; the orders are numbered as they
+# * are met (self.orders).
+# *
+# * Removing a King, and dealing onto the piles while they are all
+# * empty, can't do any harm; if there is such a move, it is the only
+# * one tried.
+# ************************************************************************
+
+class Pyramid_Solver(AbstractWasteSolver):
+    # the game is won when the pyramid is empty (Relaxed Pyramid)
+    ROWS_ONLY = False
+
+    def __init__(self, game):
+        AbstractWasteSolver.__init__(self, game)
+        s = game.s
+        self.rows = s.rows
+        self.piles = list(s.reserves) or [s.waste]
+        self.talon = s.talon
+        self.foundation = s.foundations[0]
+        index = dict((r, i) for i, r in enumerate(s.rows))
+        self.blockers = [sum(1 << index[b] for b in r.blockmap)
+                         for r in s.rows]
+        # the cards removed before a card of the pyramid can be, and
+        # how many cards it covers; the cards covering most cards are
+        # removed first
+        under = [0] * len(s.rows)
+        for i in range(len(s.rows)):
+            above = self.blockers[i]
+            while above:
+                bit = above & -above
+                above ^= bit
+                under[bit.bit_length() - 1] += 1
+        self.weight = [1 + n for n in under]
+        self.ranks = [c.rank for c in game.cards]
+        # the items of a move are the rows, the piles and the Talon
+        self.talon_item = len(s.rows) + len(self.piles)
+        self.nitems = self.talon_item + 1
+        self.talon_open = s.talon in game.sg.dropstacks
+        if isinstance(s.talon, WasteTalonStack):
+            self.redeal = 'waste'
+        elif isinstance(s.talon, DealRowRedealTalonStack):
+            self.redeal = 'piles'
+        else:
+            self.redeal = None
+        self.max_rounds = s.talon.max_rounds
+        self.deal = None        # the cards of the rows, see _newDeal
+
+    def _newDeal(self, rows):
+        self.deal = rows
+        self.clear()
+        self.orders = []
+        self.order_ids = {}
+        self.order_slots = []   # card -> slot, for each order
+        nstock = len(self.game.cards) - sum(c is not None for c in rows)
+        self.stock_shift = len(rows)
+        # the slots of an order: up to nstock cards, and the empty slots
+        # of a position taken in the middle of a game (see getPosition())
+        self.nslots = nstock * len(self.piles) + 1
+        self.dealt_shift = self.stock_shift + self.nslots
+        self.round_shift = self.dealt_shift + self.nslots.bit_length()
+        self.order_shift = self.round_shift + 8
+        self.dealt_mask = (1 << self.nslots.bit_length()) - 1
+        self.pile_masks = [sum(1 << k for k in range(j, self.nslots,
+                                                     len(self.piles)))
+                           for j in range(len(self.piles))]
+
+    def _getOrderId(self, order):
+        oid = self.order_ids.get(order)
+        if oid is None:
+            oid = self.order_ids[order] = len(self.orders)
+            self.orders.append(order)
+            self.order_slots.append(dict((card, k)
+                                         for k, card in enumerate(order)
+                                         if card is not None))
+        return oid
+
+    def _findSlots(self, oid, piles, talon):
+        # the slots and the number of slots dealt of the cards of the
+        # piles and the Talon in an order, or None if they aren't there
+        slot = self.order_slots[oid]
+        npiles = len(self.piles)
+        slots = 0
+        last = -1
+        for j, pile in enumerate(piles):
+            k = -1
+            for card in pile:
+                if slot.get(card, -1) <= k or slot[card] % npiles != j:
+                    return None
+                k = slot[card]
+                slots |= 1 << k
+            last = max(last, k)
+        k = last
+        for card in talon:
+            if slot.get(card, -1) <= k:
+                return None
+            k = slot[card]
+            slots |= 1 << k
+        if talon:
+            dealt = slot[talon[0]]
+            if npiles > 1 and dealt % npiles:
+                return None
+        else:
+            dealt = len(self.orders[oid])
+        return slots, dealt
+
+    def getPosition(self):
+        rows = tuple(r.cards[0].id if r.cards else None for r in self.rows)
+        deal = self.deal
+        if deal is None or any(r is not None and r != d
+                               for r, d in zip(rows, deal)):
+            self._newDeal(rows)
+        piles = [[c.id for c in p.cards] for p in self.piles]
+        # in the order of dealing
+        talon = [c.id for c in reversed(self.talon.cards)]
+        base = sum(1 << i for i, r in enumerate(rows) if r is not None)
+        base |= self.talon.round << self.round_shift
+        # the cards may fit into more than one order (the orders of the
+        # redeals hold the same cards); the position is then taken in the
+        # order the search has been through
+        position = None
+        for oid in range(len(self.orders)):
+            found = self._findSlots(oid, piles, talon)
+            if found is None:
+                continue
+            slots, dealt = found
+            p = base | slots << self.stock_shift | \
+                dealt << self.dealt_shift | oid << self.order_shift
+            if p in self.solution or p in self.lost:
+                return p
+            if position is None:
+                position = p
+        if position is not None:
+            return position
+        # lay the cards of the piles out as dealt, and the Talon after
+        # them
+        npiles = len(self.piles)
+        height = max(len(p) for p in piles)
+        order = [None] * (height * npiles)
+        for j, pile in enumerate(piles):
+            for t, card in enumerate(pile):
+                order[j + npiles * t] = card
+        oid = self._getOrderId(tuple(order + talon))
+        slots, dealt = self._findSlots(oid, piles, talon)
+        return base | slots << self.stock_shift | \
+            dealt << self.dealt_shift | oid << self.order_shift
+
+    def isWon(self, position):
+        if self.ROWS_ONLY:
+            return not position & ((1 << self.stock_shift) - 1)
+        return not position & ((1 << self.dealt_shift) - 1)
+
+    def getMoves(self, position):
+        rows_mask = position & ((1 << self.stock_shift) - 1)
+        slots = (position >> self.stock_shift) & ((1 << self.nslots) - 1)
+        dealt = (position >> self.dealt_shift) & self.dealt_mask
+        rnd = (position >> self.round_shift) & 255
+        order = self.orders[position >> self.order_shift]
+        ranks, deal = self.ranks, self.deal
+        # the open cards: (item, rank, bits of the position)
+        cards = []
+        m = rows_mask
+        blockers = self.blockers
+        while m:
+            bit = m & -m
+            m ^= bit
+            i = bit.bit_length() - 1
+            if not rows_mask & blockers[i]:
+                cards.append((i, ranks[deal[i]], bit))
+        dealt_slots = slots & ((1 << dealt) - 1)
+        item = len(deal)
+        for pile_mask in self.pile_masks:
+            pile = dealt_slots & pile_mask
+            if pile:
+                k = pile.bit_length() - 1
+                cards.append((item, ranks[order[k]],
+                              1 << (k + self.stock_shift)))
+            item += 1
+        talon = slots >> dealt
+        if talon and self.talon_open:
+            cards.append((item, ranks[order[dealt]],
+                          1 << (dealt + self.stock_shift)))
+        # the Kings
+        for item, rank, bit in cards:
+            if rank == KING:
+                return [(item * self.nitems + item,
+                         self._canonical(position - bit))]
+        deal_move = self._getDeal(position, slots, dealt, rnd, order)
+        if deal_move is not None and not dealt_slots:
+            return [deal_move]
+        moves = []
+        if deal_move is not None:
+            moves.append((0, deal_move))
+        weight, nrows = self.weight, len(deal)
+        for a in range(len(cards)):
+            item_a, rank_a, bit_a = cards[a]
+            for item_b, rank_b, bit_b in cards[a+1:]:
+                if rank_a + rank_b != 11:
+                    continue
+                w = (weight[item_a] if item_a < nrows else 0) + \
+                    (weight[item_b] if item_b < nrows else 0)
+                moves.append((w + 1, (item_a * self.nitems + item_b,
+                                      self._canonical(position - bit_a -
+                                                      bit_b))))
+        moves.sort(key=lambda m: m[0])
+        return [m[1] for m in moves]
+
+    def _canonical(self, position):
+        # the Talon of the Waste may lose its top card: the slots dealt
+        # go up to the next card
+        dealt = (position >> self.dealt_shift) & self.dealt_mask
+        slots = (position >> self.stock_shift) & ((1 << self.nslots) - 1)
+        slots >>= dealt
+        if slots & 1 or len(self.piles) > 1:
+            return position
+        order = self.orders[position >> self.order_shift]
+        if slots:
+            new = dealt + (slots & -slots).bit_length() - 1
+        else:
+            new = len(order)
+        return position + ((new - dealt) << self.dealt_shift)
+
+    def _getDeal(self, position, slots, dealt, rnd, order):
+        # the move which deals or redeals, or None
+        npiles = len(self.piles)
+        if slots >> dealt:
+            new = position + ((min(dealt + npiles, len(order)) - dealt)
+                              << self.dealt_shift)
+            return (self.DEAL, self._canonical(new))
+        if not slots or rnd == self.max_rounds or self.redeal is None:
+            return None
+        if self.redeal == 'waste':
+            # the Waste is turned over onto the Talon
+            new = position - (dealt << self.dealt_shift)
+            new += 1 << self.round_shift
+            return (self.DEAL, self._canonical(new))
+        # the piles are put onto the Talon, the first one last, and
+        # dealt again
+        new_order = []
+        for pile_mask in reversed(self.pile_masks):
+            pile = slots & pile_mask
+            while pile:
+                bit = pile & -pile
+                pile ^= bit
+                new_order.append(order[bit.bit_length() - 1])
+        new_order = tuple(new_order)
+        oid = self._getOrderId(new_order)
+        new = position & ((1 << self.stock_shift) - 1)
+        new |= ((1 << len(new_order)) - 1) << self.stock_shift
+        new |= min(npiles, len(new_order)) << self.dealt_shift
+        new |= (rnd + 1) << self.round_shift
+        new |= oid << self.order_shift
+        return (self.DEAL, new)
+
+    def getMoveStacks(self, move):
+        if move == self.DEAL:
+            return 0, self.talon, None
+        a, b = divmod(move, self.nitems)
+        stacks = list(self.rows) + self.piles + [self.talon]
+        if a == b:
+            return 1, stacks[a], self.foundation
+        return 1, stacks[a], stacks[b]
+
+
+class RelaxedPyramid_Solver(Pyramid_Solver):
+    ROWS_ONLY = True
+
+
+# ************************************************************************
+# * WasteSolver_HintMethods - the hints of the games with a solver above
+# *
+# * Like the other hints these don't look at cards which are face down,
+# * so the solver of the game (Game.getPositionSolver()) is only asked
+# * once all the cards are face up, e.g. in Black Hole, or in Golf when
+# * the Talon is used up. If the position can be won in TIME_BUDGET, the
+# * winning move gets SCORE_WINNING more than the other hints.
+# ************************************************************************
+
+class WasteSolver_HintMethods:
+    TIME_BUDGET = 0.1           # seconds
+    SCORE_WINNING = 100000
+
+    def iterComputeHints(self):
+        for step in super().iterComputeHints():
+            yield step
+        if hint_level_is_stuck(self.level):
+            return
+        game = self.game
+        solver = game.getPositionSolver()
+        if solver is None or any(not c.face_up for s in game.allstacks
+                                 for c in s.cards):
+            return
+        position = solver.getPosition()
+        if position is None:
+            return
+        for step in solver.iterSolve(self.TIME_BUDGET, position=position):
+            yield step
+        move = solver.getSolutionMove(position)
+        if move is not None:
+            self._addWinningHint(*solver.getMoveStacks(move))
+
+    def _addWinningHint(self, ncards, from_stack, to_stack):
+        if ncards == 0:
+            if not hint_level_is_demo_or_above(self.level):
+                return
+            stacks = None
+        else:
+            stacks = set((from_stack, to_stack))
+        for i, h in enumerate(self.hints):
+            if h[2] == ncards and (stacks is None or
+                                   set((h[3], h[4])) == stacks):
+                self.hints[i] = (h[0] + self.SCORE_WINNING,) + h[1:]
+                return
+        # not a move the hints have come up with (e.g. a pair with
+        # the Talon)
+        self.addHint(self.SCORE_WINNING, ncards, from_stack, to_stack)
@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------
+
+# ************************************************************************
+# * The headless toolkit: no windows, no canvas, no images and no events.
+# * Importing this package selects it, unless pysollib.pysoltk was
+# * already imported with another toolkit (see HeadlessApp).
+# ************************************************************************
+
+import sys
+
+import pysollib.settings
+
+if 'pysollib.pysoltk' not in sys.modules:
+    pysollib.settings.TOOLKIT = 'headless'
+    pysollib.settings.USE_TILE = False
@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------
+
+from pysollib.app_statistics import Statistics
+from pysollib.gamedb import GAME_DB
+from pysollib.headless.tkcanvas import MfxCanvas
+from pysollib.headless.tkwrap import MfxRoot
+from pysollib.mfxutil import Struct, destruct
+from pysollib.options import Options
+from pysollib.pysolrandom import PysolRandom
+from pysollib.resource import CardsetConfig
+from pysollib.settings import TOOLKIT
+
+
+# ************************************************************************
+# * HeadlessApp - play games without any GUI toolkit, e.g.
+# *
+# *     from pysollib.headless.app import HeadlessApp
+# *     app = HeadlessApp()
+# *     game = app.runGame(2, random=construct_random('1'))
+# *     game.autoPlay()
+# ************************************************************************
+
+
+class HeadlessImages:
+    def __init__(self):
+        cs = CardsetConfig()
+        cs.CARDW, cs.CARDH = 73, 97
+        cs.CARD_XOFFSET, cs.CARD_YOFFSET = 18, 25
+        cs.SHADOW_XOFFSET, cs.SHADOW_YOFFSET = 7, 7
+        self.cs = cs
+        self.CARDW, self.CARDH = cs.CARDW, cs.CARDH
+        self.CARD_XOFFSET, self.CARD_YOFFSET = \
+            cs.CARD_XOFFSET, cs.CARD_YOFFSET
+        self.SHADOW_XOFFSET, self.SHADOW_YOFFSET = \
+            cs.SHADOW_XOFFSET, cs.SHADOW_YOFFSET
+        self.CARD_DX, self.CARD_DY = cs.CARD_DX, cs.CARD_DY
+        self._xfactor = self._yfactor = 1.0
+        self.reduced = 0
+
+    def getSize(self):
+        return self.CARDW, self.CARDH
+
+    def getOffsets(self):
+        return self.CARD_XOFFSET, self.CARD_YOFFSET
+
+    def getDelta(self):
+        return self.CARD_DX, self.CARD_DY
+
+    def getCenterOffset(self, vw, vh, iw, ih, xf, yf, autoscale):
+        return 0, 0
+
+    def resize(self, xf, yf, resample=1):
+        pass
+
+    def getFace(self, deck, suit, rank):
+        return None
+
+    def getBack(self, update=False):
+        return None
+
+    def getTalonBottom(self):
+        return None
+
+    getReserveBottom = getBlankBottom = getBraidBottom = getTalonBottom
+
+    def getSuitBottom(self, suit=-1):
+        return None
+
+    def getLetter(self, rank):
+        return None
+
+    def getShadow(self, ncards):
+        return None
+
+    def getShade(self):
+        return None
+
+    def getHighlightedCard(self, deck, suit, rank, color=None):
+        return None
+
+    def getHighlightedBack(self):
+        return None
+
+
+class _NullWidget:
+    # menubar, toolbar, statusbar and speech: ignore all calls
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return self._ignore
+
+    def _ignore(self, *args, **kw):
+        return None
+
+
+class HeadlessApp:
+    def __init__(self, french_only=False):
+        if TOOLKIT != 'headless':
+            raise RuntimeError('pysollib.headless must be imported before '
+                               'pysollib.pysoltk')
+        self.gdb = GAME_DB
+        self.opt = Options()
+        # no animations, no sound, no dialogs
+        self.opt.animations = 0
+        self.opt.flip_animation = False
+        self.opt.win_animation = False
+        self.opt.redeal_animation = False
+        self.opt.sound = False
+        self.opt.demo_logo = False
+        self.opt.splashscreen = False
+        self.opt.display_win_message = False
+        self.opt.stuck_notification = False
+        self.opt.confirm = False
+        self.opt.shade_filled_stacks = False
+        self.opt.mahjongg_create_solvable = 0
+        self.opt.shisen_show_hint = False
+        for key in self.opt.timeouts:
+            self.opt.timeouts[key] = 0
+        self.stats = Statistics()
+        self.solver_cache = None
+        self.speech = _NullWidget()
+        self.top = MfxRoot()
+        self.top.connectApp(self)
+        self.top_cursor = None
+        self.canvas = MfxCanvas(self.top)
+        self.menubar = _NullWidget()
+        self.toolbar = _NullWidget()
+        self.statusbar = _NullWidget()
+        self.images = HeadlessImages()
+        self.gimages = Struct(demo=[], pause=[], logos=[], redeal=[])
+        self.intro = Struct(progress=None)
+        self.audio = None
+        self.cardset = None
+        self.game = None
+        self.gamerandom = PysolRandom()
+        self.miscrandom = PysolRandom()
+        self.nextgame = Struct(id=0, random=None, loadedgame=None,
+                               startdemo=0, cardset=None, holdgame=0,
+                               bookmark=None)
+        self.demo_counter = 0
+        self._loadGames(french_only)
+
+    def _loadGames(self, french_only):
+        import pysollib.games  # noqa: F401
+        if not french_only:
+            import pysollib.games.mahjongg  # noqa: F401
+            import pysollib.games.special
+            pysollib.games.special.no_use()
+
+    #
+    # games
+    #
+
+    def constructGame(self, id):
+        gi = self.gdb.get(id)
+        if gi is None:
+            raise Exception("Unknown game (id %d)" % id)
+        return gi.gameclass(gi)
+
+    def runGame(self, id, random=None, autoplay=0):
+        # create and start a new game; returns the game
+        self.freeGame()
+        self.game = self.constructGame(id)
+        self.game.create(self)
+        self.newGame(random=random, autoplay=autoplay)
+        return self.game
+
+    def newGame(self, random=None, autoplay=0):
+        self.game.newGame(random=random, autoplay=autoplay)
+
+    def freeGame(self):
+        if self.game:
+            self.game.destruct()
+            destruct(self.game)
+        self.game = None
+
+    def loadGame(self, filename):
+        # load a saved game; a game must have been started before
+        loaded = self.game._loadGame(filename, self)
+        self.freeGame()
+        self.game = self.constructGame(loaded.id)
+        self.game.create(self)
+        self.game.restoreGame(loaded)
+        destruct(loaded)
+        return self.game
+
+    def saveGame(self, filename, protocol=-1):
+        self.game._saveGame(filename, protocol)
+
+    #
+    # access games database
+    #
+
+    def getGameInfo(self, id):
+        return self.gdb.get(id)
+
+    def getGameClass(self, id):
+        gi = self.gdb.get(id)
+        if gi is None:
+            return None
+        return gi.gameclass
+
+    def getGameTitleName(self, id):
+        gi = self.gdb.get(id)
+        if gi is None:
+            return None
+        return gi.name
+
+    def getGamesForSolver(self):
+        return self.gdb.getGamesForSolver()
+
+    def getSolverCache(self):
+        # there is no config dir; set solver_cache to a SolverCache
+        # (see pysollib/solvercache.py) to cache the solver results
+        return self.solver_cache
+
+    def getRandomGameId(self):
+        return self.miscrandom.choice(self.gdb.getGamesIdSortedById())
+
+    def getFont(self, name):
+        return self.opt.fonts.get(name)
+
+    def wm_save_state(self):
+        pass
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------
+
+from pysollib.acard import AbstractCard
+from pysollib.headless.tkcanvas import MfxCanvasImage
+
+
+# ************************************************************************
+# * A card without any image, only the model is kept up to date.
+# ************************************************************************
+
+class _HeadlessCard(AbstractCard):
+    def __init__(self, id, deck, suit, rank, game, x=0, y=0):
+        AbstractCard.__init__(self, id, deck, suit, rank, game, x=x, y=y)
+        self.item = MfxCanvasImage(game.canvas, self.x, self.y)
+
+    def showFace(self, unhide=1):
+        self.face_up = 1
+
+    def showBack(self, unhide=1):
+        self.face_up = 0
+
+    def updateCardBackground(self, image):
+        pass
+
+    def moveBy(self, dx, dy):
+        self.x = self.x + int(dx)
+        self.y = self.y + int(dy)
+
+
+Card = _HeadlessCard
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------
+
+# ************************************************************************
+# * There is no solver dialog, use the Hint classes directly.
+# ************************************************************************
+
+def create_solver_dialog(parent, game):
+    pass
+
+
+def connect_game_solver_dialog(game):
+    pass
+
+
+def destroy_solver_dialog():
+    pass
+
+
+def reset_solver_dialog():
+    pass
+
+
+def raise_solver_dialog(game):
+    pass
+
+
+def unraise_solver_dialog():
+    pass
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------
+
+import os
+from multiprocessing import Pool
+
+from pysollib.games.solvable_seeds.seedindex import writeSeedIndex
+from pysollib.headless.app import HeadlessApp
+from pysollib.pysolrandom import construct_random
+
+
+# ************************************************************************
+# * Batch solvability scanner
+# *
+# * Deals seeds of the games with a Solver_Class (see
+# * GAME_DB.getGamesForSolver()) and runs their solver (fc-solve or
+# * black-hole-solve) on the initial position, spread over a pool of
+# * processes. The results are appended to a text file as they come
+# * in, one line per deal:
+# *
+# *     <game id> <seed> <state> <iterations> <solution length>
+# *
+# * where state is "solved", "unsolved" or "intractable". An interrupted
+# * scan is resumed by running it again with the same file; the deals
+# * that are already in the file are skipped.
+# ************************************************************************
+
+SCAN_STATES = ('solved', 'unsolved', 'intractable')
+
+
+class _ScanDialog:
+    # stands in for the solver dialog and keeps the solver statistics
+    def __init__(self):
+        self.iter = 0
+        self.states = 0
+
+    def setText(self, **kw):
+        for key in ('iter', 'states'):
+            if isinstance(kw.get(key), int):
+                setattr(self, key, kw[key])
+
+
+def solveDeal(app, game_id, seed, max_iters=100000, preset=None,
+              time_budget=0):
+    # returns (game_id, seed, state, iterations, solution length); with
+    # a time budget (in seconds) max_iters is ignored
+    game = app.runGame(game_id, random=construct_random(str(seed)))
+    dialog = _ScanDialog()
+    solver = game.Solver_Class(game, dialog)
+    solver.config(max_iters=max_iters, preset=preset,
+                  time_budget=time_budget)
+    solver.computeHints()
+    moves = len(solver.hints) - 1
+    state = solver.solver_state
+    if state not in SCAN_STATES:
+        state = 'solved' if moves > 0 else 'unsolved'
+    return (game_id, seed, state, dialog.iter, moves)
+
+
+# the HeadlessApp of a worker process
+_app = None
+
+
+def _initWorker():
+    global _app
+    _app = HeadlessApp()
+
+
+def _scanChunk(args):
+    game_id, seeds, max_iters, preset, time_budget = args
+    return [solveDeal(_app, game_id, seed, max_iters, preset, time_budget)
+            for seed in seeds]
+
+
+#
+# results file
+#
+
+def readScanResults(filename):
+    # yield the results stored in filename; a partly written last line
+    # (of an interrupted scan) is ignored
+    if not os.path.exists(filename):
+        return
+    with open(filename) as fh:
+        for line in fh:
+            fields = line.split()
+            if len(fields) != 5 or fields[2] not in SCAN_STATES:
+                continue
+            try:
+                yield (int(fields[0]), int(fields[1]), fields[2],
+                       int(fields[3]), int(fields[4]))
+            except ValueError:
+                continue
+
+
+def getSolvableSeeds(filename, game_id):
+    return sorted(set(r[1] for r in readScanResults(filename)
+                      if r[0] == game_id and r[2] == 'solved'))
+
+
+def writeSolvableSeedIndex(filename, game_id, index_filename):
+    # returns the number of seeds written
+    seeds = getSolvableSeeds(filename, game_id)
+    writeSeedIndex(index_filename, seeds)
+    return len(seeds)
+
+
+def _writeResult(fh, result):
+    fh.write('%d %d %s %d %d\n' % result)
+
+
+def scanGames(filename, game_ids, seeds, processes=None, chunksize=50,
+              max_iters=100000, preset=None, callback=None, time_budget=0):
+    # scan seeds of all game_ids; returns the number of new results
+    done = set((r[0], r[1]) for r in readScanResults(filename))
+    tasks = []
+    for game_id in game_ids:
+        todo = [seed for seed in seeds if (game_id, seed) not in done]
+        for i in range(0, len(todo), chunksize):
+            tasks.append((game_id, todo[i:i+chunksize], max_iters, preset,
+                          time_budget))
+    if not tasks:
+        return 0
+    count = 0
+    # a partial line left by an interrupted scan must not be continued
+    if os.path.exists(filename) and os.path.getsize(filename) > 0:
+        with open(filename, 'rb') as fh:
+            fh.seek(-1, os.SEEK_END)
+            newline = fh.read(1) != b'\n'
+    else:
+        newline = False
+    with open(filename, 'a') as fh, \
+            Pool(processes, initializer=_initWorker) as pool:
+        if newline:
+            fh.write('\n')
+        for results in pool.imap_unordered(_scanChunk, tasks):
+            for result in results:
+                _writeResult(fh, result)
+                if callback:
+                    callback(result)
+            fh.flush()
+            count += len(results)
+    return count
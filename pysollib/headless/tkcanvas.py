@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------
+
+# ************************************************************************
+# * canvas items
+# *
+# * The items only remember their position, so that code which lays
+# * out the game (and e.g. the findCard() logic) keeps working.
+# ************************************************************************
+
+class _CanvasItem:
+    def __init__(self, canvas, x=0, y=0, group=None, **kwargs):
+        self.canvas = canvas
+        self.init_coord = x, y
+        self.x, self.y = x, y
+        self.text_format = None
+        self.options = kwargs
+
+    def __getitem__(self, key):
+        return self.options.get(key)
+
+    def __setitem__(self, key, value):
+        self.config(**{key: value})
+
+    def config(self, **kwargs):
+        self.options.update(kwargs)
+
+    configure = config
+
+    def cget(self, key):
+        return self.options.get(key)
+
+    def coords(self, *args):
+        return [self.x, self.y]
+
+    def bbox(self):
+        # items have no size
+        return (self.x, self.y), (self.x, self.y)
+
+    def move(self, dx, dy):
+        self.x += dx
+        self.y += dy
+
+    def moveTo(self, x, y):
+        self.x, self.y = x, y
+
+    def addtag(self, tag, option="withtag"):
+        pass
+
+    def dtag(self, tag=None):
+        pass
+
+    def tkraise(self, above=None):
+        pass
+
+    def lower(self, below=None):
+        pass
+
+    def show(self):
+        pass
+
+    def hide(self):
+        pass
+
+    def delete(self):
+        pass
+
+    def bind(self, sequence=None, command=None, add=None):
+        pass
+
+    def unbind(self, sequence, funcid=None):
+        pass
+
+
+class MfxCanvasGroup(_CanvasItem):
+    def __init__(self, canvas, tag=None):
+        _CanvasItem.__init__(self, canvas)
+        self.tag = tag
+
+    def gettags(self):
+        return ()
+
+
+class MfxCanvasImage(_CanvasItem):
+    pass
+
+
+class MfxCanvasLine(_CanvasItem):
+    def __init__(self, canvas, *args, **kwargs):
+        _CanvasItem.__init__(self, canvas, *args[:2], **kwargs)
+
+
+class MfxCanvasRectangle(_CanvasItem):
+    def __init__(self, canvas, *args, **kwargs):
+        _CanvasItem.__init__(self, canvas, *args[:2], **kwargs)
+
+
+class MfxCanvasText(_CanvasItem):
+    def __init__(self, canvas, x, y, preview=-1, **kwargs):
+        _CanvasItem.__init__(self, canvas, x, y, **kwargs)
+
+
+# ************************************************************************
+# * canvas
+# ************************************************************************
+
+class MfxCanvas:
+    def __init__(self, top, width=0, height=0):
+        self.top = top
+        self.preview = 0
+        self.busy = False
+        self.xmargin, self.ymargin = 10, 10
+        self.width, self.height = width, height
+        self._text_color = '#000000'
+
+    def after(self, ms, func, *args):
+        return self.top.after(ms, func, *args)
+
+    def after_cancel(self, timer):
+        self.top.after_cancel(timer)
+
+    def config(self, width=None, height=None, **kwargs):
+        if width is not None:
+            self.width = width
+        if height is not None:
+            self.height = height
+
+    configure = config
+
+    def cget(self, key):
+        return getattr(self, key, None)
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+    def winfo_ismapped(self):
+        return False
+
+    def setInitialSize(self, width, height, margins=True, scrollregion=True):
+        self.width, self.height = width, height
+
+    def xview(self):
+        return 0.0, 1.0
+
+    def yview(self):
+        return 0.0, 1.0
+
+    def coords(self, item):
+        return item.coords()
+
+    def bbox(self, *items):
+        return None
+
+    def tkraise(self, item, above=None):
+        pass
+
+    def findCard(self, stack, event):
+        return -1
+
+    def deleteAllItems(self):
+        pass
+
+    def hideAllItems(self):
+        pass
+
+    def showAllItems(self):
+        pass
+
+    def setTextColor(self, color):
+        pass
+
+    def setTile(self, image, stretch=0, save_aspect=0):
+        return True
+
+    def setTopImage(self, image, cw=0, ch=0):
+        return True
+
+    def update(self):
+        self.top.update()
+
+    def update_idletasks(self):
+        pass
+
+    def focus_set(self):
+        pass
@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------
+
+
+class HTMLViewer:
+    def __init__(self, parent, app=None, home=None):
+        self.parent = parent
+        self.app = app
+        self.home = home
+
+    def display(self, url, add=1, relpath=1, xview=0, yview=0):
+        pass
+
+    def updateHistoryXYView(self):
+        pass
+
+    def destroy(self):
+        pass
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------
+
+# ************************************************************************
+# * window manager and event handling
+# *
+# * There are no windows and no events; timers are run by the
+# * MfxRoot (see tkwrap.py) of the widget they were started on.
+# ************************************************************************
+
+def wm_withdraw(window):
+    pass
+
+
+def wm_deiconify(window):
+    pass
+
+
+def wm_map(window, maximized=0, fullscreen=0):
+    pass
+
+
+def make_help_toplevel(app, title=None):
+    return None
+
+
+def bind(widget, sequence, func, add=None):
+    pass
+
+
+def unbind_destroy(widget):
+    pass
+
+
+def after(widget, ms, func, *args):
+    timer = widget.after(ms, func, *args)
+    return (timer, widget)
+
+
+def after_idle(widget, func, *args):
+    return after(widget, "idle", func, *args)
+
+
+def after_cancel(t):
+    if t is not None:
+        t[1].after_cancel(t[0])
+
+
+# ************************************************************************
+# * image and font utils
+# ************************************************************************
+
+def loadImage(file=None, data=None, dither=None, alpha=None):
+    return None
+
+
+def markImage(image):
+    return None
+
+
+def get_text_width(text, font, root=None):
+    return 0
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------
+
+from pysollib.mfxutil import print_err
+
+
+# ************************************************************************
+# * Dialogs do not wait for any input - they return the default button.
+# ************************************************************************
+
+class MfxDialog:
+    def __init__(self, parent, title="", **kw):
+        self.parent = parent
+        self.title = title
+        self.status = 0
+        self.button = kw.get('default', 0)
+
+
+class MfxMessageDialog(MfxDialog):
+    pass
+
+
+class MfxExceptionDialog(MfxMessageDialog):
+    def __init__(self, parent, ex, title="Error", **kw):
+        MfxMessageDialog.__init__(self, parent, title, **kw)
+        print_err('%s: %s' % (kw.get('text', title), ex))
+
+
+class MfxSimpleEntry(MfxDialog):
+    def __init__(self, parent, title, label, value, **kw):
+        MfxDialog.__init__(self, parent, title, **kw)
+        self.value = value
+
+
+class PysolAboutDialog(MfxMessageDialog):
+    def __init__(self, app, parent, title, **kw):
+        MfxMessageDialog.__init__(self, parent, title, **kw)
+        self.app = app
+
+
+# ************************************************************************
+# * stack descriptions (see Game.showStackDesc)
+# ************************************************************************
+
+class StackDesc:
+    def __init__(self, game, stack):
+        self.game = game
+        self.stack = stack
+
+    def delete(self):
+        pass
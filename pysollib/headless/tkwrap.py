@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------
+
+import itertools
+import time
+
+
+# ************************************************************************
+# * The root "window". It runs the timers started with after() and
+# * after_idle() (see tkutil.py) when update() or mainloop() is called.
+# ************************************************************************
+
+class MfxRoot:
+    def __init__(self, **kw):
+        self.app = None
+        self.wm_state_ = 'normal'
+        self._timers = {}
+        self._timer_ids = itertools.count(1)
+        self._quit = False
+
+    def connectApp(self, app):
+        self.app = app
+
+    #
+    # timers
+    #
+
+    def after(self, ms, func, *args):
+        if ms == 'idle':
+            when = 0
+        else:
+            when = time.time() + ms / 1000.0
+        timer = next(self._timer_ids)
+        self._timers[timer] = (when, func, args)
+        return timer
+
+    def after_cancel(self, timer):
+        self._timers.pop(timer, None)
+
+    def hasPendingTimers(self):
+        return bool(self._timers)
+
+    def update(self):
+        # run all timers which are due, in the order they were started;
+        # timers started meanwhile are run by the next update()
+        now = time.time()
+        for timer in sorted(self._timers):
+            if timer in self._timers and self._timers[timer][0] <= now:
+                when, func, args = self._timers.pop(timer)
+                func(*args)
+
+    def mainloop(self, timeout=None):
+        # run until there are no timers left (or until the timeout)
+        self._quit = False
+        end = None if timeout is None else time.time() + timeout
+        while self._timers and not self._quit:
+            if end is not None and time.time() >= end:
+                break
+            when = min(t[0] for t in self._timers.values())
+            delay = when - time.time()
+            if delay > 0:
+                if end is not None:
+                    delay = min(delay, end - time.time())
+                time.sleep(max(0, delay))
+            self.update()
+
+    def mainquit(self):
+        self._quit = True
+
+    #
+    # window manager
+    #
+
+    def busyUpdate(self):
+        pass
+
+    def update_idletasks(self):
+        pass
+
+    def setCursor(self, cursor):
+        pass
+
+    def sleep(self, seconds):
+        pass
+
+    def interruptSleep(self):
+        pass
+
+    def bind(self, sequence=None, func=None, add=None):
+        pass
+
+    def wm_title(self, title=None):
+        pass
+
+    def wm_iconname(self, name=None):
+        pass
+
+    def wm_geometry(self, geometry=None):
+        pass
+
+    def wm_state(self):
+        return self.wm_state_
+
+    def winfo_ismapped(self):
+        return False
+
+    def winfo_screenwidth(self):
+        return 0
+
+    def winfo_screenheight(self):
+        return 0
+
+    def show_now(self):
+        pass
+
+    def destroy(self):
+        self._timers.clear()
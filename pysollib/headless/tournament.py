@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------
+
+import csv
+import json
+import time
+from multiprocessing import Pool
+
+from pysollib.headless.app import HeadlessApp
+from pysollib.hint import HINT_LEVEL_DEMO
+from pysollib.pysolrandom import construct_random
+
+
+# ************************************************************************
+# * Autopilot tournament
+# *
+# * Plays seeds of games with the fast-forward demo (see
+# * Game.playFastDemoMoves()), spread over a pool of processes, and
+# * sums up per game:
+# *
+# *     games, wins, win rate, average moves, hint time (p50 and p99,
+# *     in milliseconds) and games per second (of one process)
+# *
+# * The results are written as CSV or JSON (by the file extension)
+# * and two result files are compared with compareResults().
+# ************************************************************************
+
+RESULT_FIELDS = ('id', 'name', 'games', 'wins', 'win_rate', 'moves',
+                 'hint_p50', 'hint_p99', 'games_per_sec')
+
+
+def playDemoGame(app, game_id, seed, level=HINT_LEVEL_DEMO):
+    # returns (game_id, seed, won, moves, seconds, hint times)
+    t = time.time()
+    game = app.runGame(game_id, random=construct_random(str(seed)))
+    demo = game.demo = game.createDemo(level=level, fast=True)
+    demo.hint_times = []
+    try:
+        while not game.playFastDemoMoves(demo):
+            if game.isGameWon():
+                break
+        won = bool(game.isGameWon())
+    finally:
+        game.stopDemo()
+    return (game_id, seed, won, game.moves.index, time.time() - t,
+            demo.hint_times)
+
+
+def percentile(values, p):
+    # nearest-rank percentile of a sorted list
+    if not values:
+        return 0.0
+    i = max(0, min(len(values) - 1, int(round(p / 100.0 * len(values))) - 1))
+    return values[i]
+
+
+def summarizeResults(app, results):
+    # sum up the results of playDemoGame() per game; returns a list of
+    # dicts with the RESULT_FIELDS, sorted by game id
+    games = {}
+    for result in results:
+        games.setdefault(result[0], []).append(result)
+    rows = []
+    for game_id in sorted(games):
+        played = games[game_id]
+        n = len(played)
+        wins = sum(1 for r in played if r[2])
+        seconds = sum(r[4] for r in played)
+        hint_times = sorted(t for r in played for t in r[5])
+        gi = app.gdb.get(game_id)
+        rows.append({
+            'id': game_id,
+            'name': gi.name if gi else '',
+            'games': n,
+            'wins': wins,
+            'win_rate': round(float(wins) / n, 4),
+            'moves': round(float(sum(r[3] for r in played)) / n, 1),
+            'hint_p50': round(percentile(hint_times, 50) * 1000, 3),
+            'hint_p99': round(percentile(hint_times, 99) * 1000, 3),
+            'games_per_sec': round(n / seconds, 2) if seconds else 0.0,
+        })
+    return rows
+
+
+# the HeadlessApp of a worker process
+_app = None
+
+
+def _initWorker(demo_lookahead=0):
+    global _app
+    _app = HeadlessApp()
+    _app.opt.demo_lookahead = demo_lookahead
+
+
+def _playChunk(args):
+    game_id, seeds, level = args
+    return [playDemoGame(_app, game_id, seed, level) for seed in seeds]
+
+
+def runTournament(game_ids, seeds, processes=None, chunksize=10,
+                  level=HINT_LEVEL_DEMO, demo_lookahead=0, callback=None):
+    # play all seeds of all game_ids; returns the results of
+    # playDemoGame(), callback is called with each of them
+    tasks = []
+    for game_id in game_ids:
+        for i in range(0, len(seeds), chunksize):
+            tasks.append((game_id, seeds[i:i+chunksize], level))
+    results = []
+    with Pool(processes, initializer=_initWorker,
+              initargs=(demo_lookahead,)) as pool:
+        for chunk in pool.imap_unordered(_playChunk, tasks):
+            for result in chunk:
+                results.append(result)
+                if callback:
+                    callback(result)
+    return results
+
+
+#
+# results files
+#
+
+def writeResults(filename, rows):
+    with open(filename, 'w', newline='') as fh:
+        if filename.endswith('.json'):
+            json.dump(rows, fh, indent=1)
+            fh.write('\n')
+        else:
+            writer = csv.DictWriter(fh, RESULT_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+def readResults(filename):
+    with open(filename, newline='') as fh:
+        if filename.endswith('.json'):
+            rows = json.load(fh)
+        else:
+            rows = list(csv.DictReader(fh))
+    for row in rows:
+        for key in ('id', 'games', 'wins'):
+            row[key] = int(row[key])
+        for key in RESULT_FIELDS[4:]:
+            row[key] = float(row[key])
+    return rows
+
+
+def compareResults(old_rows, new_rows):
+    # returns a list of (id, name, old row, new row) of the games in
+    # both runs, and the total wins of them in the old and the new run
+    old = dict((row['id'], row) for row in old_rows)
+    pairs = [(row['id'], row['name'], old[row['id']], row)
+             for row in new_rows if row['id'] in old]
+    return (pairs, sum(p[2]['wins'] for p in pairs),
+            sum(p[3]['wins'] for p in pairs))
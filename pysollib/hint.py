@@ -22,19 +22,31 @@
 # ---------------------------------------------------------------------------##
 
 
-import os
 import re
-import subprocess
+import shutil
+import threading
 import time
-from io import BytesIO
+import traceback
+from collections import OrderedDict
 
-from pysollib.mfxutil import destruct
+from pysollib.move import AFlipAllMove, AFlipAndMoveMove, AFlipMove
+from pysollib.move import AMoveMove, AShuffleStackMove, ASingleFlipMove
+from pysollib.move import ATurnStackMove
 from pysollib.pysolrandom import construct_random
 from pysollib.settings import DEBUG, FCS_COMMAND
-from pysollib.util import KING
+from pysollib.solvercache import SolverCache
+from pysollib.solverpool import canResumeSolverLibrary, hasSolverLibrary
+from pysollib.solverpool import solver_pool
+from pysollib.util import ANY_RANK, KING, NO_RANK, UNLIMITED_REDEALS
 
 FCS_VERSION = None
 
+# the solver results which are stored in the solver cache
+SOLVER_CACHE_STATES = ('solved', 'unsolved', 'intractable')
+
+# the iteration limit of the first round of a solve with a time budget
+ANYTIME_FIRST_ROUND_ITERS = 1000
+
 # Hint levels form an ordinal capability ladder (except HINT_LEVEL_STUCK):
 #   >= HINT_LEVEL_DEBUG  step020/030 (split-pile setup moves)
 #   >= HINT_LEVEL_DEMO   flip, deal, demo loop guards
@@ -44,6 +56,7 @@ HINT_LEVEL_PLAYER = 0
 HINT_LEVEL_DEBUG = 1
 HINT_LEVEL_DEMO = 2
 HINT_LEVEL_SOLVER = 3
+HINT_LEVEL_LOOKAHEAD = 4
 
 
 def hint_level_is_stuck(level):
@@ -74,7 +87,13 @@ class HintInterface:
     # HINT_LEVEL_DEBUG: show hint and display score value (key `Ctrl-H')
     # HINT_LEVEL_DEMO: demo
     # HINT_LEVEL_SOLVER: solver dialog
+    # HINT_LEVEL_LOOKAHEAD: demo with a search (see LookaheadHint)
     # HINT_LEVEL_STUCK: stuck check only (not used by getHints())
+
+    # the hints of a position are remembered by Game.getHints(); set
+    # this to False if they don't only depend on the position
+    CACHE_HINTS = True
+
     def __init__(self, game, level):
         pass
 
@@ -99,6 +118,135 @@ class HintInterface:
     def getHints(self, taken_hint=None):
         return []
 
+    # The same in steps: yields None after each step of the work and
+    # the hints as the last item. Used by Game.prefetchHintsEvent().
+    def iterHints(self, taken_hint=None):
+        yield self.getHints(taken_hint)
+
+
+# ************************************************************************
+# * An LRU cache of the hints of positions, see Game.getHints().
+# ************************************************************************
+
+class HintCache:
+    def __init__(self, maxlen):
+        self.maxlen = maxlen
+        self._hints = OrderedDict()
+
+    def __len__(self):
+        return len(self._hints)
+
+    def get(self, key):
+        hints = self._hints.get(key)
+        if hints is not None:
+            self._hints.move_to_end(key)
+        return hints
+
+    def put(self, key, hints):
+        self._hints[key] = hints
+        self._hints.move_to_end(key)
+        if len(self._hints) > self.maxlen:
+            self._hints.popitem(last=False)
+
+    def clear(self):
+        self._hints.clear()
+
+
+# ************************************************************************
+# * The stacks that may accept a pile, looked up by the first card of the
+# * pile (see Stack.getAcceptedCardFilter()). acceptsCards() still has
+# * the final word. An index is only valid for the current position.
+# ************************************************************************
+
+class MoveTargetIndex:
+    def __init__(self, stacks):
+        self._by_rank = {}      # rank -> [(pos, stack, test)]
+        self._any_rank = []     # [(pos, stack, test)]
+        self._targets = {}      # id(card) -> result of getTargets()
+        for pos, t in enumerate(stacks):
+            f = t.getAcceptedCardFilter()
+            rank, test = (ANY_RANK, None) if f is None else f
+            if rank == ANY_RANK:
+                self._any_rank.append((pos, t, test))
+            elif rank != NO_RANK:
+                self._by_rank.setdefault(rank, []).append((pos, t, test))
+
+    def getTargets(self, card):
+        # the stacks in their original order
+        targets = self._targets.get(id(card))
+        if targets is None:
+            entries = self._by_rank.get(card.rank, [])
+            if self._any_rank:
+                entries = sorted(entries + self._any_rank,
+                                 key=lambda e: e[0])
+            targets = [t for pos, t, test in entries
+                       if test is None or test(card)]
+            self._targets[id(card)] = targets
+        return targets
+
+
+# ************************************************************************
+# * Light copies of stacks for looking ahead, see AbstractHint.ClonedStack().
+# *
+# * A clone is an instance of a class that is made for each stack class.
+# * It has the methods of the stack class, but only the cards, id, game
+# * and cap in __slots__; other attributes are read from the original
+# * stack. Its __class__ is that of the stack, so isinstance() works as
+# * for the stack. The list of cards is shared with the caller until a
+# * model method changes it. Clones are kept in a pool and used again.
+# ************************************************************************
+
+class _StackClone:
+    __slots__ = ('_stack', '_shared', 'cards', 'id', 'game', 'cap',
+                 'is_filled')
+
+    @property
+    def __class__(self):
+        return self._stack.__class__
+
+    def __getattr__(self, name):
+        if name == '_stack':
+            raise AttributeError(name)
+        return getattr(self._stack, name)
+
+
+def _copyCardsOnWrite(func):
+    def method(self, *args, **kw):
+        if self._shared:
+            self.cards = self.cards[:]
+            self._shared = False
+        return func(self, *args, **kw)
+    return method
+
+
+# the Stack methods that change the list of cards
+_CARDS_CHANGING_METHODS = ('addCard', 'insertCard', 'removeCard',
+                           'addCardModel', 'insertCardModel',
+                           'removeCardModel')
+
+_clone_classes = {}
+
+
+def _getCloneClass(stack_class):
+    clone_class = _clone_classes.get(stack_class)
+    if clone_class is None:
+        ns = {}
+        for c in reversed(stack_class.__mro__[:-1]):
+            for name, value in c.__dict__.items():
+                if not (name.startswith('__') and name.endswith('__')):
+                    ns[name] = value
+        for name in _StackClone.__slots__:
+            ns.pop(name, None)
+        for name in _CARDS_CHANGING_METHODS:
+            if name in ns:
+                ns[name] = _copyCardsOnWrite(ns[name])
+        ns['__slots__'] = ()
+        ns['free_clones'] = []
+        clone_class = type('Cloned' + stack_class.__name__,
+                           (_StackClone, ), ns)
+        _clone_classes[stack_class] = clone_class
+    return clone_class
+
 
 # ************************************************************************
 # * AbstractHint provides a useful framework for derived hint classes.
@@ -125,32 +273,39 @@ class AbstractHint(HintInterface):
     def reset(self):
         self.hints = []
         self.max_score = 0
-        self.__destructClones()
+        self.__releaseClones()
         self.solver_state = 'not_started'
 
     #
     # stack cloning
     #
 
-    # Create a shallow copy of a stack.
-    class AClonedStack:
-        def __init__(self, stack, stackcards):
-            # copy class identity
-            self.__class__ = stack.__class__
-            # copy model data (reference copy)
-            stack.copyModel(self)
-            # set new cards (shallow copy of the card list)
-            self.cards = stackcards[:]
-
+    # Create a shallow copy of a stack with other cards, see _StackClone.
+    # stackcards are not copied; the clone is valid until reset().
     def ClonedStack(self, stack, stackcards):
-        s = self.AClonedStack(stack, stackcards)
+        clone_class = _getCloneClass(stack.__class__)
+        if clone_class.free_clones:
+            s = clone_class.free_clones.pop()
+            if not s._shared:
+                try:
+                    del s.is_filled
+                except AttributeError:
+                    pass
+        else:
+            s = clone_class()
+        s._stack = stack
+        s._shared = True
+        s.cards = stackcards
+        s.id = stack.id
+        s.game = stack.game
+        s.cap = stack.cap
         self.__clones.append(s)
         return s
 
-    def __destructClones(self):
+    def __releaseClones(self):
         for s in self.__clones:
-            s.__class__ = self.AClonedStack     # restore orignal class
-            destruct(s)
+            s._stack = s.cards = s.game = None
+            type(s).free_clones.append(s)
         self.__clones = []
 
     # When computing hints for level 0, the scores are flattened
@@ -199,12 +354,18 @@ class AbstractHint(HintInterface):
     SCORE_DEAL = 0              # 0..100000
 
     def getHints(self, taken_hint=None):
+        for hints in self.iterHints(taken_hint):
+            pass
+        return hints
+
+    def iterHints(self, taken_hint=None):
         # 0) setup
         self.reset()
         game = self.game
         # 1) forced moves of the prev. taken hint have absolute priority
         if taken_hint and taken_hint[6]:
-            return [taken_hint[6]]
+            yield [taken_hint[6]]
+            return
         # 2) try if we can flip a card
         if hint_level_is_demo_or_above(self.level) or \
                 hint_level_is_stuck(self.level):
@@ -212,9 +373,11 @@ class AbstractHint(HintInterface):
                 if r.canFlipCard():
                     self.addHint(self.SCORE_FLIP, 1, r, r)
                     if self.SCORE_FLIP >= 90000:
-                        return self._returnHints()
+                        yield self._returnHints()
+                        return
         # 3) ask subclass to do something useful
-        self.computeHints()
+        for _ in self.iterComputeHints():
+            yield None
         # 4) try if we can deal cards
         if hint_level_is_demo_or_above(self.level):
             if game.canDealCards():
@@ -235,12 +398,17 @@ class AbstractHint(HintInterface):
                 if reserve is not None:
                     self.addHint(self.SCORE_DEAL, 1, game.s.waste, reserve)
 
-        return self._returnHints()
+        yield self._returnHints()
 
     # subclass
     def computeHints(self):
         pass
 
+    # computeHints() in steps, see iterHints()
+    def iterComputeHints(self):
+        self.computeHints()
+        yield
+
     #
     # utility shallMovePile()
     #
@@ -483,6 +651,21 @@ class DefaultHint(AbstractHint):
     # compute hints - main hint intelligence
     #
 
+    def reset(self):
+        AbstractHint.reset(self)
+        # id(stacks) -> (stacks, MoveTargetIndex)
+        self.target_indexes = {}
+
+    def getMoveTargets(self, stacks, pile):
+        # the stacks that may accept pile, see MoveTargetIndex
+        if not pile:
+            return stacks
+        entry = self.target_indexes.get(id(stacks))
+        if entry is None:
+            entry = (stacks, MoveTargetIndex(stacks))
+            self.target_indexes[id(stacks)] = entry
+        return entry[1].getTargets(pile[0])
+
     def shallMovePile(self, from_stack, to_stack, pile, rpile):
         # Klondike-family stuck must ignore reversible shuffles (same idea as
         # CautiousDefaultHint / demo loop avoidance), or dead deals never get
@@ -495,11 +678,32 @@ class DefaultHint(AbstractHint):
 
     def computeHints(self):
         game = self.game
-        stuck = hint_level_is_stuck(self.level)
 
         # 1) check Tableau piles
         self.step010(game.sg.dropstacks, game.s.rows)
 
+        self.step020to050()
+
+    def iterComputeHints(self):
+        # step 1 one stack at a time; step010() stops early at the
+        # debug and demo levels, and subclasses may change the steps
+        cls = type(self)
+        if (self.level >= HINT_LEVEL_DEBUG or
+                cls.computeHints is not DefaultHint.computeHints or
+                cls.step010 is not DefaultHint.step010):
+            yield from AbstractHint.iterComputeHints(self)
+            return
+        game = self.game
+        for r in game.sg.dropstacks:
+            self.step010((r, ), game.s.rows)
+            yield
+        self.step020to050()
+
+    def step020to050(self):
+        # steps 2) to 5) of computeHints()
+        game = self.game
+        stuck = hint_level_is_stuck(self.level)
+
         # 2) try if we can move part of a pile within the RowStacks
         #    so that we can drop a card afterwards
         # Stuck mirrors demo/debug gating (only when nothing found yet).
@@ -548,7 +752,7 @@ class DefaultHint(AbstractHint):
 
     def step010b_getPiles(self, stack):
         # return all moveable piles for this stack, longest one first
-        p = stack.getPile()
+        p = self.game.getTopPile(stack)
         return (p, ) if p else ()
 
     def _shouldSkipWholePileToEmptyRow(self, r, t, lp, lr):
@@ -565,7 +769,7 @@ class DefaultHint(AbstractHint):
         empty_row_seen = 0
         r_is_waste = r in self.game.sg.talonstacks
 
-        for t in rows:
+        for t in self.getMoveTargets(rows, pile):
             score, color = 0, None
             if not self.shallMovePile(r, t, pile, rpile):
                 continue
@@ -621,7 +825,7 @@ class DefaultHint(AbstractHint):
                     # assert r.canMoveCards(sub_pile)
                     if not r.canMoveCards(sub_pile):
                         continue
-                    for t in rows:
+                    for t in self.getMoveTargets(rows, sub_pile):
                         if t is r or not t.acceptsCards(r, sub_pile):
                             continue
                         # print "drop move", r, t, sub_pile
@@ -642,7 +846,7 @@ class DefaultHint(AbstractHint):
             if not card or not s.canMoveCards([card]):
                 continue
             # search a RowStack that would accept the card
-            for t in rows:
+            for t in self.getMoveTargets(rows, [card]):
                 if t is s or not t.acceptsCards(s, [card]):
                     continue
                 tt = self.ClonedStack(t, stackcards=t.cards+[card])
@@ -650,7 +854,7 @@ class DefaultHint(AbstractHint):
                 for r in dropstacks:
                     if r is t:
                         continue
-                    pile = r.getPile()
+                    pile = self.game.getTopPile(r)
                     if not pile:
                         continue
                     if not tt.acceptsCards(r, pile):
@@ -683,7 +887,7 @@ class DefaultHint(AbstractHint):
             # compute remaining pile in r
             rpile = r.cards[:(len(r.cards)-len(pile))]
             rr = self.ClonedStack(r, stackcards=rpile)
-            for t in reservestacks:
+            for t in self.getMoveTargets(reservestacks, pile):
                 if t is r or not t.acceptsCards(r, pile):
                     continue
                 if hint_level_avoids_move_loops(self.level):
@@ -708,7 +912,7 @@ class DefaultHint(AbstractHint):
             if not card or not r.canMoveCards([card]):
                 continue
             pile = [card]
-            for t in rows:
+            for t in self.getMoveTargets(rows, pile):
                 if t is r or not t.acceptsCards(r, pile):
                     continue
                 if hint_level_avoids_move_loops(self.level):
@@ -747,12 +951,7 @@ class KlondikeType_Hint(DefaultHint):
 class YukonType_Hint(CautiousDefaultHint):
     def step010b_getPiles(self, stack):
         # return all moveable piles for this stack, longest one first
-        p = stack.getPile()
-        piles = []
-        while p:
-            piles.append(p)
-            p = p[1:]       # note: we need a fresh shallow copy
-        return piles
+        return self.game.getMovablePiles(stack)
 
 
 class Yukon_Hint(YukonType_Hint):
@@ -769,7 +968,7 @@ class Yukon_Hint(YukonType_Hint):
         # We must take care when moving piles that we won't block cards,
         # i.e. if there is a card in pile which would be needed
         # for a card in stack t.
-        tpile = t.getPile()
+        tpile = self.game.getTopPile(t)
         if tpile:
             for cr in pile:
                 rr = self.ClonedStack(r, stackcards=[cr])
@@ -793,6 +992,526 @@ class SpiderType_Hint(DefaultHint):
     pass
 
 
+# ************************************************************************
+# * The base of the searches which play the moves on the game itself and
+# * take them back. Between enterSearch() and leaveSearch() the game is
+# * in model-only mode (see Game.enterModelOnly()), so that the view is
+# * left alone, and Game.model_search is set, so that the moves are not
+# * finished (Game.finishMove()) and do not trigger autoplay.
+# ************************************************************************
+
+class _DealMove:
+    # a deal of ModelSearch.doMove(); the talons of some games move the
+    # cards without atomic moves, so the layouts before and after the
+    # deal are put back as a whole
+    def __init__(self, before, after):
+        self.before = before
+        self.after = after
+
+    @staticmethod
+    def getLayout(game):
+        return (game.s.talon.round, game.getState(), game.random.getstate(),
+                [(stack.cards[:], [card.face_up for card in stack.cards],
+                  stack.is_filled) for stack in game.allstacks])
+
+    @staticmethod
+    def setLayout(game, layout):
+        game.s.talon.round, state, random_state, stacks = layout
+        game.setState(state)
+        game.random.setstate(random_state)
+        for stack, (cards, face_up, is_filled) in zip(game.allstacks, stacks):
+            stack.cards = cards[:]
+            for card, up in zip(cards, face_up):
+                card.face_up = up
+            stack.is_filled = is_filled
+        game.resetSnapshotHash()
+
+    def undo(self, game):
+        self.setLayout(game, self.before)
+
+    def redo(self, game):
+        self.setLayout(game, self.after)
+
+
+class ModelSearch:
+    def __init__(self, game):
+        self.game = game
+
+    def enterSearch(self):
+        # returns the state to give to leaveSearch()
+        game = self.game
+        old_state = (game.hints.list, game.model_search,
+                     game.enterModelOnly())
+        game.model_search = True
+        return old_state
+
+    def leaveSearch(self, old_state):
+        game = self.game
+        old_hints, game.model_search, old_model_only = old_state
+        game.leaveModelOnly(old_model_only)
+        game.hints.list = old_hints
+
+    def doMove(self, move):
+        # returns the atomic moves
+        ncards, r, t = move
+        game = self.game
+        moves = game.moves
+        old_current, moves.current = moves.current, []
+        before = None
+        try:
+            if ncards == 0:
+                before = _DealMove.getLayout(game)
+                old_state = game.enterState(game.S_DEAL)
+                try:
+                    r.dealCards(sound=False)
+                finally:
+                    game.leaveState(old_state)
+                moves.current = [_DealMove(before, _DealMove.getLayout(game))]
+            elif r is t:
+                r.flipMove()
+            else:
+                r.moveMove(ncards, t, frames=0)
+        except Exception:
+            if before is None:
+                self.undoMove(moves.current)
+            else:
+                _DealMove.setLayout(game, before)
+            raise
+        finally:
+            done, moves.current = moves.current, old_current
+        return done
+
+    def undoMove(self, done):
+        game = self.game
+        old_state, game.moves.state = game.moves.state, game.S_UNDO
+        try:
+            for am in reversed(done):
+                am.undo(game)
+        finally:
+            game.moves.state = old_state
+
+    def redoMove(self, done):
+        game = self.game
+        old_state, game.moves.state = game.moves.state, game.S_REDO
+        try:
+            for am in done:
+                am.redo(game)
+        finally:
+            game.moves.state = old_state
+
+
+# ************************************************************************
+# * LookaheadHint ranks the demo hints of a game by a depth-limited
+# * search over the legal moves (see Game.iterLegalMoves()) that follow
+# * them, instead of by the score of the single move:
+# *
+# *   - the moves are played on the game and undone again (see
+# *     ModelSearch)
+# *   - they are tried in the order of the scores of the game's hint
+# *     class (_getMovePileScore() and friends), and only the best
+# *     MAX_BRANCHES of them
+# *   - positions are valued by evaluate(), less one for each move;
+# *     positions that were already played or are on the current path
+# *     are skipped, so the demo does not loop
+# *   - the values are kept in a transposition table by position
+# *   - the search is deepened one move at a time until the time budget
+# *     is used up; the hints are ranked by the deepest finished search,
+# *     equal values keep the order of the demo hints
+# *
+# * Moves that turn up unknown cards (flips, deals) end a line, so the
+# * search does not cheat. Games with other hint classes than
+# * DefaultHint get the demo hints.
+# ************************************************************************
+
+class _TimeIsUp(Exception):
+    pass
+
+
+class LookaheadHint(ModelSearch, HintInterface):
+    # the values are not only given by the position
+    CACHE_HINTS = False
+
+    TIME_BUDGET = 0.2           # seconds per move
+    MAX_DEPTH = 8
+    MAX_BRANCHES = 8
+
+    # evaluate()
+    VALUE_WON = 10000000
+    VALUE_FOUNDATION_CARD = 150
+    VALUE_EMPTY_ROW = 50
+    VALUE_FACE_DOWN_CARD = -100
+    VALUE_RESERVE_CARD = -50
+    VALUE_TALON_CARD = -10
+
+    # the atomic moves that turn up unknown cards
+    REVEALING_MOVES = (AFlipMove, ASingleFlipMove, AFlipAndMoveMove,
+                       AFlipAllMove, AShuffleStackMove, ATurnStackMove,
+                       _DealMove)
+
+    def __init__(self, game, level, time_budget=None):
+        ModelSearch.__init__(self, game)
+        self.level = level
+        if time_budget is None:
+            time_budget = self.TIME_BUDGET
+        self.time_budget = time_budget
+        self.table = {}         # position -> (depth, value)
+        self.deadline = 0
+        self.hint = None
+
+    def getHints(self, taken_hint=None):
+        game = self.game
+        hints = game.getHints(HINT_LEVEL_DEMO, taken_hint)
+        hint_class = game.getHintClass()
+        if (not hints or len(hints) == 1 or
+                (taken_hint and taken_hint[6]) or
+                not issubclass(hint_class, DefaultHint) or
+                game.model_only or game.moves.current):
+            return hints
+        self.hint = hint_class(game, HINT_LEVEL_DEMO)
+        old_state = self.enterSearch()
+        try:
+            hints = self.search(hints)
+        finally:
+            self.leaveSearch(old_state)
+            self.hint.reset()
+        return hints
+
+    def search(self, hints):
+        # iterative deepening
+        self.deadline = time.time() + self.time_budget
+        path = set([self.getKey()])
+        values = None
+        for depth in range(self.MAX_DEPTH):
+            new_values = []
+            try:
+                for h in hints:
+                    new_values.append(self.searchHint(h, depth, path))
+            except _TimeIsUp:
+                break
+            values = new_values
+            if max(values) >= self.VALUE_WON - self.MAX_DEPTH:
+                break
+        if values is None:
+            return hints
+        ranked = sorted(range(len(hints)), key=lambda i: (-values[i], i))
+        return [(values[i], ) + hints[i][1:] for i in ranked]
+
+    def searchHint(self, h, depth, path):
+        ncards, r, t = h[2:5]
+        done = self.doMove((ncards, r, t))
+        try:
+            if self.revealsCards(done):
+                return self.evaluate() - 1
+            key = self.getKey()
+            path.add(key)
+            try:
+                return self.searchMoves(depth, path) - 1
+            finally:
+                path.discard(key)
+        finally:
+            self.undoMove(done)
+
+    def searchMoves(self, depth, path):
+        # the best value that can be reached in depth moves
+        if time.time() >= self.deadline:
+            raise _TimeIsUp()
+        game = self.game
+        key = self.getKey()
+        entry = self.table.get(key)
+        if entry is not None and entry[0] >= depth:
+            return entry[1]
+        best = self.evaluate()
+        if depth > 0 and best < self.VALUE_WON:
+            for score, move in self.getMoves():
+                done = self.doMove(move)
+                try:
+                    k = self.getKey()
+                    if k in path or k in game.snapshots:
+                        continue
+                    if self.revealsCards(done):
+                        value = self.evaluate()
+                    else:
+                        path.add(k)
+                        value = self.searchMoves(depth - 1, path)
+                        path.discard(k)
+                finally:
+                    self.undoMove(done)
+                # prefer the shorter way
+                best = max(best, value - 1)
+        self.table[key] = (depth, best)
+        return best
+
+    def getKey(self):
+        game = self.game
+        return (game.getSnapshot(), game.s.talon.round)
+
+    def evaluate(self):
+        game = self.game
+        if game.isGameWon():
+            return self.VALUE_WON
+        value = 0
+        for s in game.s.foundations:
+            value += self.VALUE_FOUNDATION_CARD * len(s.cards)
+        for s in game.s.rows:
+            if not s.cards:
+                value += self.VALUE_EMPTY_ROW
+            for c in s.cards:
+                if not c.face_up:
+                    value += self.VALUE_FACE_DOWN_CARD
+        for s in game.s.reserves:
+            value += self.VALUE_RESERVE_CARD * len(s.cards)
+        for s in game.sg.talonstacks:
+            value += self.VALUE_TALON_CARD * len(s.cards)
+        return value
+
+    def getMoves(self):
+        # [(score, (ncards, from_stack, to_stack))], best first
+        game, hint = self.game, self.hint
+        foundations = game.s.foundations
+        rows = game.s.rows
+        moves = []
+        for move in game.iterLegalMoves():
+            ncards, r, t = move
+            if ncards == 0:
+                score = hint.SCORE_DEAL
+            elif r is t:
+                score = hint.SCORE_FLIP
+            elif t in foundations:
+                score = hint._getDropCardScore(0, None, r, t, ncards)[0]
+            else:
+                pile = r.cards[-ncards:]
+                rpile = r.cards[:-ncards]
+                if (not t.cards and r in rows and t in rows and
+                        hint._shouldSkipWholePileToEmptyRow(
+                            r, t, ncards, len(r.cards))):
+                    continue
+                if not hint.shallMovePile(r, t, pile, rpile):
+                    continue
+                if r in game.sg.talonstacks:
+                    score = hint._getMoveWasteScore(
+                        0, None, r, t, pile, rpile)[0]
+                else:
+                    score = hint._getMovePileScore(
+                        0, None, r, t, pile, rpile)[0]
+            moves.append((score, -len(moves), move))
+        hint.reset()
+        moves.sort(reverse=True)
+        return [(m[0], m[2]) for m in moves[:self.MAX_BRANCHES]]
+
+    def revealsCards(self, done):
+        talon = self.game.s.talon
+        for am in done:
+            if isinstance(am, self.REVEALING_MOVES):
+                return True
+            if isinstance(am, AMoveMove) and am.from_stack_id == talon.id:
+                return True
+        return False
+
+
+# ************************************************************************
+# * DeadlockCheck finds out if a position can still be won, once the
+# * stuck check (HINT_LEVEL_STUCK) has found that there are moves. It
+# * asks the solver of the game if it has one (in the game itself, see
+# * Game.getPositionSolver(), or Solver_Class), or else tries all the
+# * moves that can be made (see Game.iterLegalMoves()). Unlike the hints
+# * it knows the cards that are still face down, so the result is:
+# *
+# *   - STUCK_WINNABLE: there is a way to win the game
+# *   - STUCK_LOST: there is none
+# *   - STUCK_UNKNOWN: the time budget or MAX_POSITIONS was used up
+# *
+# * The work is done in steps (see iterCheck()), which Game runs while
+# * it is idle; between the steps the game is back in the position that
+# * is checked.
+# ************************************************************************
+
+# the states of Game.updateStuck()
+STUCK_NO_MOVES = 'no moves'
+STUCK_LOST = 'lost'
+STUCK_UNKNOWN = 'unknown'
+STUCK_WINNABLE = 'winnable'
+
+# yielded by DeadlockCheck.iterCheck() while the solver runs
+STUCK_WAIT = 'wait'
+
+
+class _QuietSolverDialog:
+    # the progress of the solver is not shown
+    def setText(self, **kw):
+        pass
+
+
+class DeadlockCheck(ModelSearch):
+    MAX_POSITIONS = 100000
+    STEP_TIME = 0.01            # seconds
+    SOLVER_GRACE = 1.0          # seconds, see iterSolver()
+
+    SOLVER_STATES = {'solved': STUCK_WINNABLE, 'unsolved': STUCK_LOST}
+
+    # set when the solver can't be run (not in the PATH)
+    solver_failed = False
+
+    def __init__(self, game, time_budget):
+        ModelSearch.__init__(self, game)
+        self.time_budget = time_budget      # seconds
+        self.visited = set()
+        self.path = []          # the atomic moves of the moves made
+        self.todo = []          # the moves still to try, per position
+        self.applied = 0        # the moves of path that are on the game
+
+    @classmethod
+    def canCheck(cls, game):
+        # the legal moves are those of the stacks, like the moves of
+        # DefaultHint
+        hint_class = game.getHintClass()
+        return (game.getPositionSolver() is not None or
+                (game.Solver_Class is not None and
+                 not DeadlockCheck.solver_failed) or
+                (hint_class is not None and
+                 issubclass(hint_class, DefaultHint)))
+
+    def iterCheck(self):
+        # yields None after each step, STUCK_WAIT while the solver runs,
+        # and the result as the last item
+        game = self.game
+        solver = game.getPositionSolver()
+        if solver is not None:
+            state = yield from solver.iterSolve(self.time_budget,
+                                                self.STEP_TIME)
+            yield self.SOLVER_STATES.get(state, STUCK_UNKNOWN)
+            return
+        if game.Solver_Class is not None and not DeadlockCheck.solver_failed:
+            state = yield from self.iterSolver()
+            if state is not None:
+                yield state
+                return
+        hint_class = game.getHintClass()
+        if hint_class is None or not issubclass(hint_class, DefaultHint):
+            yield STUCK_UNKNOWN
+            return
+        yield from self.iterSearch()
+
+    def iterSolver(self):
+        # the solver runs in a thread; returns None if it failed
+        game = self.game
+        solver = game.Solver_Class(game, _QuietSolverDialog())
+        solver.config(time_budget=self.time_budget)
+        result = []
+
+        def run(board):
+            try:
+                solver.solveBoard(board)
+                result.append(solver.solver_state)
+            except RuntimeError:
+                DeadlockCheck.solver_failed = True
+            except Exception:
+                if DEBUG:
+                    traceback.print_exc()
+
+        try:
+            board = solver.calcBoardString()
+        except Exception:
+            return None
+        thread = threading.Thread(target=run, args=(board, ))
+        thread.daemon = True
+        thread.start()
+        deadline = time.time() + self.time_budget + self.SOLVER_GRACE
+        try:
+            while thread.is_alive():
+                if time.time() > deadline:
+                    return STUCK_UNKNOWN
+                yield STUCK_WAIT
+        finally:
+            if thread.is_alive():
+                solver.cancel()
+        if not result:
+            return None
+        return self.SOLVER_STATES.get(result[0], STUCK_UNKNOWN)
+
+    def iterSearch(self):
+        # a depth-first search through all the positions that can be
+        # reached; each step starts by replaying the path to the
+        # position where the last one stopped
+        self.visited.add(self.getKey())
+        self.todo.append(self.getMoves())
+        spent = 0
+        while True:
+            start = time.time()
+            old_state = self.enterSearch()
+            try:
+                for done in self.path:
+                    self.redoMove(done)
+                    self.applied += 1
+                # the replay should not take most of the time
+                now = time.time()
+                step = max(self.STEP_TIME, 2 * (now - start))
+                state = self.searchStep(now + step)
+            finally:
+                while self.applied:
+                    self.applied -= 1
+                    self.undoMove(self.path[self.applied])
+                self.leaveSearch(old_state)
+            spent += time.time() - start
+            if state is None and spent >= self.time_budget:
+                state = STUCK_UNKNOWN
+            if state is not None:
+                yield state
+                return
+            yield None
+
+    def searchStep(self, end):
+        # returns the result, or None if there is more to do
+        game = self.game
+        path, todo = self.path, self.todo
+        while todo:
+            moves = todo[-1]
+            if not moves:
+                todo.pop()
+                if path:
+                    self.applied -= 1
+                    self.undoMove(path.pop())
+                continue
+            done = self.doMove(moves.pop())
+            path.append(done)
+            self.applied += 1
+            if game.isGameWon():
+                return STUCK_WINNABLE
+            key = self.getKey()
+            if key in self.visited:
+                path.pop()
+                self.applied -= 1
+                self.undoMove(done)
+                continue
+            self.visited.add(key)
+            todo.append(self.getMoves())
+            if len(self.visited) >= self.MAX_POSITIONS:
+                return STUCK_UNKNOWN
+            if time.time() >= end:
+                return None
+        return STUCK_LOST
+
+    def getMoves(self):
+        # the moves to the foundations are tried first (they are taken
+        # from the end)
+        game = self.game
+        foundations = game.s.foundations
+        moves = list(game.iterLegalMoves())
+        moves.sort(key=lambda move: move[2] in foundations)
+        return moves
+
+    def getKey(self):
+        game = self.game
+        talon = game.s.talon
+        # with unlimited redeals the rounds are all alike
+        if talon.max_rounds == UNLIMITED_REDEALS:
+            round = 0
+        else:
+            round = talon.round
+        state = game.getState()
+        return (game.getSnapshot(), round, len(game.saveinfo.stack_caps),
+                repr(state) if state else None)
+
+
 class PySolHintLayoutImportError(Exception):
 
     def __init__(self, msg, cards, line_num):
@@ -815,9 +1534,17 @@ class Base_Solver_Hint:
             'max_iters': 10000,
             'progress': False,
             'preset': None,
+            # seconds; if set max_iters is ignored (see solveBoard())
+            'time_budget': 0,
             }
         self.hints = []
         self.hints_index = 0
+        self.solver_state = 'unknown'
+        # see cancel()
+        self.cancelled = False
+        self._worker = None
+        # set when a solve with a time budget runs out of time
+        self._out_of_time = False
 
         # correct cards rank if foundations.base_rank != 0 (Penguin, Opus)
         if 'base_rank' in game_type:    # (Simple Simon)
@@ -879,30 +1606,185 @@ class Base_Solver_Hint:
         hint = (999999, 0, ncards, src, dest, None, thint)
         return [hint]
 
-    def colonPrefixMatch(self, prefix, s):
-        m = re.match(prefix + ': ([0-9]+)', s)
-        if m:
-            self._v = int(m.group(1))
-            return True
-        self._v = None
+    def computeHints(self):
+        self.solveBoard(self.calcBoardString())
+
+    def solveBoard(self, board):
+        # solve the position described by board (see calcBoardString());
+        # this only uses the stacks of the game, not their cards, so that
+        # it can run in a thread (see the solver dialog)
+        #
+        # with a time budget the solver is run until it finds a result or
+        # the time is up, however many iterations that takes
+        cache = self.game.app.getSolverCache()
+        if cache is None:
+            self._solveBoard(board)
+            return
+        key = self.getCacheKey(board)
+        if self.loadCachedResult(cache.get(key)):
+            return
+        self._solveBoard(board)
+        if not self.cancelled and self.solver_state in SOLVER_CACHE_STATES:
+            cache.put(key, self.getCachedResult())
+
+    def _solveBoard(self, board):
+        if self.options['time_budget'] > 0 and not self.isResumable():
+            self.computeSolutionInRounds(board)
+        else:
+            self.computeSolution(board)
+
+    def computeSolution(self, board):
+        # run the solver on board and set hints and solver_state
+        pass
+
+    def isResumable(self):
+        # True if computeSolution() keeps to options['time_budget'] by
+        # itself, by resuming the solver with higher iteration limits
         return False
 
-    def run_solver(self, command, board):
+    def _getLimits(self):
+        # (max_iters, time_budget) for a resumable solver
+        budget = self.options['time_budget'] if self.isResumable() else 0
+        if budget > 0:
+            return ANYTIME_FIRST_ROUND_ITERS, budget
+        return self.options['max_iters'], 0
+
+    def _timeIsUp(self):
+        self._out_of_time = True
+        worker = self._worker
+        if worker is not None:
+            worker.kill()
+
+    def computeSolutionInRounds(self, board):
+        # anytime solving for solvers which can't be resumed: the solver
+        # is run again with growing iteration limits until it gives a
+        # definite answer or the time budget is used up. A round which is
+        # still running at the deadline is killed and the result of the
+        # last complete round is kept.
+        budget = self.options['time_budget']
+        deadline = time.time() + budget
+        iters = ANYTIME_FIRST_ROUND_ITERS
+        result = None
+        timer = threading.Timer(budget, self._timeIsUp)
+        timer.daemon = True
+        timer.start()
+        try:
+            while True:
+                self.options['max_iters'] = iters
+                start = time.time()
+                self.computeSolution(board)
+                if self._out_of_time or self.cancelled:
+                    break
+                result = (self.solver_state, self.hints, iters)
+                now = time.time()
+                if self.solver_state != 'intractable' or now >= deadline:
+                    break
+                # the next round has to be done before the deadline
+                rate = iters / max(now - start, 0.001)
+                possible = int(rate * (deadline - now))
+                if possible <= iters:
+                    break
+                iters = min(4 * iters, possible)
+        finally:
+            timer.cancel()
+        if result is None:
+            result = ('intractable', [None], 0)
+        self.solver_state, self.hints, self.options['max_iters'] = result
+        self.hints_index = 0
+
+    #
+    # solver result cache (see pysollib/solvercache.py)
+    #
+
+    def getCacheKey(self, board):
+        game = self.game
+        return SolverCache.makeKey(
+            self.__class__.__name__, sorted(self.game_type.items()),
+            self.options['preset'], game.gameinfo.decks,
+            len(game.s.rows), len(game.s.reserves), board)
+
+    def _stackRef(self, stack):
+        if stack is None:
+            return None
+        if stack is self.game.s.talon:
+            return ['talon', 0]
+        for name in ('rows', 'reserves', 'foundations'):
+            stacks = getattr(self.game.s, name)
+            if stack in stacks:
+                return [name, stacks.index(stack)]
+        raise ValueError('%r' % (stack,))
+
+    def _refStack(self, ref):
+        if ref is None:
+            return None
+        if ref[0] == 'talon':
+            return self.game.s.talon
+        return getattr(self.game.s, ref[0])[ref[1]]
+
+    def getCachedResult(self):
+        return {
+            'state': self.solver_state,
+            'max_iters': self.options['max_iters'],
+            'moves': [[h[0], self._stackRef(h[1]), self._stackRef(h[2])]
+                      for h in self.hints if h is not None],
+            }
+
+    def loadCachedResult(self, data):
+        # returns False if data can't be used
+        if not data or data.get('state') not in SOLVER_CACHE_STATES:
+            return False
+        if data['state'] == 'intractable' and (
+                self.options['time_budget'] > 0 or
+                data['max_iters'] < self.options['max_iters']):
+            # try harder this time
+            return False
+        try:
+            hints = [[ncards, self._refStack(src), self._refStack(dest)]
+                     for ncards, src, dest in data['moves']]
+        except (LookupError, TypeError, ValueError, AttributeError):
+            return False
+        self.hints = hints + [None]
+        self.hints_index = 0
+        self.solver_state = data['state']
+        return True
+
+    def cancel(self):
+        # stop a solveBoard() running in another thread
+        self.cancelled = True
+        worker = self._worker
+        if worker is not None:
+            worker.kill()
+
+    def callSolver(self, request, output=None):
+        # run a request on a worker of the solver pool (see
+        # pysollib/solverpool.py); returns None if cancelled
+        if self.cancelled or self._out_of_time:
+            return None
+        worker = self._worker = solver_pool.acquire()
+        try:
+            if self.cancelled or self._out_of_time:
+                return None
+            reply = worker.call(request, output)
+        finally:
+            self._worker = None
+            solver_pool.release(worker)
+        if self.cancelled or self._out_of_time:
+            return None
+        return reply
+
+    def run_solver(self, argv, board, parser):
+        # the output of the solver is fed to parser while it runs
         if DEBUG:
-            print(command)
-        kw = {'shell': True,
-              'stdin': subprocess.PIPE,
-              'stdout': subprocess.PIPE,
-              'stderr': subprocess.PIPE}
-        if os.name != 'nt':
-            kw['close_fds'] = True
-        p = subprocess.Popen(command, **kw)
-        bytes_board = bytes(board, 'utf-8')
-        pout, perr = p.communicate(bytes_board)
-        if p.returncode in (127, 1):
+            print(' '.join(argv))
+        reply = self.callSolver(('run', argv, bytes(board, 'utf-8')),
+                                parser.feed)
+        if reply is None:
+            return
+        perr, returncode = reply
+        if returncode in (127, 1):
             # Linux and Windows return codes for "command not found" error
-            raise RuntimeError('Solver exited with {}'.format(p.returncode))
-        return BytesIO(pout), BytesIO(perr)
+            raise RuntimeError('Solver exited with {}'.format(returncode))
+        parser.close()
 
     def importFile(solver, fh, s_game, self):
         s_game.endGame()
@@ -917,34 +1799,206 @@ class Base_Solver_Hint:
         pass
 
 
-use_fc_solve_lib = False
+# ************************************************************************
+# * Parsers of the output of the solver executables. The output is fed
+# * to them in chunks while the solver runs, so the progress counters
+# * are seen as soon as the solver prints them. The moves are only
+# * printed once the search is over, and become the hints when the
+# * solver has finished (a part of a solution is no use as hints).
+# ************************************************************************
 
-try:
-    import freecell_solver
-    fc_solve_lib_obj = freecell_solver.FreecellSolver()
-    use_fc_solve_lib = True
-except BaseException:
-    pass
+class SolverOutputParser:
+    def __init__(self):
+        # set by parseLine() to ignore the rest of the output
+        self.done = False
+        self._tail = b''
+
+    def feed(self, data):
+        lines = (self._tail + data).split(b'\n')
+        self._tail = lines.pop()
+        for line in lines:
+            if self.done:
+                break
+            line = str(line, encoding='utf-8').rstrip('\r')
+            if DEBUG >= 5:
+                print(line)
+            self.parseLine(line)
 
-use_bh_solve_lib = False
+    def close(self):
+        if self._tail:
+            self.feed(b'\n')
+        self.finish()
 
-try:
-    import black_hole_solver
-    bh_solve_lib_obj = black_hole_solver.BlackHoleSolver()
-    use_bh_solve_lib = True
-except BaseException:
-    pass
+    def parseLine(self, line):
+        pass
+
+    def finish(self):
+        pass
+
+
+_SOLVER_ITERS_RE = re.compile(r'Total number of states checked is ([0-9]+)\.')
+_SOLVER_STATES_RE = re.compile(r'This scan generated ([0-9]+) states\.')
+
+_FCS_VERSION_RE = re.compile(r'version ([0-9]+)\.([0-9]+)\.([0-9]+)')
+_FCS_PROGRESS_RE = re.compile(r'(Iteration|Depth|Stored-States): ([0-9]+)')
+_FCS_STATE_RE = re.compile(
+    r'(Iterations count exceeded)|(I could not solve this game)')
+_FCS_MOVE_RE = re.compile(r'Move (.*)')
+_FCS_SEQUENCE_MOVE_RE = re.compile(
+    r'the sequence on top of Stack ([0-9]+) to the foundations')
+_FCS_CARDS_MOVE_RE = re.compile(
+    r'(?P<ncards>a card|(?P<count>[0-9]+) cards) '
+    r'from (?P<source_type>stack|freecell) '
+    r'(?P<source_idx>[0-9]+) to '
+    r'(?P<dest>the foundations|'
+    r'(?P<dest_type>freecell|stack) '
+    r'(?P<dest_idx>[0-9]+))\s*')
+
+_BHS_RESULT_RE = re.compile(r'(Intractable|Unsolved|Solved)!')
+_BHS_MOVE_RE = re.compile(
+    r'Move a card from stack ([0-9]+) to the foundations')
+
+
+class FreeCellSolverVersionParser(SolverOutputParser):
+    version = (0, 0, 0)
+
+    def parseLine(self, line):
+        m = _FCS_VERSION_RE.search(line)
+        if m:
+            self.version = tuple(int(v) for v in m.groups())
+            self.done = True
+
+
+class FreeCellSolverOutputParser(SolverOutputParser):
+    # progress_step is the --iter-output-step of the solver or None
+    def __init__(self, solver, progress_step=None):
+        SolverOutputParser.__init__(self)
+        self.solver = solver
+        self.progress_step = progress_step
+        game = solver.game
+        self.stack_types = {
+            'the': game.s.foundations,
+            'stack': game.s.rows,
+            'freecell': game.s.reserves,
+            }
+        self.hints = []
+        self.iter = self.depth = self.states = 0
+        self.in_progress = False
+
+    def _showProgress(self):
+        self.solver._setText(iter=self.iter, depth=self.depth,
+                             states=self.states)
+
+    def _endProgress(self):
+        # the end of the --iter-output lines
+        if self.in_progress:
+            self.in_progress = False
+            self._showProgress()
+
+    def parseLine(self, line):
+        m = _FCS_PROGRESS_RE.match(line)
+        if m:
+            self.in_progress = True
+            key, value = m.group(1), int(m.group(2))
+            if key == 'Iteration':
+                self.iter = value
+            elif key == 'Depth':
+                self.depth = value
+            else:
+                self.states = value
+                if self.iter % 100 == 0 or self.progress_step:
+                    self._showProgress()
+            return
+        if line.startswith('-=-='):
+            self._endProgress()
+            return
+        if self.solver._determineIfSolverState(line):
+            self._endProgress()
+            self.done = True
+            return
+        m = _SOLVER_ITERS_RE.match(line)
+        if m:
+            self.solver._setText(iter=int(m.group(1)))
+            return
+        m = _SOLVER_STATES_RE.match(line)
+        if m:
+            self.solver._setText(states=int(m.group(1)))
+            return
+        m = _FCS_MOVE_RE.match(line)
+        if m:
+            self._parseMove(m.group(1))
+
+    def _parseMove(self, move_s):
+        stack_types = self.stack_types
+        m = _FCS_SEQUENCE_MOVE_RE.match(move_s)
+        if m:
+            ncards = 13
+            src = stack_types['stack'][int(m.group(1))]
+            dest = None
+        else:
+            m = _FCS_CARDS_MOVE_RE.match(move_s)
+            if not m:
+                return
+            if m.group('ncards') == 'a card':
+                ncards = 1
+            else:
+                ncards = int(m.group('count'))
+            st = stack_types[m.group('source_type')]
+            src = st[int(m.group('source_idx'))]
+            if m.group('dest') == 'the foundations':
+                dest = None
+            else:
+                dt = stack_types[m.group('dest_type')]
+                dest = dt[int(m.group('dest_idx'))]
+        self.hints.append([ncards, src, dest])
+
+    def finish(self):
+        self._endProgress()
+
+
+class BlackHoleSolverOutputParser(SolverOutputParser):
+    def __init__(self, solver):
+        SolverOutputParser.__init__(self)
+        self.solver = solver
+        self.result = ''
+        self.hints = []
+
+    def parseLine(self, line):
+        game = self.solver.game
+        if not self.result:
+            m = _BHS_RESULT_RE.match(line)
+            if m:
+                self.result = m.group(1)
+            return
+        if line.strip() == 'Deal talon':
+            self.hints.append([1, game.s.talon, None])
+            return
+        m = _SOLVER_ITERS_RE.match(line)
+        if m:
+            self.solver._setText(iter=int(m.group(1)))
+            return
+        m = _SOLVER_STATES_RE.match(line)
+        if m:
+            self.solver._setText(states=int(m.group(1)))
+            return
+        m = _BHS_MOVE_RE.match(line)
+        if m:
+            self.hints.append([1, game.s.rows[int(m.group(1))], None])
+
+
+use_fc_solve_lib = hasSolverLibrary('fcs')
+use_bh_solve_lib = hasSolverLibrary('bhs')
+resume_fc_solve_lib = canResumeSolverLibrary('fcs')
+resume_bh_solve_lib = canResumeSolverLibrary('bhs')
 
 
 class FreeCellSolver_Hint(Base_Solver_Hint):
     def _determineIfSolverState(self, line):
-        if re.search('^(?:Iterations count exceeded)', line):
-            self.solver_state = 'intractable'
-            return True
-        if re.search('^(?:I could not solve this game)', line):
-            self.solver_state = 'unsolved'
-            return True
-        return False
+        m = _FCS_STATE_RE.match(line)
+        if m is None:
+            return False
+        self.solver_state = 'intractable' if m.group(1) else 'unsolved'
+        return True
 
     def _isSimpleSimon(self):
         game_type = self.game_type
@@ -1084,7 +2138,10 @@ class FreeCellSolver_Hint(Base_Solver_Hint):
 
         return self.board
 
-    def computeHints(self):
+    def isResumable(self):
+        return resume_fc_solve_lib
+
+    def computeSolution(self, board):
         game = self.game
         game_type = self.game_type
         global FCS_VERSION
@@ -1092,18 +2149,12 @@ class FreeCellSolver_Hint(Base_Solver_Hint):
             if use_fc_solve_lib:
                 FCS_VERSION = (5, 0, 0)
             else:
-                pout, _ = self.run_solver(FCS_COMMAND + ' --version', '')
-                s = str(pout.read(), encoding='utf-8')
-                m = re.search(r'version ([0-9]+)\.([0-9]+)\.([0-9]+)', s)
-                if m:
-                    FCS_VERSION = (int(m.group(1)), int(m.group(2)),
-                                   int(m.group(3)))
-                else:
-                    FCS_VERSION = (0, 0, 0)
+                parser = FreeCellSolverVersionParser()
+                self.run_solver([FCS_COMMAND, '--version'], '', parser)
+                FCS_VERSION = parser.version
 
         progress = self.options['progress']
 
-        board = self.calcBoardString()
         if DEBUG:
             print('--------------------\n', board, '--------------------')
         args = []
@@ -1113,9 +2164,9 @@ class FreeCellSolver_Hint(Base_Solver_Hint):
             args += ['-m', '-p', '-opt', '-sel']
             if FCS_VERSION >= (4, 20, 0):
                 args += ['-hoi']
+        fcs_iter_output_step = None
         if (not use_fc_solve_lib) and progress:
             args += ['--iter-output']
-            fcs_iter_output_step = None
             if FCS_VERSION >= (4, 20, 0):
                 fcs_iter_output_step = self.options['iters_step']
                 args += ['--iter-output-step', str(fcs_iter_output_step)]
@@ -1123,7 +2174,8 @@ class FreeCellSolver_Hint(Base_Solver_Hint):
                 args += ['-s']
         if self.options['preset'] and self.options['preset'] != 'none':
             args += ['--load-config', self.options['preset']]
-        args += ['--max-iters', str(self.options['max_iters']),
+        max_iters, time_budget = self._getLimits()
+        args += ['--max-iters', str(max_iters),
                  '--decks-num', str(game.gameinfo.decks),
                  '--stacks-num', str(len(game.s.rows)),
                  '--freecells-num', str(len(game.s.reserves)),
@@ -1137,131 +2189,30 @@ class FreeCellSolver_Hint(Base_Solver_Hint):
         if 'esf' in game_type:
             args += ['--empty-stacks-filled-by', game_type['esf']]
 
-        if use_fc_solve_lib:
-            fc_solve_lib_obj.input_cmd_line(args)
-            status = fc_solve_lib_obj.solve_board(board)
-        else:
-            command = FCS_COMMAND+' '+' '.join(args)
-            pout, perr = self.run_solver(command, board)
         self.solver_state = 'unknown'
-        stack_types = {
-            'the': game.s.foundations,
-            'stack': game.s.rows,
-            'freecell': game.s.reserves,
-            }
         if DEBUG:
             start_time = time.time()
-        if not (use_fc_solve_lib) and progress:
-            iter_ = 0
-            depth = 0
-            states = 0
-
-            for sbytes in pout:
-                s = str(sbytes, encoding='utf-8')
-                if DEBUG >= 5:
-                    print(s)
-
-                if self.colonPrefixMatch('Iteration', s):
-                    iter_ = self._v
-                elif self.colonPrefixMatch('Depth', s):
-                    depth = self._v
-                elif self.colonPrefixMatch('Stored-States', s):
-                    states = self._v
-                    if iter_ % 100 == 0 or fcs_iter_output_step:
-                        self._setText(iter=iter_, depth=depth, states=states)
-                elif re.search('^(?:-=-=)', s):
-                    break
-                elif self._determineIfSolverState(s):
-                    break
-            self._setText(iter=iter_, depth=depth, states=states)
-
         hints = []
         if use_fc_solve_lib:
-            self._setText(
-                iter=fc_solve_lib_obj.get_num_times(),
-                depth=0,
-                states=fc_solve_lib_obj.get_num_states_in_collection(),
-            )
-            if status == 0:
-                m = fc_solve_lib_obj.get_next_move()
-                while m:
-                    type_ = ord(m.s[0])
-                    src = ord(m.s[1])
-                    dest = ord(m.s[2])
+            reply = self.callSolver(('fcs', args, board, time_budget))
+            state, iters, states, moves = reply or ('unsolved', 0, 0, [])
+            self._setText(iter=iters, depth=0, states=states)
+            if state == 'solved':
+                for type_, src, dest, ncards in moves:
                     hints.append([
-                        (ord(m.s[3]) if type_ == 0
+                        (ncards if type_ == 0
                          else (13 if type_ == 11 else 1)),
                         (game.s.rows if (type_ in [0, 1, 4, 11, ])
                          else game.s.reserves)[src],
                         (game.s.rows[dest] if (type_ in [0, 2])
                          else (game.s.reserves[dest]
                                if (type_ in [1, 3]) else None))])
-
-                    m = fc_solve_lib_obj.get_next_move()
             else:
-                self.solver_state = 'unsolved'
+                self.solver_state = state
         else:
-            for sbytes in pout:
-                s = str(sbytes, encoding='utf-8')
-                if DEBUG:
-                    print(s)
-                if self._determineIfSolverState(s):
-                    break
-                m = re.match(
-                    'Total number of states checked is ([0-9]+)\\.', s)
-                if m:
-                    self._setText(iter=int(m.group(1)))
-
-                m = re.match('This scan generated ([0-9]+) states\\.', s)
-
-                if m:
-                    self._setText(states=int(m.group(1)))
-
-                m = re.match('Move (.*)', s)
-                if not m:
-                    continue
-
-                move_s = m.group(1)
-
-                m = re.match(
-                    'the sequence on top of Stack ([0-9]+) to the foundations',
-                    move_s)
-
-                if m:
-                    ncards = 13
-                    st = stack_types['stack']
-                    sn = int(m.group(1))
-                    src = st[sn]
-                    dest = None
-                else:
-                    m = re.match(
-                        '(?P<ncards>a card|(?P<count>[0-9]+) cards) '
-                        'from (?P<source_type>stack|freecell) '
-                        '(?P<source_idx>[0-9]+) to '
-                        '(?P<dest>the foundations|'
-                        '(?P<dest_type>freecell|stack) '
-                        '(?P<dest_idx>[0-9]+))\\s*', move_s)
-
-                    if not m:
-                        continue
-
-                    if m.group('ncards') == 'a card':
-                        ncards = 1
-                    else:
-                        ncards = int(m.group('count'))
-
-                    st = stack_types[m.group('source_type')]
-                    sn = int(m.group('source_idx'))
-                    src = st[sn]
-
-                    dest_s = m.group('dest')
-                    if dest_s == 'the foundations':
-                        dest = None
-                    else:
-                        dt = stack_types[m.group('dest_type')]
-                        dest = dt[int(m.group('dest_idx'))]
-
-                hints.append([ncards, src, dest])
+            parser = FreeCellSolverOutputParser(self, fcs_iter_output_step)
+            self.run_solver([FCS_COMMAND] + args, board, parser)
+            hints = parser.hints
 
         if DEBUG:
             print('time:', time.time()-start_time)
@@ -1272,10 +2223,6 @@ class FreeCellSolver_Hint(Base_Solver_Hint):
                 self.solver_state = 'solved'
         self.hints.append(None)
 
-        if not use_fc_solve_lib:
-            pout.close()
-            perr.close()
-
 
 class BlackHoleSolver_Hint(Base_Solver_Hint):
     BLACK_HOLE_SOLVER_COMMAND = 'black-hole-solve'
@@ -1387,19 +2334,18 @@ class BlackHoleSolver_Hint(Base_Solver_Hint):
 
         return board
 
-    def computeHints(self):
+    def isResumable(self):
+        return resume_bh_solve_lib
+
+    def computeSolution(self, board):
         game = self.game
         game_type = self.game_type
 
-        board = self.calcBoardString()
         if DEBUG:
             print('--------------------\n', board, '--------------------')
+        max_iters, time_budget = self._getLimits()
         if use_bh_solve_lib:
-            # global bh_solve_lib_obj
-            # bh_solve_lib_obj = bh_solve_lib_obj.new_bhs_user_handle()
-            bh_solve_lib_obj.recycle()
-            bh_solve_lib_obj.read_board(
-                board=board,
+            kw = dict(
                 game_type=game_type['preset'],
                 place_queens_on_kings=(
                     game_type['queens_on_kings']
@@ -1408,100 +2354,157 @@ class BlackHoleSolver_Hint(Base_Solver_Hint):
                     game_type['wrap_ranks']
                     if ('wrap_ranks' in game_type) else True),
             )
-            bh_solve_lib_obj.limit_iterations(self.options['max_iters'])
         else:
             args = []
             args += ['--game', game_type['preset'], '--rank-reach-prune']
-            args += ['--max-iters', str(self.options['max_iters'])]
+            args += ['--max-iters', str(max_iters)]
             if 'queens_on_kings' in game_type:
                 args += ['--queens-on-kings']
             if 'wrap_ranks' in game_type:
                 args += ['--wrap-ranks']
 
-            command = self.BLACK_HOLE_SOLVER_COMMAND + ' ' + ' '.join(args)
+            argv = [self.BLACK_HOLE_SOLVER_COMMAND] + args
 
         if DEBUG:
             start_time = time.time()
 
-        result = ''
-
-        if use_bh_solve_lib:
-            ret_code = bh_solve_lib_obj.resume_solution()
-        else:
-            pout, perr = self.run_solver(command, board)
-
-            for sbytes in pout:
-                s = str(sbytes, encoding='utf-8')
-                if DEBUG >= 5:
-                    print(s)
-
-                m = re.search('^(Intractable|Unsolved|Solved)!', s.rstrip())
-                if m:
-                    result = m.group(1)
-                    break
-
         self._setText(iter=0, depth=0, states=0)
         hints = []
         if use_bh_solve_lib:
-            self.solver_state = (
-                'solved' if ret_code == 0 else
-                ('intractable'
-                 if bh_solve_lib_obj.ret_code_is_suspend(ret_code)
-                 else 'unsolved'))
-            self._setText(iter=bh_solve_lib_obj.get_num_times())
-            self._setText(
-                states=bh_solve_lib_obj.get_num_states_in_collection())
+            reply = self.callSolver(
+                ('bhs', kw, board, max_iters, time_budget))
+            state, iters, states, moves = reply or ('unsolved', 0, 0, [])
+            self.solver_state = state
+            self._setText(iter=iters)
+            self._setText(states=states)
             if self.solver_state == 'solved':
-                m = bh_solve_lib_obj.get_next_move()
-                while m:
-                    found_stack_idx = m.get_column_idx()
+                for found_stack_idx in moves:
                     if len(game.s.rows) > found_stack_idx >= 0:
                         src = game.s.rows[found_stack_idx]
 
                         hints.append([1, src, None])
                     else:
                         hints.append([1, game.s.talon, None])
-                    m = bh_solve_lib_obj.get_next_move()
         else:
-            self.solver_state = result.lower()
-            for sbytes in pout:
-                s = str(sbytes, encoding='utf-8')
-                if DEBUG:
-                    print(s)
+            parser = BlackHoleSolverOutputParser(self)
+            self.run_solver(argv, board, parser)
+            self.solver_state = parser.result.lower()
+            hints = parser.hints
 
-                if s.strip() == 'Deal talon':
-                    hints.append([1, game.s.talon, None])
-                    continue
+        if DEBUG:
+            print('time:', time.time()-start_time)
 
-                m = re.match(
-                    'Total number of states checked is ([0-9]+)\\.', s)
-                if m:
-                    self._setText(iter=int(m.group(1)))
-                    continue
+        hints.append(None)
+        self.hints = hints
 
-                m = re.match('This scan generated ([0-9]+) states\\.', s)
 
-                if m:
-                    self._setText(states=int(m.group(1)))
-                    continue
+# ************************************************************************
+# * PositionSolver_Hint runs the solver of the game itself (see
+# * Game.PositionSolver_Class) for the solver dialog; it has its own
+# * instance of the solver, as the dialog runs it in a thread. The
+# * exported board is only meant to be read.
+# ************************************************************************
 
-                m = re.match(
-                    'Move a card from stack ([0-9]+) to the foundations', s)
-                if not m:
-                    continue
+class PositionSolver_Hint(Base_Solver_Hint):
+    # seconds, to find the way again if the game has left the solution
+    # (see getHints())
+    RESOLVE_TIME = 1.0
 
-                found_stack_idx = int(m.group(1))
-                src = game.s.rows[found_stack_idx]
+    def __init__(self, game, dialog, **game_type):
+        Base_Solver_Hint.__init__(self, game, dialog, **game_type)
+        self.solver = game.PositionSolver_Class(game)
+        self.position = None
 
-                hints.append([1, src, None])
-            pout.close()
-            perr.close()
+    def calcBoardString(self):
+        # also takes the position to solve
+        game = self.game
+        self.position = self.solver.getPosition()
 
-        if DEBUG:
-            print('time:', time.time()-start_time)
+        def cards(stack):
+            return ' '.join(self.card2str1(c) if c.face_up
+                            else '<%s>' % self.card2str1(c)
+                            for c in stack.cards)
+        board = ''
+        if game.s.talon.cards:
+            board += 'Talon: %s\n' % ' '.join(
+                self.card2str1(c) for c in reversed(game.s.talon.cards))
+        if game.s.waste:
+            board += 'Waste: %s\n' % cards(game.s.waste)
+        board += 'Foundations: %s\n' % ' '.join(
+            self.card2str1(f.cards[-1]) if f.cards else '-'
+            for f in game.s.foundations)
+        for r in game.s.reserves:
+            board += 'Reserve: %s\n' % cards(r)
+        for r in game.s.rows:
+            board += '%s\n' % cards(r)
+        return board
 
+    def importFile(solver, fh, s_game, self):
+        raise PySolHintLayoutImportError(
+            "Importing a layout is not supported in this game", [], 0)
+
+    def solveBoard(self, board):
+        # the solver keeps what it has found out itself
+        self._solveBoard(board)
+
+    def isResumable(self):
+        return True
+
+    def computeSolution(self, board):
+        solver = self.solver
+        position = self.position
+        if position is None:
+            position = solver.getPosition()
+        self.hints = [None]
+        self.hints_index = 0
+        if position is None:
+            # (the solver can't take this position)
+            self.solver_state = 'intractable'
+            return
+        max_iters, time_budget = self._getLimits()
+        self._setText(iter=0, depth=0, states=0)
+        if time_budget:
+            it = solver.iterSolve(time_budget, position=position)
+        else:
+            it = solver.iterSolve(None, position=position,
+                                  max_positions=max_iters)
+        state = 'unknown'
+        while not self.cancelled:
+            try:
+                next(it)
+            except StopIteration as e:
+                state = e.value
+                break
+            self._setText(iter=solver.positions)
+        self._setText(iter=solver.positions)
+        hints = []
+        if state == 'solved':
+            for move in solver.getSolution(position):
+                hints.append(list(solver.getMoveStacks(move)))
+        self.solver_state = state if state != 'unknown' else 'intractable'
         hints.append(None)
         self.hints = hints
+        self.hints_index = 0
+
+    def getHints(self, taken_hint=None):
+        # the move that wins from the position of the game
+        if taken_hint and taken_hint[6]:
+            return [taken_hint[6]]
+        game, solver = self.game, self.solver
+        for r in game.allstacks:
+            if r is not game.s.talon and r.canFlipCard():
+                return [(999999, 0, 1, r, r, None, None)]
+        position = solver.getPosition()
+        if position is None or solver.isWon(position):
+            return None
+        move = solver.getSolutionMove(position)
+        if move is None:
+            solver.solve(self.RESOLVE_TIME, position=position)
+            move = solver.getSolutionMove(position)
+            if move is None:
+                return None
+        ncards, src, dest = solver.getMoveStacks(move)
+        return [(999999, 0, ncards, src, dest, None, None)]
 
 
 class FreeCellSolverWrapper:
@@ -1520,5 +2523,20 @@ class BlackHoleSolverWrapper:
         self.game_type = game_type
 
     def __call__(self, game, dialog):
+        # without black-hole-solve the game's own solver is used
+        if game.PositionSolver_Class is not None and \
+                not use_bh_solve_lib and shutil.which(
+                    BlackHoleSolver_Hint.BLACK_HOLE_SOLVER_COMMAND) is None:
+            return PositionSolver_Hint(game, dialog, **self.game_type)
         hint = BlackHoleSolver_Hint(game, dialog, **self.game_type)
         return hint
+
+
+class PositionSolverWrapper:
+
+    def __init__(self, **game_type):
+        self.game_type = game_type
+
+    def __call__(self, game, dialog):
+        hint = PositionSolver_Hint(game, dialog, **self.game_type)
+        return hint
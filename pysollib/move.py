@@ -43,6 +43,17 @@ if sys.version_info > (3,):
 # - save the seed of game.random
 # - shuffle a stack
 
+def _flipCard(game, card, unhide=1):
+    # in model-only mode (see Game.enterModelOnly()) only the state of
+    # the card is changed, the view is rebuilt when leaving that mode
+    if game.model_only:
+        card.face_up = int(not card.face_up)
+    elif card.face_up:
+        card.showBack(unhide=unhide)
+    else:
+        card.showFace(unhide=unhide)
+
+
 class AtomicMove:
 
     def do(self, game):
@@ -87,6 +98,16 @@ class AMoveMove(AtomicMove):
             # don't use animation for drag-move
             frames = 0
         cards = from_stack.cards[-ncards:]
+        game.updateSnapshotHash(from_stack, len(from_stack.cards) - ncards)
+        # the cards are hashed in before they are added, as closeStack()
+        # may do further moves on to_stack (e.g. PileOn, Crossword)
+        if game.model_only:
+            for i in range(ncards):
+                from_stack.removeCardModel()
+            for c in cards:
+                game.updateSnapshotHash(to_stack, len(to_stack.cards), [c])
+                to_stack.addCardModel(c)
+            return
         if frames != 0:
             from_stack.unshadeStack()
             x, y = to_stack.getPositionForNextCard()
@@ -95,6 +116,7 @@ class AMoveMove(AtomicMove):
         for i in range(ncards):
             from_stack.removeCard()
         for c in cards:
+            game.updateSnapshotHash(to_stack, len(to_stack.cards), [c])
             to_stack.addCard(c)
         from_stack.updatePositions()
         to_stack.updatePositions()
@@ -130,10 +152,10 @@ class AFlipMove(AtomicMove):
     def _doMove(self, game, stack):
         card = stack.cards[-1]
         # game.animatedFlip(stack)
-        if card.face_up:
-            card.showBack()
-        else:
-            card.showFace()
+        game.updateSnapshotHash(stack, -1)
+        _flipCard(game, card)
+        stack.resetMovableRuns(-1)
+        game.updateSnapshotHash(stack, -1)
 
     def redo(self, game):
         self._doMove(game, game.allstacks[self.stack_id])
@@ -149,11 +171,12 @@ class AFlipMove(AtomicMove):
 class ASingleFlipMove(AFlipMove):
     def _doMove(self, game, stack):
         card = stack.cards[-1]
-        game.animatedFlip(stack)
-        if card.face_up:
-            card.showBack()
-        else:
-            card.showFace()
+        if not game.model_only:
+            game.animatedFlip(stack)
+        game.updateSnapshotHash(stack, -1)
+        _flipCard(game, card)
+        stack.resetMovableRuns(-1)
+        game.updateSnapshotHash(stack, -1)
 
 
 # flip and move one card
@@ -168,21 +191,27 @@ class AFlipAndMoveMove(AtomicMove):
     def _doMove(self, game, from_stack, to_stack):
         if game.moves.state == game.S_PLAY:
             assert to_stack.acceptsCards(from_stack, from_stack.cards[-1])
+        if game.model_only:
+            game.updateSnapshotHash(from_stack, -1)
+            c = from_stack.removeCardModel()
+            _flipCard(game, c)
+            game.updateSnapshotHash(to_stack, len(to_stack.cards), [c])
+            to_stack.addCardModel(c)
+            return
         if self.frames == 0:
             moved = True
         else:
             moved = game.animatedFlipAndMove(from_stack, to_stack, self.frames)
+        game.updateSnapshotHash(from_stack, -1)
         c = from_stack.cards[-1]
-        if c.face_up:
-            c.showBack()
-        else:
-            c.showFace()
+        _flipCard(game, c)
         if not moved:
             cards = from_stack.cards[-1:]
             x, y = to_stack.getPositionForNextCard()
             game.animatedMoveTo(from_stack, to_stack, cards, x, y,
                                 frames=self.frames, shadow=0)
         c = from_stack.removeCard(update=False)
+        game.updateSnapshotHash(to_stack, len(to_stack.cards), [c])
         to_stack.addCard(c, update=False)
         from_stack.updateText()
         to_stack.updateText()
@@ -210,21 +239,23 @@ class AFlipAllMove(AtomicMove):
 
     def redo(self, game):
         stack = game.allstacks[self.stack_id]
+        game.updateSnapshotHash(stack)
         for card in stack.cards:
-            if card.face_up:
-                card.showBack()
-            else:
-                card.showFace()
-        stack.refreshView()
+            _flipCard(game, card)
+        stack.resetMovableRuns()
+        game.updateSnapshotHash(stack)
+        if not game.model_only:
+            stack.refreshView()
 
     def undo(self, game):
         stack = game.allstacks[self.stack_id]
+        game.updateSnapshotHash(stack)
         for card in stack.cards:
-            if card.face_up:
-                card.showBack()
-            else:
-                card.showFace()
-        stack.refreshView()
+            _flipCard(game, card)
+        stack.resetMovableRuns()
+        game.updateSnapshotHash(stack)
+        if not game.model_only:
+            stack.refreshView()
 
     def cmpForRedo(self, other):
         return cmp(self.stack_id, other.stack_id)
@@ -245,6 +276,15 @@ class ATurnStackMove(AtomicMove):
         to_stack = game.allstacks[self.to_stack_id]
         assert len(from_stack.cards) > 0
         assert len(to_stack.cards) == 0
+        game.updateSnapshotHash(from_stack)
+        if game.model_only:
+            while from_stack.cards:
+                card = from_stack.removeCardModel()
+                assert card.face_up
+                to_stack.addCardModel(card)
+                card.face_up = 0
+            game.updateSnapshotHash(to_stack)
+            return
         mylen = len(from_stack.cards)
         for i in range(mylen):
             # unhide = (i >= mylen - 2)
@@ -256,6 +296,7 @@ class ATurnStackMove(AtomicMove):
             to_stack.addCard(card, unhide=unhide, update=0)
             card.showBack(unhide=unhide)
             # print 3, unhide, to_stack.getCard().__dict__
+        game.updateSnapshotHash(to_stack)
         from_stack.updateText()
         to_stack.updateText()
 
@@ -264,6 +305,15 @@ class ATurnStackMove(AtomicMove):
         to_stack = game.allstacks[self.from_stack_id]
         assert len(from_stack.cards) > 0
         assert len(to_stack.cards) == 0
+        game.updateSnapshotHash(from_stack)
+        if game.model_only:
+            while from_stack.cards:
+                card = from_stack.removeCardModel()
+                assert not card.face_up
+                card.face_up = 1
+                to_stack.addCardModel(card)
+            game.updateSnapshotHash(to_stack)
+            return
         mylen = len(from_stack.cards)
         for i in range(mylen):
             # unhide = (i >= mylen - 2)
@@ -272,6 +322,7 @@ class ATurnStackMove(AtomicMove):
             assert not card.face_up
             card.showFace(unhide=unhide)
             to_stack.addCard(card, unhide=unhide, update=0)
+        game.updateSnapshotHash(to_stack)
         from_stack.updateText()
         to_stack.updateText()
 
@@ -353,7 +404,7 @@ class AUpdateStackMove(AtomicMove):
         if self.flags & 64:
             # model
             stack.updateModel(undo, self.flags)
-        else:
+        elif not game.model_only:
             # view
             if self.flags & 16:
                 stack.updateText()
@@ -390,14 +441,16 @@ class ANextRoundMove(AtomicMove):
         assert stack is game.s.talon
         assert stack.round < stack.max_rounds or stack.max_rounds < 0
         stack.round = stack.round + 1
-        stack.updateText()
+        if not game.model_only:
+            stack.updateText()
 
     def undo(self, game):
         stack = game.allstacks[self.stack_id]
         assert stack is game.s.talon
         assert stack.round > 1
         stack.round = stack.round - 1
-        stack.updateText()
+        if not game.model_only:
+            stack.updateText()
 
     def cmpForRedo(self, other):
         return cmp(self.stack_id, other.stack_id)
@@ -459,13 +512,17 @@ class AShuffleStackMove(AtomicMove):
         assert stack is game.s.talon or stack in game.s.internals
         # shuffle (see random)
         game.random.setstate(self.state)
+        game.updateSnapshotHash(stack)
         seq = stack.cards
         n = len(seq) - 1
         while n > 0:
             j = game.random.randint(0, n)
             seq[n], seq[j] = seq[j], seq[n]
             n = n - 1
-        stack.refreshView()
+        stack.resetMovableRuns()
+        game.updateSnapshotHash(stack)
+        if not game.model_only:
+            stack.refreshView()
 
     def undo(self, game):
         stack = game.allstacks[self.stack_id]
@@ -475,10 +532,13 @@ class AShuffleStackMove(AtomicMove):
             c = game.cards[id]
             assert c.id == id
             cards.append(c)
+        game.updateSnapshotHash(stack)
         stack.cards = cards
+        game.updateSnapshotHash(stack)
         # restore the state
         game.random.setstate(self.state)
-        stack.refreshView()
+        if not game.model_only:
+            stack.refreshView()
 
     def cmpForRedo(self, other):
         return (cmp(self.stack_id, other.stack_id) or
@@ -508,11 +568,20 @@ class ASingleCardMove(AtomicMove):
             assert to_stack.acceptsCards(
                 from_stack, [from_stack.cards[from_pos]])
         card = from_stack.cards[from_pos]
+        game.updateSnapshotHash(from_stack, from_pos)
+        if game.model_only:
+            from_stack.removeCardModel(card)
+            game.updateSnapshotHash(from_stack, from_pos)
+            game.updateSnapshotHash(to_stack, len(to_stack.cards), [card])
+            to_stack.addCardModel(card)
+            return
         card = from_stack.removeCard(card, update_positions=1)
+        game.updateSnapshotHash(from_stack, from_pos)
         if self.frames != 0:
             x, y = to_stack.getPositionFor(card)
             game.animatedMoveTo(from_stack, to_stack, [card], x, y,
                                 frames=self.frames, shadow=self.shadow)
+        game.updateSnapshotHash(to_stack, len(to_stack.cards), [card])
         to_stack.addCard(card)
         # to_stack.refreshView()
 
@@ -520,12 +589,20 @@ class ASingleCardMove(AtomicMove):
         from_stack = game.allstacks[self.from_stack_id]
         to_stack = game.allstacks[self.to_stack_id]
         from_pos = self.from_pos
+        game.updateSnapshotHash(to_stack, -1)
+        game.updateSnapshotHash(from_stack, from_pos)
+        if game.model_only:
+            card = to_stack.removeCardModel()
+            from_stack.insertCardModel(card, from_pos)
+            game.updateSnapshotHash(from_stack, from_pos)
+            return
         card = to_stack.removeCard()
         # if self.frames != 0:
         #  x, y = to_stack.getPositionFor(card)
         #  game.animatedMoveTo(from_stack, to_stack, [card], x, y,
         #                      frames=self.frames, shadow=self.shadow)
         from_stack.insertCard(card, from_pos)
+        game.updateSnapshotHash(from_stack, from_pos)
         # to_stack.refreshView()
 
     def cmpForRedo(self, other):
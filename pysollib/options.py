@@ -78,6 +78,7 @@ highlight_samerank = boolean
 highlight_not_matching = boolean
 peek_facedown = boolean
 stuck_notification = boolean
+stuck_time_budget = integer(0, 60000)
 mahjongg_show_removed = boolean
 mahjongg_create_solvable = integer(0, 2)
 shisen_show_hint = boolean
@@ -94,6 +95,7 @@ shrink_face_down = boolean
 shade_filled_stacks = boolean
 demo_logo = boolean
 demo_logo_style = string
+demo_lookahead = integer(0, 10000)
 pause_text_style = string
 redeal_icon_style = string
 dialog_icon_style = string
@@ -143,6 +145,8 @@ solver_show_progress = boolean
 solver_max_iterations = integer
 solver_iterations_output_step = integer
 solver_preset = string
+solver_time_budget = integer
+solver_cache_size = integer
 display_win_message = boolean
 language = string
 table_zoom = list
@@ -254,6 +258,7 @@ class Options:
         ('highlight_not_matching', 'bool'),
         ('peek_facedown', 'bool'),
         ('stuck_notification', 'bool'),
+        ('stuck_time_budget', 'int'),
         ('mahjongg_show_removed', 'bool'),
         ('mahjongg_create_solvable', 'int'),
         ('shisen_show_hint', 'bool'),
@@ -272,6 +277,7 @@ class Options:
         ('shade_filled_stacks', 'bool'),
         ('demo_logo', 'bool'),
         ('demo_logo_style', 'str'),
+        ('demo_lookahead', 'int'),
         ('pause_text_style', 'str'),
         ('redeal_icon_style', 'str'),
         ('dialog_icon_style', 'str'),
@@ -322,6 +328,8 @@ class Options:
         ('solver_max_iterations', 'int'),
         ('solver_iterations_output_step', 'int'),
         ('solver_preset', 'string'),
+        ('solver_time_budget', 'int'),
+        ('solver_cache_size', 'int'),
         ('mouse_button1', 'int'),
         ('mouse_button2', 'int'),
         ('mouse_button3', 'int'),
@@ -362,6 +370,9 @@ class Options:
         self.highlight_not_matching = True
         self.peek_facedown = False
         self.stuck_notification = False
+        # milliseconds the stuck check may spend on finding out if a game
+        # is lost (see DeadlockCheck), 0 = only look for moves
+        self.stuck_time_budget = 1000
         self.mahjongg_show_removed = False
         self.mahjongg_create_solvable = 2  # 0 - none, 1 - easy, 2 - hard
         self.accordion_deal_all = True
@@ -385,6 +396,9 @@ class Options:
         self.shade_filled_stacks = True
         self.demo_logo = True
         self.demo_logo_style = 'komika'
+        # milliseconds the demo may search ahead for each move (see
+        # LookaheadHint), 0 = only score the possible moves
+        self.demo_lookahead = 0
         self.pause_text_style = 'komika'
         self.redeal_icon_style = 'modern'
         self.dialog_icon_style = 'remix'
@@ -560,6 +574,8 @@ class Options:
         self.solver_max_iterations = 100000
         self.solver_iterations_output_step = 100
         self.solver_preset = 'video-editing'
+        self.solver_time_budget = 0     # seconds, 0 = no limit
+        self.solver_cache_size = 4096   # KiB, 0 = no cache
 
     def setDefaults(self, top=None):
         WIN_SYSTEM = pysollib.settings.WIN_SYSTEM
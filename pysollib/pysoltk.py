@@ -94,6 +94,16 @@ elif TOOLKIT == 'kivy':
     from pysollib.kivy.selectcardset import *  # noqa: F401,F403
     from pysollib.kivy.selecttree import *  # noqa: F401,F403
 
+elif TOOLKIT == 'headless':
+    from pysollib.headless.tkconst import *  # noqa: F401,F403
+    from pysollib.headless.tkutil import *  # noqa: F401,F403
+    from pysollib.headless.card import *  # noqa: F401,F403
+    from pysollib.headless.tkcanvas import *  # noqa: F401,F403
+    from pysollib.headless.tkwrap import *  # noqa: F401,F403
+    from pysollib.headless.tkwidget import *  # noqa: F401,F403
+    from pysollib.headless.tkhtml import *  # noqa: F401,F403
+    from pysollib.headless.solverdialog import *  # noqa: F401,F403
+
 else:  # gtk
     from pysollib.pysolgtk.tkconst import *  # noqa: F401,F403
     from pysollib.pysolgtk.tkutil import *  # noqa: F401,F403
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+
+# ************************************************************************
+# * On-disk cache of solver results
+# *
+# * Each result is a small JSON file in the cache directory, named after
+# * the SHA-1 of its key (see makeKey()). The modification time of a
+# * file is its last use: get() touches the file, and put() removes the
+# * least recently used files while the total size of the cache is
+# * above max_size. The list of files is read from the directory once
+# * and then kept up to date in memory.
+# ************************************************************************
+
+class SolverCache:
+    SUFFIX = '.json'
+
+    def __init__(self, dirname, max_size=4*1024*1024):
+        self.dirname = dirname
+        self.max_size = max_size
+        # file name -> size, least recently used first
+        self._entries = None
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def makeKey(*parts):
+        # parts must be JSON serializable
+        s = json.dumps(parts, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha1(s.encode('utf-8')).hexdigest()
+
+    def _load(self):
+        if self._entries is not None:
+            return
+        files = []
+        try:
+            names = os.listdir(self.dirname)
+        except OSError:
+            names = []
+        for name in names:
+            if not name.endswith(self.SUFFIX):
+                continue
+            try:
+                st = os.stat(os.path.join(self.dirname, name))
+            except OSError:
+                continue
+            files.append((st.st_mtime, name, st.st_size))
+        files.sort()
+        self._entries = OrderedDict((name, size) for t, name, size in files)
+        self._size = sum(self._entries.values())
+
+    def _remove(self, name):
+        self._size -= self._entries.pop(name)
+        try:
+            os.remove(os.path.join(self.dirname, name))
+        except OSError:
+            pass
+
+    def get(self, key):
+        # returns the data stored for key or None
+        name = key + self.SUFFIX
+        filename = os.path.join(self.dirname, name)
+        with self._lock:
+            self._load()
+            if name not in self._entries:
+                return None
+            try:
+                with open(filename) as fh:
+                    data = json.load(fh)
+                os.utime(filename, None)
+            except (OSError, ValueError):
+                self._remove(name)
+                return None
+            self._entries.move_to_end(name)
+            return data
+
+    def put(self, key, data):
+        name = key + self.SUFFIX
+        filename = os.path.join(self.dirname, name)
+        s = json.dumps(data, separators=(',', ':'))
+        with self._lock:
+            self._load()
+            try:
+                if not os.path.isdir(self.dirname):
+                    os.makedirs(self.dirname)
+                tmpname = '%s.%d.tmp' % (filename, os.getpid())
+                with open(tmpname, 'w') as fh:
+                    fh.write(s)
+                os.replace(tmpname, filename)
+            except OSError:
+                return
+            if name in self._entries:
+                self._size -= self._entries.pop(name)
+            self._entries[name] = len(s)
+            self._size += len(s)
+            while self._size > self.max_size and len(self._entries) > 1:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self):
+        with self._lock:
+            self._load()
+            for name in list(self._entries):
+                self._remove(name)
@@ -0,0 +1,386 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------
+
+import multiprocessing
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+import pysollib.settings
+
+
+# ************************************************************************
+# * Solver worker pool
+# *
+# * The solvers (fc-solve and black-hole-solve, or their python
+# * bindings) are run by long-lived worker processes instead of a new
+# * shell per solve. A worker reads requests from a pipe and answers
+# * each of them with one reply:
+# *
+# *     ('run', argv, input)    -> ('run', stderr, returncode)
+# *     ('fcs', args, board, time_budget)
+# *                             -> ('fcs', state, iters, states, moves)
+# *     ('bhs', kw, board, max_iters, time_budget)
+# *                             -> ('bhs', state, iters, states, moves)
+# *
+# * or ('error', message). While a 'run' request is executed the worker
+# * first sends ('pid', pid) of the solver process, so that it can be
+# * killed when the solve is cancelled, and then ('out', data) for each
+# * chunk of its output as soon as it is read. Each worker keeps its own
+# * library solver objects, which are created on first use.
+# *
+# * The workers are spawned, not forked: they may be started from a
+# * thread of the GUI process (see BaseSolverDialog), and a fork would
+# * copy its threads and its connection to the display.
+# *
+# * Where worker processes can't be used (frozen executables, Android,
+# * or inside a daemonic process such as a multiprocessing.Pool worker)
+# * the requests are handled in the calling process.
+# ************************************************************************
+
+# the library solver objects of this process
+_library_solvers = {}
+
+
+def _getLibrarySolver(kind):
+    # returns None if the library is not installed
+    if kind not in _library_solvers:
+        obj = None
+        try:
+            if kind == 'fcs':
+                import freecell_solver
+                obj = freecell_solver.FreecellSolver()
+            else:
+                import black_hole_solver
+                obj = black_hole_solver.BlackHoleSolver()
+        except BaseException:
+            pass
+        _library_solvers[kind] = obj
+    return _library_solvers[kind]
+
+
+def hasSolverLibrary(kind):
+    # kind is 'fcs' (freecell_solver) or 'bhs' (black_hole_solver)
+    return _getLibrarySolver(kind) is not None
+
+
+def canResumeSolverLibrary(kind):
+    # True if a suspended solve of the library can be continued, so that
+    # it can be given a time budget instead of an iteration count
+    obj = _getLibrarySolver(kind)
+    return (obj is not None and hasattr(obj, 'limit_iterations') and
+            hasattr(obj, 'resume_solution'))
+
+
+OUTPUT_CHUNK_SIZE = 65536
+
+
+def _runCommand(started, output, argv, input):
+    kw = {'stdin': subprocess.PIPE,
+          'stdout': subprocess.PIPE,
+          'stderr': subprocess.PIPE}
+    if os.name != 'nt':
+        kw['close_fds'] = True
+    try:
+        p = subprocess.Popen(argv, **kw)
+    except OSError:
+        # same as the shell's "command not found"
+        return ('run', b'', 127)
+    started(p.pid)
+    errors = []
+    thread = threading.Thread(target=lambda: errors.append(p.stderr.read()))
+    thread.daemon = True
+    thread.start()
+    try:
+        p.stdin.write(input)
+        p.stdin.close()
+    except OSError:
+        pass
+    while True:
+        data = p.stdout.read1(OUTPUT_CHUNK_SIZE)
+        if not data:
+            break
+        output(data)
+    p.stdout.close()
+    p.wait()
+    thread.join()
+    return ('run', b''.join(errors), p.returncode)
+
+
+# the length of a round of a solve with a time budget, in seconds
+RESUME_SLICE = 0.1
+
+
+def _resumeSolution(obj, is_suspended, ret_code, start, time_budget):
+    # continue a suspended solve in rounds of growing iteration limits,
+    # until it is done or the time budget is used up
+    deadline = start + time_budget
+    while is_suspended(ret_code):
+        now = time.time()
+        if now >= deadline:
+            break
+        iters = obj.get_num_times()
+        rate = iters / max(now - start, 0.001)
+        step = int(rate * min(RESUME_SLICE, deadline - now))
+        obj.limit_iterations(iters + max(step, 1000))
+        ret_code = obj.resume_solution()
+    return ret_code
+
+
+# fc-solve's FCS_STATE_EXCEEDS_MAX_NUM_TIMES and FCS_STATE_SUSPEND_PROCESS
+FCS_SUSPEND_STATES = (3, 5)
+
+
+def _solveFCS(args, board, time_budget=0):
+    start = time.time()
+    obj = _getLibrarySolver('fcs')
+    obj.input_cmd_line(args)
+    status = obj.solve_board(board)
+    if time_budget > 0:
+        status = _resumeSolution(obj, FCS_SUSPEND_STATES.__contains__,
+                                 status, start, time_budget)
+    if status == 0:
+        state = 'solved'
+    elif status in FCS_SUSPEND_STATES:
+        state = 'intractable'
+    else:
+        state = 'unsolved'
+    moves = []
+    if status == 0:
+        m = obj.get_next_move()
+        while m:
+            moves.append(tuple(ord(c) for c in m.s[:4]))
+            m = obj.get_next_move()
+    return ('fcs', state, obj.get_num_times(),
+            obj.get_num_states_in_collection(), moves)
+
+
+def _solveBHS(kw, board, max_iters, time_budget=0):
+    start = time.time()
+    obj = _getLibrarySolver('bhs')
+    obj.recycle()
+    obj.read_board(board=board, **kw)
+    obj.limit_iterations(max_iters)
+    ret_code = obj.resume_solution()
+    if time_budget > 0:
+        ret_code = _resumeSolution(obj, obj.ret_code_is_suspend,
+                                   ret_code, start, time_budget)
+    if ret_code == 0:
+        state = 'solved'
+    elif obj.ret_code_is_suspend(ret_code):
+        state = 'intractable'
+    else:
+        state = 'unsolved'
+    moves = []
+    if state == 'solved':
+        m = obj.get_next_move()
+        while m:
+            moves.append(m.get_column_idx())
+            m = obj.get_next_move()
+    return ('bhs', state, obj.get_num_times(),
+            obj.get_num_states_in_collection(), moves)
+
+
+def _handleRequest(request, started, output):
+    kind, args = request[0], request[1:]
+    try:
+        if kind == 'run':
+            return _runCommand(started, output, *args)
+        if kind == 'fcs':
+            return _solveFCS(*args)
+        if kind == 'bhs':
+            return _solveBHS(*args)
+        return ('error', 'unknown request: %r' % (kind,))
+    except Exception as ex:
+        return ('error', '%s: %s' % (ex.__class__.__name__, ex))
+
+
+def _workerMain(conn):
+    def started(pid):
+        conn.send(('pid', pid))
+
+    def output(data):
+        conn.send(('out', data))
+
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            break
+        conn.send(_handleRequest(request, started, output))
+
+
+def _killProcess(pid):
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except OSError:
+        pass
+
+
+# ************************************************************************
+# * Workers. call() returns the reply without its tag, or None if the
+# * worker was killed; an ('error', ...) reply raises RuntimeError. The
+# * output of a 'run' request is passed to output() while it comes in.
+# ************************************************************************
+
+class SolverWorker:
+    def __init__(self, context):
+        # context: the multiprocessing context to start the worker with
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_workerMain, args=(child_conn,))
+        self.process.daemon = True
+        self.process.start()
+        child_conn.close()
+        self.child_pid = None
+        self.killed = False
+
+    def isAlive(self):
+        return not self.killed and self.process.is_alive()
+
+    def call(self, request, output=None):
+        try:
+            self.conn.send(request)
+            while True:
+                reply = self.conn.recv()
+                if reply[0] == 'out':
+                    if output is not None:
+                        output(reply[1])
+                elif reply[0] == 'pid':
+                    self.child_pid = reply[1]
+                else:
+                    break
+        except (EOFError, OSError):
+            # killed
+            return None
+        finally:
+            self.child_pid = None
+        if reply[0] == 'error':
+            raise RuntimeError(reply[1])
+        return reply[1:]
+
+    def kill(self):
+        self.killed = True
+        pid = self.child_pid
+        if pid is not None:
+            _killProcess(pid)
+        self.process.terminate()
+
+    def close(self):
+        self.conn.close()
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join(1)
+
+
+class InlineSolverWorker:
+    # handles the requests in the calling process; a running library
+    # solve can't be interrupted
+    def __init__(self):
+        self.child_pid = None
+        self.killed = False
+
+    def isAlive(self):
+        return not self.killed
+
+    def _started(self, pid):
+        self.child_pid = pid
+        if self.killed:
+            _killProcess(pid)
+
+    def _output(self, data):
+        pass
+
+    def call(self, request, output=None):
+        try:
+            reply = _handleRequest(request, self._started,
+                                   output or self._output)
+        finally:
+            self.child_pid = None
+        if self.killed:
+            return None
+        if reply[0] == 'error':
+            raise RuntimeError(reply[1])
+        return reply[1:]
+
+    def kill(self):
+        self.killed = True
+        pid = self.child_pid
+        if pid is not None:
+            _killProcess(pid)
+
+    def close(self):
+        pass
+
+
+# ************************************************************************
+# * The pool keeps up to `size' idle workers. acquire() never blocks: if
+# * all workers are busy a new one is started, and it is closed again
+# * by release() if there are already enough idle workers.
+# ************************************************************************
+
+class SolverPool:
+    def __init__(self, size=2):
+        self.size = size
+        self.enabled = True
+        self._context = multiprocessing.get_context('spawn')
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def _canUseProcesses(self):
+        if not self.enabled or getattr(sys, 'frozen', False):
+            return False
+        if pysollib.settings.TOOLKIT == 'kivy':
+            return False
+        # daemonic processes are not allowed to have children
+        return not multiprocessing.current_process().daemon
+
+    def acquire(self):
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.isAlive():
+                    return worker
+                worker.close()
+        if self._canUseProcesses():
+            try:
+                return SolverWorker(self._context)
+            except (OSError, ValueError):
+                self.enabled = False
+        return InlineSolverWorker()
+
+    def release(self, worker):
+        if isinstance(worker, SolverWorker) and worker.isAlive():
+            with self._lock:
+                if len(self._idle) < self.size:
+                    self._idle.append(worker)
+                    return
+        worker.close()
+
+    def shutdown(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.close()
+
+
+solver_pool = SolverPool()
@@ -21,6 +21,8 @@
 #
 # ---------------------------------------------------------------------------
 
+import functools
+
 from pysollib.mfxutil import Image, ImageTk, USE_PIL
 from pysollib.mfxutil import Struct, SubclassResponsibility, kwdefault
 from pysollib.mygettext import _
@@ -185,6 +187,9 @@ class Stack:
         model.cards = []
         #
         model.is_filled = False
+        # see getMovableRun()
+        model._movable_runs = []
+        model._movable_runs_cards = None
 
         # capabilites - the game logic
         model.cap = Struct(
@@ -398,6 +403,7 @@ class Stack:
     def addCard(self, card, unhide=1, update=1):
         model, view = self, self
         model.cards.append(card)
+        model.resetMovableRuns(-1)
         card.tkraise(unhide=unhide)
         if view.can_hide_cards and len(model.cards) >= 3:
             # we only need to display the 2 top cards
@@ -412,6 +418,7 @@ class Stack:
     def insertCard(self, card, position, unhide=1, update=1):
         model, view = self, self
         model.cards.insert(position, card)
+        model.resetMovableRuns(position)
         for c in model.cards[position:]:
             c.tkraise(unhide=unhide)
         if (view.can_hide_cards and len(model.cards) >= 3 and
@@ -439,6 +446,7 @@ class Stack:
                 if len(self.cards) >= 3:
                     model.cards[-3].unhide()
             del model.cards[-1]
+            model.resetMovableRuns(len(model.cards))
         else:
             card.item.dtag(view.group)
             if unhide and view.can_hide_cards:
@@ -450,6 +458,7 @@ class Stack:
                         model.cards[-3].unhide()
             card_index = model.cards.index(card)
             model.cards.remove(card)
+            model.resetMovableRuns(card_index)
             if update_positions:
                 for c in model.cards[card_index:]:
                     view._position(c)
@@ -460,6 +469,32 @@ class Stack:
         self.is_filled = False
         return card
 
+    # Model-only versions of addCard(), insertCard() and removeCard().
+    # They do not touch the view at all, see Game.enterModelOnly(). {model}
+    def addCardModel(self, card):
+        self.cards.append(card)
+        self.resetMovableRuns(-1)
+        self.closeStack()
+        return card
+
+    def insertCardModel(self, card, position):
+        self.cards.insert(position, card)
+        self.resetMovableRuns(position)
+        self.closeStack()
+        return card
+
+    def removeCardModel(self, card=None):
+        assert len(self.cards) > 0
+        if card is None:
+            card = self.cards.pop()
+            self.resetMovableRuns(len(self.cards))
+        else:
+            i = self.cards.index(card)
+            del self.cards[i]
+            self.resetMovableRuns(i)
+        self.is_filled = False
+        return card
+
     # Get the top card {model}
     def getCard(self):
         if self.cards:
@@ -469,13 +504,88 @@ class Stack:
     # get the largest moveable pile {model} - uses canMoveCards()
     def getPile(self):
         if self.cap.max_move > 0:
-            cards = self.cards[-self.cap.max_move:]
+            n = self.cap.max_move
+            run = self.getMovableRun()
+            if run is not None and run < n:
+                # no longer pile can be moved
+                n = run
+            cards = self.cards[-n:] if n > 0 else []
             while len(cards) >= self.cap.min_move:
                 if self.canMoveCards(cards):
                     return cards
                 del cards[0]
         return None
 
+    # The number of top cards that are face up and, if the stack only
+    # moves sequences, in sequence: canMoveCards() is False for all
+    # longer piles. None if this is not known for the stack class (see
+    # _getMovableRunTest()). The run of each card is kept in a list
+    # which is extended when the run is asked for, and truncated when
+    # cards are added, removed, inserted or flipped (see
+    # resetMovableRuns()), so reading it is O(1) and a move only costs
+    # O(number of cards moved). {model}
+    def getMovableRun(self):
+        runs = self._movable_runs
+        if runs is None:
+            return None
+        cards = self.cards
+        n = len(cards)
+        if (len(runs) == n and self._movable_runs_cards is cards and
+                (n == 0 or (runs[-1] > 0) == cards[-1].face_up)):
+            return runs[-1] if n else 0
+        return self._updateMovableRuns()
+
+    def _updateMovableRuns(self):
+        cls = self.__class__
+        try:
+            test = _movable_run_tests[cls]
+        except KeyError:
+            test = _movable_run_tests[cls] = _getMovableRunTest(cls)
+        # else a cloned stack of the hints, which can't keep the runs
+        real = type(self) is cls
+        if test is None:
+            if real:
+                self._movable_runs = None
+            return None
+        cards = self.cards
+        runs = self._movable_runs
+        if self._movable_runs_cards is not cards:
+            runs = []
+            if real:
+                self._movable_runs = runs
+                self._movable_runs_cards = cards
+        n = len(runs)
+        if n > len(cards):
+            del runs[len(cards):]
+            n = len(cards)
+        elif n and (runs[-1] > 0) != cards[n-1].face_up:
+            # flipped without an atomic move
+            del runs[-1]
+            n -= 1
+        while n < len(cards):
+            c = cards[n]
+            if not c.face_up:
+                run = 0
+            elif n and runs[-1] and (
+                    test is True or test(self, [cards[n-1], c])):
+                run = runs[-1] + 1
+            else:
+                run = 1
+            runs.append(run)
+            n += 1
+        return runs[-1] if runs else 0
+
+    # The cards from position start on have changed. Adding, inserting
+    # and removing cards calls this; the atomic moves which flip or
+    # reorder cards call it themselves (see move.py). {model}
+    def resetMovableRuns(self, start=0):
+        runs = self._movable_runs
+        if runs:
+            if start < 0:
+                start = max(0, len(self.cards) + start)
+            if len(runs) > start:
+                del runs[start:]
+
     # Position the card on the canvas {view}
     def _position(self, card):
         x, y = self.getPositionFor(card)
@@ -509,12 +619,6 @@ class Stack:
     def updateModel(self, undo, flags):
         pass
 
-    # copy model data - see Hint.AClonedStack
-    def copyModel(self, clone):
-        clone.id = self.id
-        clone.game = self.game
-        clone.cap = self.cap
-
     def getRankDir(self, cards=None):
         if cards is None:
             cards = self.cards[-2:]
@@ -583,6 +687,48 @@ class Stack:
         # Do we accept receiving `cards' from `from_stack' ?
         return False
 
+    def getAcceptedCardFilter(self):
+        # Which cards may acceptsCards() accept as the first card ?
+        # Used by the hints to preselect the targets of a move (see
+        # MoveTargetIndex in hint.py). Returns (rank, test): the card
+        # must have that rank (any rank for ANY_RANK, none for NO_RANK)
+        # and pass test(card) if test is not None; or None if not known.
+        # This is derived from the acceptsCards() of the common stacks,
+        # subclasses with other rules may override it.
+        cls = self.__class__
+        if cls.acceptsCards in _SEQUENCE_ACCEPTS_CARDS:
+            seq = cls._isAcceptableSequence
+            if seq is SequenceStack_StackMethods._isAcceptableSequence:
+                seq = cls._isSequence
+        elif cls.acceptsCards is Yukon_AC_RowStack.acceptsCards:
+            seq = cls._isYukonSequence
+        elif cls.acceptsCards is OpenStack.acceptsCards:
+            seq = None
+        else:
+            return None
+        if cls.basicAcceptsCards is not Stack.basicAcceptsCards:
+            return None
+        cap = self.cap
+        if cap.max_accept < 1 or len(self.cards) >= cap.max_cards:
+            return (NO_RANK, None)
+        if not self.cards:
+            test = None
+            if cap.base_suit >= 0 or cap.base_color >= 0:
+                test = functools.partial(
+                    _matchesBase, cap.base_suit, cap.base_color)
+            return (cap.base_rank, test)
+        top = self.cards[-1]
+        if not top.face_up:
+            return (NO_RANK, None)
+        if seq is None:
+            return (ANY_RANK, None)
+        if seq not in _SEQUENCE_CARD_TESTS:
+            return None
+        test = _SEQUENCE_CARD_TESTS[seq]
+        if test is not None:
+            test = functools.partial(test, top)
+        return ((top.rank + cap.dir) % cap.mod, test)
+
     def canMoveCards(self, cards):
         # Can we move these cards when assuming they are our top-cards ?
         return False
@@ -1545,6 +1691,9 @@ class Stack:
     def _shadeStack(self):
         if not self.game.app.opt.shade_filled_stacks:
             return
+        if self.game.model_only:
+            # done in Game.rebuildView()
+            return
         #  if (self.CARD_XOFFSET != (0,) or
         #      self.CARD_YOFFSET != (0,)):
         #      return
@@ -2319,12 +2468,12 @@ class OpenStack(Stack):
         if not self.cards:
             for s in from_stacks:
                 if s is not self and s.cards:
-                    pile = s.getPile()
+                    pile = self.game.getTopPile(s)
                     if pile and self.acceptsCards(s, pile):
                         score = self.game.getQuickPlayScore(len(pile), s, self)
                         moves.append((score, -len(moves), len(pile), s, self))
         else:
-            pile1, pile2 = None, self.getPile()
+            pile1, pile2 = None, self.game.getTopPile(self)
             if pile2:
                 i = self._findCard(event)
                 if i >= 0:
@@ -3102,6 +3251,109 @@ class SuperMoveBO_RowStack(SuperMoveStack_StackMethods, BO_RowStack):
         return len(cards) <= self._getMaxMove(len(self.cards))
 
 
+# ************************************************************************
+# * For Stack.getAcceptedCardFilter(): the acceptsCards() methods that
+# * test the sequence of [top card] + cards, and what the sequence tests
+# * require of the top card and the first card besides the rank.
+# ************************************************************************
+
+_SEQUENCE_ACCEPTS_CARDS = (
+    SequenceStack_StackMethods.acceptsCards,
+    SuperMoveSS_RowStack.acceptsCards,
+    SuperMoveAC_RowStack.acceptsCards,
+    SuperMoveRK_RowStack.acceptsCards,
+    SuperMoveSC_RowStack.acceptsCards,
+    SuperMoveBO_RowStack.acceptsCards,
+)
+
+
+def _matchesBase(suit, color, card):
+    return ((suit < 0 or card.suit == suit) and
+            (color < 0 or card.color == color))
+
+
+def _isSameSuit(c1, c2):
+    return c1.suit == c2.suit
+
+
+def _isOtherSuit(c1, c2):
+    return c1.suit != c2.suit
+
+
+def _isSameColor(c1, c2):
+    return c1.color == c2.color
+
+
+def _isOtherColor(c1, c2):
+    return c1.color != c2.color
+
+
+_SEQUENCE_CARD_TESTS = {
+    AC_RowStack._isSequence: _isOtherColor,
+    SC_RowStack._isSequence: _isSameColor,
+    SS_RowStack._isSequence: _isSameSuit,
+    RK_RowStack._isSequence: None,
+    BO_RowStack._isSequence: _isOtherSuit,
+    Spider_AC_RowStack._isAcceptableSequence: None,
+    Spider_SS_RowStack._isAcceptableSequence: None,
+    Spider_SC_RowStack._isAcceptableSequence: None,
+    Spider_BO_RowStack._isAcceptableSequence: None,
+    Yukon_AC_RowStack._isYukonSequence: _isOtherColor,
+    Yukon_SS_RowStack._isYukonSequence: _isSameSuit,
+    Yukon_SC_RowStack._isYukonSequence: _isSameColor,
+    Yukon_RK_RowStack._isYukonSequence: None,
+    Yukon_BO_RowStack._isYukonSequence: _isOtherSuit,
+}
+
+
+# ************************************************************************
+# * For Stack.getMovableRun(): the canMoveCards() methods that only move
+# * face up cards, and those that also require a sequence, which is
+# * tested pair by pair with one of the _isSequence() methods below.
+# ************************************************************************
+
+_FACE_UP_CAN_MOVE_CARDS = (
+    OpenStack.canMoveCards,
+)
+
+_SEQUENCE_CAN_MOVE_CARDS = (
+    SequenceStack_StackMethods.canMoveCards,
+    FreeCell_AC_RowStack.canMoveCards,
+    FreeCell_SS_RowStack.canMoveCards,
+    FreeCell_RK_RowStack.canMoveCards,
+    SuperMoveSS_RowStack.canMoveCards,
+    SuperMoveAC_RowStack.canMoveCards,
+    SuperMoveRK_RowStack.canMoveCards,
+    SuperMoveSC_RowStack.canMoveCards,
+    SuperMoveBO_RowStack.canMoveCards,
+)
+
+# a sequence of these is a chain of valid pairs
+_PAIRWISE_SEQUENCES = (
+    AC_RowStack._isSequence,
+    SC_RowStack._isSequence,
+    SS_RowStack._isSequence,
+    RK_RowStack._isSequence,
+    BO_RowStack._isSequence,
+)
+
+_movable_run_tests = {}
+
+
+def _getMovableRunTest(cls):
+    # True if only face up cards are required, the _isSequence() method
+    # if also a sequence, or None if not known
+    if cls.canMoveCards in _FACE_UP_CAN_MOVE_CARDS:
+        if cls.basicCanMoveCards is Stack.basicCanMoveCards:
+            return True
+    elif cls.canMoveCards in _SEQUENCE_CAN_MOVE_CARDS:
+        if (cls._isMoveableSequence is
+                SequenceStack_StackMethods._isMoveableSequence and
+                cls._isSequence in _PAIRWISE_SEQUENCES):
+            return cls._isSequence
+    return None
+
+
 # ************************************************************************
 # * WasteStack (a helper stack for the Talon, e.g. in Klondike)
 # ************************************************************************
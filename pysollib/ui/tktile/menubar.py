@@ -650,6 +650,9 @@ class PysolMenubarTkCommon:
         menu.add_command(
             label=n_("&Demo"),
             command=self.mDemo, accelerator=m+"D")
+        menu.add_command(
+            label=n_("Fast-forward d&emo"),
+            command=self.mFastDemo)
         menu.add_command(
             label=n_("Demo (&all games)"),
             command=self.mMixedDemo)
@@ -1,3 +1,5 @@
+import threading
+import time
 import tkinter
 
 from pysollib.mygettext import _
@@ -6,6 +8,32 @@ from pysollib.tile.tkwidget import PysolSpinbox
 from pysollib.ui.tktile.tkconst import EVENT_HANDLED
 
 
+# how often the dialog looks at a running solver (in ms)
+SOLVER_POLL_INTERVAL = 50
+# seconds after the time budget to cancel a solver which overruns it
+SOLVER_DEADLINE_GRACE = 2
+
+
+# ************************************************************************
+# * The solver runs in a thread and must not touch Tk; its progress
+# * is collected here and shown by the dialog (see _pollSolver()).
+# ************************************************************************
+
+class SolverProgress:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._text = {}
+
+    def setText(self, **kw):
+        with self._lock:
+            self._text.update(kw)
+
+    def getText(self):
+        with self._lock:
+            text, self._text = self._text, {}
+        return text
+
+
 class BaseSolverDialog:
     def _ToggleShowProgressButton(self, *args):
         self.app.opt.solver_show_progress = self.progress_var.get()
@@ -23,9 +51,21 @@ class BaseSolverDialog:
     def _OnAssignToPreset(self, *args):
         self.app.opt.solver_preset = self.preset_var.get()
 
+    def _getTimeBudget(self):
+        try:
+            i = self.time_budget_var.get()
+        except Exception:
+            i = 0
+        return i
+
+    def _OnAssignToTimeBudget(self, *args):
+        self.app.opt.solver_time_budget = self._getTimeBudget()
+
     def __init__(self, parent, app, **kw):
         self.parent = parent
         self.app = app
+        self.solver = None
+        self.solver_thread = None
         title = _('%(app)s - FreeCell Solver') % {'app': TITLE}
         kw = self.initKw(kw)
         self._calc_MfxDialog().__init__(
@@ -77,6 +117,19 @@ class BaseSolverDialog:
         self.max_iters_var.trace_add('write', self._OnAssignToMaxIters)
         spin.grid(row=row, column=1, sticky='w', padx=2, pady=2)
 
+        #
+        row += 1
+        self.time_budget_var = tkinter.IntVar()
+        self.time_budget_var.set(self.app.opt.solver_time_budget)
+        self._calcToolkit().Label(
+            frame, text=_('Time budget (sec):'), anchor='w').grid(
+            row=row, column=0, sticky='ew', padx=2, pady=2)
+        spin = PysolSpinbox(frame, from_=0, to=3600,
+                            increment=5, textvariable=self.time_budget_var,
+                            fieldname=_('Time budget (sec):'))
+        self.time_budget_var.trace_add('write', self._OnAssignToTimeBudget)
+        spin.grid(row=row, column=1, sticky='w', padx=2, pady=2)
+
         #
         row += 1
         self.progress_var = tkinter.BooleanVar()
@@ -123,19 +176,29 @@ class BaseSolverDialog:
         #
         focus = self.createButtons(bottom_frame, kw)
         self.start_button = self.buttons[0]
+        self.start_text = self.start_button.cget('text')
+        self.start_underline = self.start_button.cget('underline')
         self.play_button = self.buttons[1]
         self._reset()
         self.connectGame(self.app.game)
+        global solver_dialog
+        solver_dialog = self
         self.mainloop(focus, kw.timeout, transient=False)
 
     def mDone(self, button):
         if button == 0:
-            self.startSolving()
+            if self.solver:
+                self.cancelSolving()
+            elif not (self.solver_thread and self.solver_thread.is_alive()):
+                # (a cancelled solve may still be running)
+                self.startSolving()
         elif button == 1:
             self.startPlay()
         elif button == 2:
+            self.cancelSolving()
             self.app.menubar.mNewGame()
         elif button == 3:
+            self.cancelSolving()
             global solver_dialog
             solver_dialog = None
             self.destroy()
@@ -161,26 +224,87 @@ class BaseSolverDialog:
         self.top.update_idletasks()
 
     def reset(self):
+        # the position has changed
+        self.cancelSolving()
         self.play_button.config(state='disabled')
 
     def startSolving(self):
-        from pysollib.mygettext import ungettext
-
         self._reset()
         game = self.app.game
-        solver = game.Solver_Class(game, self)  # create solver instance
-        game.solver = solver
+        # create solver instance
+        solver = game.Solver_Class(game, SolverProgress())
+        solver.error = None
         preset = self.preset_var.get()
         max_iters = self._getMaxIters()
         progress = self.app.opt.solver_show_progress
         iters_step = self.app.opt.solver_iterations_output_step
+        budget = self._getTimeBudget()
         solver.config(preset=preset, max_iters=max_iters, progress=progress,
-                      iters_step=iters_step)
+                      iters_step=iters_step, time_budget=budget)
+        # the solver returns its best result when the time is up; this
+        # is a last resort
+        self.solver_deadline = None
+        if budget > 0:
+            self.solver_deadline = time.time() + budget + SOLVER_DEADLINE_GRACE
+        self.solver_timed_out = False
+        self.solver = solver
+        self.solver_thread = threading.Thread(
+            target=self._runSolver, args=(solver, solver.calcBoardString()))
+        self.solver_thread.daemon = True
+        self.solver_thread.start()
+        self.start_button.config(text=_('Cancel'), underline=-1)
+        self.result_label['text'] = _('Solving...')
+        self.top.after(SOLVER_POLL_INTERVAL, self._pollSolver, solver)
+
+    def _runSolver(self, solver, board):
+        # the solver thread
         try:
-            solver.computeHints()
+            solver.solveBoard(board)
         except RuntimeError:
-            self.result_label['text'] = _('Solver not found in the PATH')
+            solver.error = _('Solver not found in the PATH')
+
+    def _pollSolver(self, solver):
+        if solver is not self.solver:
+            # cancelled
+            return
+        text = solver.dialog.getText()
+        if text:
+            self.setText(**text)
+        if self.solver_thread.is_alive():
+            if (self.solver_deadline is not None and
+                    time.time() > self.solver_deadline):
+                self.solver_timed_out = True
+                self.cancelSolving()
+                return
+            self.top.after(SOLVER_POLL_INTERVAL, self._pollSolver, solver)
+            return
+        self.solver = None
+        self.start_button.config(text=self.start_text,
+                                 underline=self.start_underline)
+        self.showSolution(solver)
+
+    def cancelSolving(self):
+        solver = self.solver
+        if solver is None:
             return
+        self.solver = None
+        solver.cancel()
+        self.start_button.config(text=self.start_text,
+                                 underline=self.start_underline)
+        if self.solver_timed_out:
+            self.result_label['text'] = _('Time budget exceeded')
+        else:
+            self.result_label['text'] = _('Solving cancelled')
+
+    def showSolution(self, solver):
+        from pysollib.mygettext import ungettext
+
+        if solver.error:
+            self.result_label['text'] = solver.error
+            return
+        if solver.game is not self.app.game:
+            return
+        solver.game.solver = solver
         hints_len = len(solver.hints)-1
         if hints_len > 0:
             if solver.solver_state == 'intractable':
@@ -195,10 +319,13 @@ class BaseSolverDialog:
             self.result_label['text'] = t
             self.play_button.config(state='normal')
         else:
-            self.result_label['text'] = \
-                (_('I could not solve this game.')
-                 if solver.solver_state == 'unsolved'
-                 else _('Iterations count exceeded (Intractable)'))
+            if solver.solver_state == 'unsolved':
+                t = _('I could not solve this game.')
+            elif solver.options['time_budget'] > 0:
+                t = _('Time budget exceeded (Intractable)')
+            else:
+                t = _('Iterations count exceeded (Intractable)')
+            self.result_label['text'] = t
             self.play_button.config(state='disabled')
 
     def startPlay(self):
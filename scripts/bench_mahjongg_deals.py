@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# Written by Shlomi Fish, under the MIT Expat License.
+
+# Create solvable deals (see pysollib/games/mahjongg/dealer.py) for all
+# layouts of mahjongg1.py, mahjongg2.py and mahjongg3.py, check that
+# the removal order of each deal can be played, and report the time
+# per deal.
+#
+# Usage: python scripts/bench_mahjongg_deals.py [DEALS_PER_LAYOUT]
+
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, ".")
+
+from pysollib.headless.app import HeadlessApp  # noqa: E402
+from pysollib.pysolrandom import construct_random  # noqa: E402
+
+LAYOUTS = ('mahjongg1.py', 'mahjongg2.py', 'mahjongg3.py')
+
+
+def getLayoutIds():
+    ids = []
+    dirname = os.path.join('pysollib', 'games', 'mahjongg')
+    for filename in LAYOUTS:
+        with open(os.path.join(dirname, filename)) as fh:
+            source = fh.read()
+        ids += [int(m) for m in re.findall(r'^r\((\d+)', source, re.M)]
+    return ids
+
+
+def isFree(dealer, occupied, i):
+    if any(occupied[j] for j in dealer.above[i]):
+        return False
+    return not (any(occupied[j] for j in dealer.left[i]) and
+                any(occupied[j] for j in dealer.right[i]))
+
+
+def checkDeal(game, positions, order, deal):
+    # play the removal order on the dealt tiles
+    dealer = game.dealer
+    cards = dict(zip(positions, deal))
+    occupied = [False] * len(dealer.rows)
+    for i in positions:
+        occupied[i] = True
+    for a, b in order:
+        if not (occupied[a] and occupied[b] and
+                isFree(dealer, occupied, a) and
+                isFree(dealer, occupied, b) and
+                game.cardsMatch(cards[a], cards[b])):
+            return False
+        occupied[a] = occupied[b] = False
+    return not any(occupied)
+
+
+def main():
+    ndeals = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    app = HeadlessApp()
+    total_time = total_tries = failed = 0
+    ids = getLayoutIds()
+    for game_id in ids:
+        game = app.runGame(game_id, random=construct_random('1'))
+        dealer = game.dealer
+        positions = list(range(len(game.s.rows)))
+        cards = [r.cards[0] for r in game.s.rows]
+        tries = 0
+        t = time.time()
+        deals = []
+        for seed in range(ndeals):
+            random = construct_random(str(seed + 1))
+            order = None
+            while order is None and tries < ndeals * dealer.MAX_TRIES:
+                tries += 1
+                order = dealer.getRemovalOrder(positions, random)
+            if order is None:
+                failed += 1
+                continue
+            deals.append((order, dealer.dealPairs(
+                cards, positions, order, random, game.getMatchKey)))
+        t = time.time() - t
+        for order, deal in deals:
+            if not checkDeal(game, positions, order, deal):
+                print('%d %s: bad deal' % (game_id, game.gameinfo.name))
+                return 1
+        total_time += t
+        total_tries += tries
+        print('%6d %-36s %3d tiles %5.1f tries %7.2f ms/deal' % (
+            game_id, game.gameinfo.name, len(positions),
+            float(tries) / ndeals, t * 1000 / ndeals))
+    print('%d layouts, %d deals in %.2f sec, %.1f tries/deal, %d failed' % (
+        len(ids), len(ids) * ndeals, total_time,
+        float(total_tries) / (len(ids) * ndeals), failed))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# Written by Shlomi Fish, under the MIT Expat License.
+
+# Compare the old string based snapshot hash (Game.getSnapshotHash) with
+# the incremental Zobrist hash (Game.getSnapshot) on a long Spider demo.
+#
+# The demo plays NUM_GAMES deals of Spider with the headless engine, and
+# the moves it made are then replayed (the atomic moves of move.py)
+# twice per deal, taking a snapshot after each move:
+#
+#   - string hash: getSnapshotHash(), with the hash updates of the
+#     atomic moves turned off
+#   - zobrist hash: getSnapshot(), with the hash kept up to date by the
+#     atomic moves (Game.updateSnapshotHash)
+#
+# The time of a replay without any hashing is taken off both.
+#
+# Usage: python scripts/bench_snapshot_hash.py [NUM_GAMES] [GAME_ID]
+
+import sys
+import time
+
+sys.path.insert(0, ".")
+
+from pysollib.headless.app import HeadlessApp  # noqa: E402
+from pysollib.headless.tournament import playDemoGame  # noqa: E402
+
+
+def undoAll(game, history):
+    game.moves.state = game.S_UNDO
+    for move in reversed(history):
+        for atomic_move in reversed(move):
+            atomic_move.undo(game)
+
+
+def replay(game, history, get_snapshot):
+    # returns the time and the snapshots
+    snapshots = []
+    game.moves.state = game.S_REDO
+    t = time.time()
+    for move in history:
+        for atomic_move in move:
+            atomic_move.redo(game)
+        snapshots.append(get_snapshot())
+    t = time.time() - t
+    undoAll(game, history)
+    return t, snapshots
+
+
+def benchGame(app, game_id, seed):
+    # returns (moves, distinct positions, string time, zobrist time)
+    playDemoGame(app, game_id, seed)
+    game = app.game
+    history = game.moves.history[:game.moves.index]
+    undoAll(game, history)
+    game.updateSnapshotHash = lambda *args: None
+    try:
+        t_none, sn_none = replay(game, history, lambda: None)
+        t_str, sn_str = replay(game, history, game.getSnapshotHash)
+    finally:
+        del game.updateSnapshotHash
+    game.resetSnapshotHash()
+    t_zob, sn_zob = replay(game, history, game.getSnapshot)
+    game.moves.state = game.S_PLAY
+    assert game.getSnapshot() == game.calcSnapshotHash()
+    assert len(set(sn_str)) == len(set(sn_zob))
+    return len(history), len(set(sn_zob)), t_str - t_none, t_zob - t_none
+
+
+def main():
+    ngames = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    game_id = int(sys.argv[2]) if len(sys.argv) > 2 else 11
+    app = HeadlessApp()
+    nmoves = npositions = 0
+    t_str = t_zob = 0.0
+    for seed in range(1, ngames + 1):
+        m, p, ts, tz = benchGame(app, game_id, seed)
+        nmoves += m
+        npositions += p
+        t_str += ts
+        t_zob += tz
+    print("%d games, %d moves, %d distinct positions" %
+          (ngames, nmoves, npositions))
+    print("string hash:  %8.3f sec  %8.2f usec/move" %
+          (t_str, t_str * 1e6 / nmoves))
+    print("zobrist hash: %8.3f sec  %8.2f usec/move" %
+          (t_zob, t_zob * 1e6 / nmoves))
+    print("speedup: %.1fx" % (t_str / t_zob))
+
+
+if __name__ == "__main__":
+    main()
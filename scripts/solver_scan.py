@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# Written by Shlomi Fish, under the MIT Expat License.
+
+# Find solvable deals of the games which have a solver.
+#
+# Usage:
+#
+#   python scripts/solver_scan.py -o klondike.txt -g 2 --start-seed 32000 \
+#       --end-seed 42000
+#   python scripts/solver_scan.py -o klondike.txt --list-solvable 2
+#   python scripts/solver_scan.py -o klondike.txt --write-index 2 \
+#       pysollib/games/solvable_seeds/klondike.seeds
+#
+# Without -g all games with a solver are scanned. Running the same
+# command again resumes an interrupted scan.
+
+import argparse
+import sys
+import time
+
+sys.path.insert(0, ".")
+
+from pysollib.headless.app import HeadlessApp  # noqa: E402
+from pysollib.headless.solverscan import \
+        getSolvableSeeds, scanGames, writeSolvableSeedIndex  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Scan deals with the fc-solve/black-hole-solve solvers')
+    parser.add_argument('-o', '--output', required=True,
+                        help='results file (appended to)')
+    parser.add_argument('-g', '--game', type=int, action='append',
+                        help='game id (may be repeated)')
+    parser.add_argument('--start-seed', type=int, default=32000)
+    parser.add_argument('--end-seed', type=int, default=33000,
+                        help='last seed + 1')
+    parser.add_argument('--max-iters', type=int, default=100000)
+    parser.add_argument('--preset', default=None)
+    parser.add_argument('--time-budget', type=float, default=0,
+                        help='seconds per deal (instead of --max-iters)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='number of processes (default: all CPUs)')
+    parser.add_argument('--list-solvable', type=int, metavar='GAME_ID',
+                        help='print the solvable seeds found for a game')
+    parser.add_argument('--write-index', nargs=2,
+                        metavar=('GAME_ID', 'SEEDS_FILE'),
+                        help='write the solvable seeds found for a game '
+                        'to a seed index (see seedindex.py)')
+    args = parser.parse_args()
+
+    if args.list_solvable is not None:
+        for seed in getSolvableSeeds(args.output, args.list_solvable):
+            print(seed)
+        return 0
+    if args.write_index:
+        game_id, filename = int(args.write_index[0]), args.write_index[1]
+        n = writeSolvableSeedIndex(args.output, game_id, filename)
+        print('%d seeds written to %s' % (n, filename))
+        return 0
+
+    # load the games
+    games_for_solver = HeadlessApp().getGamesForSolver()
+    game_ids = args.game or games_for_solver
+    for game_id in game_ids:
+        if game_id not in games_for_solver:
+            print('game %d has no solver' % game_id, file=sys.stderr)
+            return 1
+    seeds = range(args.start_seed, args.end_seed)
+    counts = {}
+
+    def progress(result):
+        counts[result[2]] = counts.get(result[2], 0) + 1
+        n = sum(counts.values())
+        if n % 100 == 0:
+            print('%d deals: %s' % (n, ', '.join(
+                '%s %d' % kv for kv in sorted(counts.items()))))
+
+    t = time.time()
+    try:
+        n = scanGames(args.output, game_ids, seeds, processes=args.jobs,
+                      max_iters=args.max_iters, preset=args.preset,
+                      callback=progress, time_budget=args.time_budget)
+    except RuntimeError as ex:
+        print('solver failed (is it in the PATH?): %s' % ex,
+              file=sys.stderr)
+        return 1
+    t = time.time() - t
+    print('%d deals scanned in %.1f sec (%.1f deals/sec)' %
+          (n, t, n / t if t else 0))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# Written by Shlomi Fish, under the MIT Expat License.
+
+# Measure how strong and how fast the autopilot is.
+#
+# Usage:
+#
+#   python scripts/tournament.py -o before.csv -g 2 -g 8 --end-seed 100
+#   python scripts/tournament.py -o after.json --all --end-seed 20
+#   python scripts/tournament.py --compare before.csv after.csv
+#
+# Every deal is played by the fast-forward demo. --compare exits
+# with status 1 if the new run won fewer games than the old one.
+
+import argparse
+import sys
+import time
+
+sys.path.insert(0, ".")
+
+from pysollib.headless.app import HeadlessApp  # noqa: E402
+from pysollib.headless.tournament import \
+        compareResults, readResults, runTournament, \
+        summarizeResults, writeResults  # noqa: E402
+
+
+def compare(old_filename, new_filename):
+    pairs, old_wins, new_wins = compareResults(
+        readResults(old_filename), readResults(new_filename))
+    print('%6s %-24s %15s %13s %17s %17s' % (
+        'id', 'name', 'win rate', 'moves', 'hint p50 (ms)',
+        'hint p99 (ms)'))
+    for game_id, name, old, new in pairs:
+        print('%6d %-24.24s %6.1f%% %6.1f%% %6.1f %6.1f %8.3f %8.3f '
+              '%8.3f %8.3f' % (
+                  game_id, name, old['win_rate'] * 100,
+                  new['win_rate'] * 100, old['moves'], new['moves'],
+                  old['hint_p50'], new['hint_p50'],
+                  old['hint_p99'], new['hint_p99']))
+    print('wins: %d -> %d' % (old_wins, new_wins))
+    return int(new_wins < old_wins)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Play deals with the autopilot and measure it')
+    parser.add_argument('-o', '--output',
+                        help='results file (.csv or .json)')
+    parser.add_argument('-g', '--game', type=int, action='append',
+                        help='game id (may be repeated)')
+    parser.add_argument('--all', action='store_true',
+                        help='play all games')
+    parser.add_argument('--start-seed', type=int, default=1)
+    parser.add_argument('--end-seed', type=int, default=101,
+                        help='last seed + 1')
+    parser.add_argument('--level', type=int, default=2,
+                        help='hint level of the demo')
+    parser.add_argument('--lookahead', type=int, default=0, metavar='MS',
+                        help='let the demo look ahead (see demo_lookahead)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='number of processes (default: all CPUs)')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'),
+                        help='compare two results files')
+    args = parser.parse_args()
+
+    if args.compare:
+        return compare(*args.compare)
+    if not args.output or not (args.game or args.all):
+        parser.error('-o and -g or --all are required')
+
+    app = HeadlessApp()
+    game_ids = args.game or list(app.gdb.getGamesIdSortedById())
+    for game_id in game_ids:
+        if app.gdb.get(game_id) is None:
+            print('unknown game %d' % game_id, file=sys.stderr)
+            return 1
+    seeds = list(range(args.start_seed, args.end_seed))
+    count = [0]
+
+    def progress(result):
+        count[0] += 1
+        if count[0] % 100 == 0:
+            print('%d deals played' % count[0])
+
+    t = time.time()
+    results = runTournament(game_ids, seeds, processes=args.jobs,
+                            level=args.level, demo_lookahead=args.lookahead,
+                            callback=progress)
+    t = time.time() - t
+    rows = summarizeResults(app, results)
+    writeResults(args.output, rows)
+    wins = sum(row['wins'] for row in rows)
+    print('%d deals played in %.1f sec (%.1f deals/sec), %d won' %
+          (len(results), t, len(results) / t if t else 0, wins))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
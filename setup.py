@@ -95,6 +95,7 @@ kw = {
                  'pysollib.games.special',
                  'pysollib.games.mahjongg',
                  'pysollib.games.solvable_seeds'],
+    'package_data': {'pysollib.games.solvable_seeds': ['*.seeds']},
     'data_files': data_files,
     }
 
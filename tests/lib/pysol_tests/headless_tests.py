@@ -0,0 +1,332 @@
+# Written by Shlomi Fish, under the MIT Expat License.
+
+# The tests of the headless engine. The toolkit is selected when
+# pysollib.pysoltk is first imported, so this module must be the first
+# to import it: it is run in a fresh interpreter by test_headless.py.
+
+import os
+import sys
+import tempfile
+import unittest
+
+import pysollib.headless  # noqa: F401
+from pysollib.headless.app import HeadlessApp
+from pysollib.headless.solverscan import solveDeal
+from pysollib.headless.tournament import playDemoGame
+from pysollib.hint import DeadlockCheck, STUCK_LOST, STUCK_UNKNOWN, \
+        STUCK_WINNABLE
+from pysollib.pysolrandom import construct_random
+
+
+def play(game, hint):
+    score, pos, ncards, from_stack, to_stack, color, forced = hint
+    if ncards == 0:
+        game.dealCards()
+    elif from_stack is to_stack:
+        from_stack.flipMove()
+    else:
+        from_stack.moveMove(ncards, to_stack, frames=0)
+    game.finishMove()
+
+
+def isBlocked(stack):
+    # a mahjongg tile, from its blockmap
+    bm = stack.blockmap
+    return bool([s for s in bm.above if s.cards] or (
+        [s for s in bm.left if s.cards] and [s for s in bm.right if s.cards]))
+
+
+class HeadlessTests(unittest.TestCase):
+    def setUp(self):
+        self.app = HeadlessApp()
+
+    def tearDown(self):
+        self.app.freeGame()
+
+    def _runGame(self, id, seed="1"):
+        return self.app.runGame(id, random=construct_random(seed))
+
+    def _idle(self, game):
+        # run the idle tasks of the hint prefetch
+        while game.hint_prefetch.timer:
+            self.app.top.update()
+
+    def test_klondike(self):
+        game = self._runGame(2)
+        for i in range(20):
+            hints = game.getHints(2)
+            if not hints:
+                break
+            play(game, hints[0])
+        # TEST
+        self.assertTrue(game.moves.index > 0, 'hints were played')
+        # TEST
+        self.assertEqual(game.getSnapshot(), game.calcSnapshotHash(),
+                         'snapshot hash is in sync')
+
+    def test_save_load(self):
+        game = self._runGame(2)
+        play(game, game.getHints(2)[0])
+        fd, filename = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            self.app.saveGame(filename)
+            sn = game.getSnapshot()
+            game = self.app.loadGame(filename)
+        finally:
+            os.remove(filename)
+        # TEST
+        self.assertEqual((game.id, game.getSnapshot()), (2, sn),
+                         'save/load roundtrip')
+        # TEST
+        self.assertEqual([m for m in ("tkinter", "PIL") if m in sys.modules],
+                         [], 'no GUI toolkit loaded')
+
+    def test_hint_prefetch(self):
+        game = self._runGame(2)
+        play(game, game.getHints(2)[0])
+        self._idle(game)
+        # TEST
+        self.assertEqual(game.hints.list,
+                         game.getHintClass()(game, 0).getHints(),
+                         'hints prefetched while idle')
+
+    def test_legal_moves(self):
+        game = self._runGame(2)
+        play(game, game.getHints(2)[0])
+        moves = list(game.iterLegalMoves())
+        for h in game.getHints(0):
+            # TEST
+            self.assertIn(h[2:5], moves, 'a hint is a legal move')
+        for n, f, t in moves:
+            # TEST
+            self.assertTrue(n == 0 or f is t or
+                            t.acceptsCards(f, f.cards[-n:]),
+                            'a legal move is accepted')
+
+    def test_lookahead_hints(self):
+        game = self._runGame(2)
+        play(game, game.getHints(2)[0])
+        sn = game.getSnapshot()
+        hints = game.getHints(4)
+        # TEST
+        self.assertEqual((game.getSnapshot(), game.moves.current), (sn, []),
+                         'the search takes its moves back')
+        # TEST
+        self.assertEqual(sorted(h[2:5] for h in hints),
+                         sorted(h[2:5] for h in game.getHints(2)),
+                         'the demo hints are ranked')
+
+    def test_model_only(self):
+        game = self._runGame(2)
+        sn = game.getSnapshot()
+        old_model_only = game.enterModelOnly()
+        score, pos, ncards, from_stack, to_stack = game.getHints(0)[0][:5]
+        from_stack.moveMove(ncards, to_stack, frames=0)
+        game.finishMove()
+        # TEST
+        self.assertEqual((game.moves.index, game.moves.current), (1, []),
+                         'model-only moves are finished')
+        game.undo()
+        game.leaveModelOnly(old_model_only)
+        # TEST
+        self.assertEqual(game.getSnapshot(), sn, 'and can be undone')
+        # TEST
+        self.assertFalse(game.model_only or game.model_search)
+
+    def test_deadlock_check(self):
+        game = self._runGame(2)
+        sn = game.getSnapshot()
+        for state in DeadlockCheck(game, 10).iterCheck():
+            pass
+        # TEST
+        self.assertEqual(state, STUCK_WINNABLE)
+        # TEST
+        self.assertEqual(game.getSnapshot(), sn)
+        # TEST
+        self.assertEqual(game.calcSnapshotHash(), sn)
+        # Trumps Row: the search redeals with empty rows
+        game = self._runGame(13169)
+        game.stopHintPrefetch()
+        sn = game.getSnapshot()
+        for state in DeadlockCheck(game, 0.5).iterSearch():
+            pass
+        # TEST
+        self.assertIn(state, (STUCK_WINNABLE, STUCK_LOST, STUCK_UNKNOWN))
+        # TEST
+        self.assertEqual(game.getSnapshot(), sn)
+
+    def test_tournament_game(self):
+        result = playDemoGame(self.app, 2, 3)
+        # TEST
+        self.assertTrue(result[2], 'won')
+        # TEST
+        self.assertTrue(result[3] > 0, 'moves')
+        # TEST
+        self.assertTrue(len(result[5]) > 0, 'the moves played')
+        # TEST
+        self.assertIsNone(self.app.game.demo, 'the demo is over')
+
+    def test_fast_demo(self):
+        game = self._runGame(2)
+        game.startDemo(mixed=0, fast=True)
+        self.app.top.update()
+        moves = game.moves.index
+        game.demo.keypress = "x"
+        self.app.top.update()
+        # TEST
+        self.assertEqual(moves, game.FAST_DEMO_MOVES)
+        # TEST
+        self.assertIsNone(game.demo, 'a key stops the demo')
+
+    def test_mahjongg_free_tiles(self):
+        game = self._runGame(5001)
+        for i in range(10):
+            play(game, game.getHints(0)[0])
+        for i in range(4):
+            game.undo()
+        for r in game.s.rows:
+            # TEST
+            self.assertEqual(game.free_tiles.isBlocked(r), isBlocked(r))
+        # TEST
+        self.assertEqual(game.free_tiles.getFreeStacks(),
+                         [r for r in game.s.rows
+                          if r.cards and not isBlocked(r)])
+
+    def test_mahjongg_removal_order(self):
+        game = self._runGame(5082)
+        order = game.dealer.findRemovalOrder(list(range(len(game.s.rows))),
+                                             construct_random("2"))
+        old_state = game.enterState(game.S_FILL)
+        for a, b in order:
+            # TEST
+            self.assertTrue(game.free_tiles.isFree(game.s.rows[a]) and
+                            game.free_tiles.isFree(game.s.rows[b]),
+                            'the tiles of a pair are free')
+            game.moveMove(1, game.s.rows[a], game.s.talon, frames=0)
+            game.moveMove(1, game.s.rows[b], game.s.talon, frames=0)
+        game.leaveState(old_state)
+        # TEST
+        self.assertEqual(len(game.s.talon.cards), 144)
+
+    def test_mahjongg_retried_deal(self):
+        self.app.opt.mahjongg_create_solvable = 2
+        game = self._runGame(5002)
+        dealer = game.dealer
+        getRemovalOrder, tries = dealer.getRemovalOrder, []
+
+        def failingRemovalOrder(positions, random):
+            # the first tries get stuck
+            tries.append(positions)
+            if len(tries) <= 3 * dealer.MAX_TRIES:
+                return None
+            return getRemovalOrder(positions, random)
+
+        dealer.getRemovalOrder = failingRemovalOrder
+        dealer.MAX_TRIES = 2
+        self.app.newGame(random=construct_random("2"))
+        # TEST
+        self.assertEqual(len(tries), 3 * dealer.MAX_TRIES + 1,
+                         'the dealer tries again')
+        # TEST
+        self.assertEqual(game.mahjongg_solver.solve(10.0), 'solved',
+                         'the deal is solvable')
+
+    def test_mahjongg_solver(self):
+        self.app.opt.mahjongg_create_solvable = 2
+        game = self._runGame(5002)
+        for state in DeadlockCheck(game, 10.0).iterCheck():
+            pass
+        # TEST
+        self.assertEqual(state, STUCK_WINNABLE)
+        # TEST
+        self.assertTrue(game.getHints(2)[0][0] >=
+                        game.Hint_Class.SCORE_WINNING,
+                        'the winning pair is hinted')
+
+    def test_mahjongg_hint_prefetch(self):
+        self.app.opt.mahjongg_create_solvable = 2
+        game = self._runGame(5002)
+        game.stopHintPrefetch()
+        winning = game.Hint_Class.SCORE_WINNING
+        hints = game.getHintClass()(game, 0).getHints()
+        # TEST
+        self.assertEqual(game.mahjongg_solver.solution, {},
+                         'getHints() does not solve')
+        # TEST
+        self.assertTrue(max(h[0] for h in hints) < winning)
+        game.startHintPrefetch(stuck_check=False)
+        self._idle(game)
+        # TEST
+        self.assertTrue(game.hints.list[0][0] >= winning,
+                        'the prefetch solves')
+        # TEST
+        self.assertTrue(game.getHints(0)[0][0] >= winning)
+
+    def test_mahjongg_demo(self):
+        self.app.opt.mahjongg_create_solvable = 2
+        game = self._runGame(5002, "7")
+        game.stopHintPrefetch()
+        hints = game.getHints(2)
+        # TEST
+        self.assertTrue(hints[0][0] >= game.Hint_Class.SCORE_WINNING,
+                        'the demo hints are solved')
+        result = playDemoGame(self.app, 5002, 7)
+        # TEST
+        self.assertTrue(self.app.game.mahjongg_solver.solution,
+                        'the demo uses the solver')
+        # TEST
+        self.assertTrue(result[2], 'won')
+
+    def test_shisensho_connections(self):
+        game = self._runGame(11015)
+        for i in range(10):
+            stacks = [r for r in game.s.rows if r.cards]
+            pairs = [(r, t) for r in stacks for t in stacks
+                     if r.id < t.id and r.acceptsCards(t, t.cards)]
+            # TEST
+            self.assertEqual(game.free_tiles.getPairs(), pairs)
+            # TEST
+            self.assertTrue(pairs, 'there are pairs left')
+            pairs[-1][0].moveMove(1, pairs[-1][1], frames=0)
+            game.finishMove()
+
+    def test_golf_solver(self):
+        game = self._runGame(36, "2")
+        solver = game.getPositionSolver()
+        # TEST
+        self.assertEqual(solver.solve(10.0), 'solved')
+        for move in solver.getSolution(solver.getPosition()):
+            ncards, from_stack, to_stack = solver.getMoveStacks(move)
+            play(game, (0, 0, ncards, from_stack, to_stack, None, None))
+        # TEST
+        self.assertTrue(game.isGameWon())
+        # TEST
+        self.assertEqual(solveDeal(self.app, 38, 2)[2], 'solved')
+
+    def _winGolf(self):
+        game = self._runGame(36, "2")
+        solver = game.getPositionSolver()
+        solver.solve(10.0)
+        for move in solver.getSolution(solver.getPosition()):
+            ncards, from_stack, to_stack = solver.getMoveStacks(move)
+            play(game, (0, 0, ncards, from_stack, to_stack, None, None))
+        return game
+
+    def test_check_for_win(self):
+        game = self._winGolf()
+        # TEST
+        self.assertEqual(game.getWinStatus()[:2], (True, 2), 'perfect')
+        # TEST
+        self.assertTrue(game.checkForWin(), 'no win dialog')
+        # TEST
+        self.assertTrue(game.finished)
+        game = self._winGolf()
+        game.stats.hints = 1
+        # TEST
+        self.assertEqual(game.getWinStatus()[:2], (True, 0))
+        # TEST
+        self.assertTrue(game.checkForWin(), 'no dialog for a game '
+                        'won with hints')
+        # TEST
+        self.assertTrue(game.finished)
@@ -0,0 +1,26 @@
+# Written by Shlomi Fish, under the MIT Expat License.
+
+import os
+import subprocess
+import sys
+import unittest
+
+# the tests of the headless engine are in headless_tests.py; the toolkit
+# is selected when pysollib.pysoltk is first imported, so they run in a
+# fresh interpreter
+TESTS = __name__.rsplit('.', 1)[0] + '.headless_tests'
+TOP_DIR = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+
+class HeadlessTests(unittest.TestCase):
+    def test_headless_engine(self):
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(
+            [TOP_DIR, os.path.join(TOP_DIR, 'tests', 'lib')] +
+            ([env['PYTHONPATH']] if env.get('PYTHONPATH') else []))
+        p = subprocess.run([sys.executable, '-m', 'unittest', TESTS],
+                           cwd=TOP_DIR, env=env, stdout=subprocess.PIPE,
+                           stderr=subprocess.STDOUT)
+        # TEST
+        self.assertEqual(p.returncode, 0, p.stdout.decode('utf-8'))
@@ -1,9 +1,69 @@
 # Written by Shlomi Fish, under the MIT Expat License.
 
+import time
 import unittest
 
+import pysollib.stack
 from pysollib.acard import AbstractCard
-from pysollib.hint import Base_Solver_Hint
+from pysollib.hint import AbstractHint, Base_Solver_Hint, \
+        FreeCellSolverOutputParser, FreeCellSolver_Hint
+from pysollib.mfxutil import Struct
+
+from .test_scorpion_canMove import MockGame
+
+
+FCS_OUTPUT = b'''Iteration: 99
+Depth: 4
+Stored-States: 120
+Iteration: 100
+Depth: 5
+Stored-States: 121
+-=-=-=-=-=-=-=-=-=-=-=-
+
+Move a card from stack 3 to the foundations
+
+====================
+
+Move 2 cards from stack 1 to freecell 0
+
+====================
+
+Move the sequence on top of Stack 5 to the foundations
+
+Total number of states checked is 1234.\r
+This scan generated 2345 states.
+'''
+
+
+class MockSolverDialog:
+    def __init__(self):
+        self.text = {}
+
+    def setText(self, **kw):
+        self.text.update(kw)
+
+
+class RoundsSolver(Base_Solver_Hint):
+    # a solver which can't be resumed: checks RATE iterations per
+    # second, and solves the board after solve_iters of them
+    RATE = 100000
+
+    def __init__(self, solve_iters, time_budget):
+        game = Struct(app=Struct(getSolverCache=lambda: None))
+        Base_Solver_Hint.__init__(self, game, MockSolverDialog(),
+                                  base_rank=0)
+        self.solve_iters = solve_iters
+        self.config(time_budget=time_budget)
+        self.rounds = []
+
+    def computeSolution(self, board):
+        max_iters = self.options['max_iters']
+        self.rounds.append(max_iters)
+        time.sleep(min(max_iters, self.solve_iters) / self.RATE)
+        if max_iters >= self.solve_iters:
+            self.solver_state, self.hints = 'solved', [[1, None, None], None]
+        else:
+            self.solver_state, self.hints = 'intractable', [None]
 
 
 class HintTests(unittest.TestCase):
@@ -20,3 +80,81 @@ class HintTests(unittest.TestCase):
         # TEST
         self.assertEqual(got, '8D', 'card2str2 works')
         # diag('got == ' + got)
+
+    def test_cloned_stack(self):
+        game = MockGame()
+        stack = game.rows[0]
+        card, other = (AbstractCard(1000+r, 0, 1, r, game) for r in (7, 6))
+        card.face_up = other.face_up = True
+        cards = [card]
+        h = AbstractHint(game, 0)
+        clone = h.ClonedStack(stack, stackcards=cards)
+        # TEST
+        self.assertTrue(isinstance(clone, pysollib.stack.Yukon_SS_RowStack))
+        # TEST
+        self.assertTrue(clone.cards is cards and clone.cap is stack.cap,
+                        'the cards are shared')
+        # TEST
+        self.assertTrue(clone.acceptsCards(game.rows[1], [other]))
+        clone.removeCardModel()
+        # TEST
+        self.assertEqual((len(cards), len(clone.cards)), (1, 0),
+                         'the cards are copied on write')
+        h.reset()
+        # TEST
+        self.assertTrue(h.ClonedStack(stack, stackcards=[]) is clone,
+                        'the clones are used again')
+
+    def _parseFCS(self, output, chunk_size):
+        game = MockGame()
+        game.s = Struct(foundations=[None], rows=list(range(8)),
+                        reserves=['fc0', 'fc1'])
+        solver = FreeCellSolver_Hint(game, MockSolverDialog(), base_rank=0)
+        parser = FreeCellSolverOutputParser(solver)
+        for i in range(0, len(output), chunk_size):
+            parser.feed(output[i:i+chunk_size])
+        parser.close()
+        return parser, solver
+
+    def test_fcs_output_parser(self):
+        expected = [[1, 3, None], [2, 1, 'fc0'], [13, 5, None]]
+        for chunk_size in (1, 2, 7, 64, len(FCS_OUTPUT)):
+            parser, solver = self._parseFCS(FCS_OUTPUT, chunk_size)
+            # TEST
+            self.assertEqual(parser.hints, expected,
+                             'moves in chunks of %d' % chunk_size)
+            # TEST
+            self.assertEqual(solver.dialog.text,
+                             {'iter': 1234, 'depth': 5, 'states': 2345},
+                             'progress in chunks of %d' % chunk_size)
+        parser, solver = self._parseFCS(
+            b'Iteration: 7\nI could not solve this game.\nMove a card'
+            b' from stack 3 to the foundations', 5)
+        # TEST
+        self.assertEqual((parser.done, parser.hints, solver.solver_state),
+                         (True, [], 'unsolved'), 'no moves after the end')
+
+    def test_solve_in_rounds(self):
+        solver = RoundsSolver(20000, 2.0)
+        solver.solveBoard('')
+        # TEST
+        self.assertEqual((solver.solver_state, len(solver.hints)),
+                         ('solved', 2), 'solved in a later round')
+        # TEST
+        self.assertEqual(solver.rounds[:3], [1000, 4000, 16000])
+        # TEST
+        self.assertEqual(solver.options['max_iters'], solver.rounds[-1])
+        solver = RoundsSolver(10 ** 9, 0.5)
+        start = time.time()
+        solver.solveBoard('')
+        t = time.time() - start
+        # TEST
+        self.assertEqual((solver.solver_state, solver.hints),
+                         ('intractable', [None]))
+        # TEST
+        self.assertTrue(t < 0.5 + 0.2, 'the time budget is kept (%.2f sec)'
+                        % t)
+        # TEST
+        self.assertTrue(len(solver.rounds) > 1 and
+                        solver.options['max_iters'] <= solver.rounds[-1],
+                        'the result of a complete round is kept')
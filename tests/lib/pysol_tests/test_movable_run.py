@@ -0,0 +1,53 @@
+# Written by Shlomi Fish, under the MIT Expat License.
+
+import unittest
+
+import pysollib.stack
+from pysollib.acard import AbstractCard
+from pysollib.hint import AbstractHint
+
+from .test_scorpion_canMove import MockGame
+
+
+class MovableRunTests(unittest.TestCase):
+    def _card(self, game, suit, rank, face_up=True):
+        c = AbstractCard(1000+rank*100+suit*10, 0, suit, rank, game)
+        c.face_up = face_up
+        return c
+
+    def test_sequence(self):
+        game = MockGame()
+        stack = pysollib.stack.AC_RowStack(0, 0, game)
+        # TEST
+        self.assertEqual(stack.getMovableRun(), 0)
+        stack.addCardModel(self._card(game, 1, 11, face_up=False))
+        for suit, rank in ((2, 9), (0, 8), (3, 7)):
+            stack.addCardModel(self._card(game, suit, rank))
+        # TEST
+        self.assertEqual(stack.getMovableRun(), 3)
+        # TEST
+        self.assertEqual(stack.getPile(), stack.cards[1:])
+        stack.addCardModel(self._card(game, 1, 2))
+        # TEST
+        self.assertEqual(stack.getMovableRun(), 1, 'not in sequence')
+        stack.removeCardModel()
+        # TEST
+        self.assertEqual(stack.getMovableRun(), 3, 'card removed')
+        h = AbstractHint(game, 0)
+        clone = h.ClonedStack(stack, stackcards=stack.cards[:3])
+        # TEST
+        self.assertEqual((clone.getMovableRun(), stack.getMovableRun()),
+                         (2, 3), 'a cloned stack has its own run')
+        stack.cards[-1].face_up = False
+        # TEST
+        self.assertEqual(stack.getMovableRun(), 0, 'top card flipped')
+
+    def test_face_up(self):
+        game = MockGame()
+        stack = game.rows[0]
+        for suit, rank in ((0, 4), (2, 9), (0, 3)):
+            stack.addCardModel(self._card(game, suit, rank))
+        stack.insertCardModel(self._card(game, 1, 5, face_up=False), 1)
+        # TEST
+        self.assertEqual(stack.getMovableRun(), 2,
+                         'any face-up cards in Yukon')
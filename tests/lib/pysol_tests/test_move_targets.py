@@ -0,0 +1,54 @@
+# Written by Shlomi Fish, under the MIT Expat License.
+
+import unittest
+
+import pysollib.stack
+from pysollib.acard import AbstractCard
+from pysollib.hint import MoveTargetIndex
+from pysollib.util import KING
+
+from .test_scorpion_canMove import MockGame
+
+STACK_CLASSES = [
+    pysollib.stack.AC_RowStack,
+    pysollib.stack.SS_RowStack,
+    pysollib.stack.RK_RowStack,
+    pysollib.stack.BO_RowStack,
+    pysollib.stack.KingAC_RowStack,
+    pysollib.stack.Spider_SS_RowStack,
+    pysollib.stack.Yukon_SC_RowStack,
+    pysollib.stack.UD_SS_RowStack,
+    pysollib.stack.ReserveStack,
+]
+
+
+class MoveTargetTests(unittest.TestCase):
+    def _card(self, game, suit, rank):
+        c = AbstractCard(1000+rank*100+suit*10, 0, suit, rank, game)
+        c.face_up = True
+        return c
+
+    def test_filter(self):
+        game = MockGame()
+        cards = [self._card(game, s, r) for s in range(4) for r in range(13)]
+        stacks = []
+        for top in (None, self._card(game, 1, 7), self._card(game, 2, KING)):
+            for cls in STACK_CLASSES:
+                stack = cls(0, 0, game)
+                if top is not None:
+                    stack.cards.append(top)
+                stacks.append(stack)
+        index = MoveTargetIndex(stacks)
+        for card in cards:
+            targets = index.getTargets(card)
+            accepting = [s for s in stacks
+                         if s.acceptsCards(game.talon, [card])]
+            # TEST
+            self.assertTrue(set(accepting) <= set(targets),
+                            'no accepting stack is left out')
+            # TEST
+            self.assertEqual(targets, [s for s in stacks if s in targets],
+                             'the stacks keep their order')
+        # TEST
+        self.assertEqual(len(index.getTargets(self._card(game, 0, 6))), 14,
+                         'only the possible targets')
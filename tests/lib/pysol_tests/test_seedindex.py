@@ -0,0 +1,39 @@
+# Written by Shlomi Fish, under the MIT Expat License.
+
+import os
+import tempfile
+import unittest
+
+from pysollib.games.solvable_seeds.seedindex import SeedIndex, \
+        loadSeedIndex, writeSeedIndex
+
+
+class SeedIndexTests(unittest.TestCase):
+    def test_index(self):
+        seeds = [32000, 32001, 32005, 32100, 40000, 40007]
+        fd, filename = tempfile.mkstemp()
+        os.close(fd)
+        writeSeedIndex(filename, reversed(seeds))
+        index = SeedIndex(filename)
+        # TEST
+        self.assertEqual(len(index), len(seeds))
+        # TEST
+        self.assertEqual(list(index), seeds, 'iterate in order')
+        # TEST
+        self.assertEqual([index[k] for k in range(len(seeds))], seeds,
+                         'k-th seed')
+        # TEST
+        self.assertTrue(40000 in index)
+        # TEST
+        self.assertFalse(32002 in index or 1 in index or 50000 in index)
+        index.close()
+        os.remove(filename)
+
+    def test_klondike(self):
+        index = loadSeedIndex('klondike')
+        # TEST
+        self.assertEqual(len(index), 79606)
+        # TEST
+        self.assertEqual((index[0], index[-1]), (32000, 211079))
+        # TEST
+        self.assertTrue(loadSeedIndex('no-such-game') is None)
@@ -0,0 +1,56 @@
+# Written by Shlomi Fish, under the MIT Expat License.
+
+import unittest
+
+from pysollib.acard import AbstractCard
+from pysollib.game.snapshot import SNAPSHOT_HASH_MASK, SnapshotSet, \
+        zobristStackHash
+
+
+class MockStack:
+    def __init__(self, id, cards):
+        self.id = id
+        self.cards = cards
+
+
+class SnapshotTests(unittest.TestCase):
+    def test_zobrist(self):
+        cards = [AbstractCard(i, 0, i % 4, i % 13, None) for i in range(8)]
+        s1 = MockStack(1, cards[:5])
+        s2 = MockStack(2, cards[5:])
+        h = zobristStackHash(s1) ^ zobristStackHash(s2)
+        # move the top card of s1 to s2
+        h ^= zobristStackHash(s1, -1)
+        s2.cards.append(s1.cards.pop())
+        h ^= zobristStackHash(s2, -1)
+        # TEST
+        self.assertEqual(h, zobristStackHash(s1) ^ zobristStackHash(s2),
+                         'incremental update matches full hash')
+        h2 = h ^ zobristStackHash(s2, -1)
+        s2.cards[-1].face_up = 1
+        h2 ^= zobristStackHash(s2, -1)
+        # TEST
+        self.assertNotEqual(h, h2, 'flip changes the hash')
+
+    def test_snapshot_set(self):
+        sns = SnapshotSet(maxlen=3)
+        # TEST
+        self.assertTrue(sns.add(1))
+        # TEST
+        self.assertFalse(sns.add(1), 'duplicate snapshot')
+        for sn in (2, 3, 4):
+            sns.add(sn)
+        # TEST
+        self.assertEqual(list(sns), [2, 3, 4], 'oldest snapshot dropped')
+
+        data = sns.dumpData()
+        # TEST
+        self.assertEqual(len(data), 3 * 8, 'compact save format')
+        loaded = SnapshotSet()
+        loaded.loadData(data)
+        # TEST
+        self.assertEqual(list(loaded), [2, 3, 4], 'save/load roundtrip')
+        loaded.loadData([5, -1])
+        # TEST
+        self.assertEqual(list(loaded), [5, SNAPSHOT_HASH_MASK],
+                         'old save format')
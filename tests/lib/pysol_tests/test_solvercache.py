@@ -0,0 +1,34 @@
+# Written by Shlomi Fish, under the MIT Expat License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from pysollib.solvercache import SolverCache
+
+
+class SolverCacheTests(unittest.TestCase):
+    def test_cache(self):
+        dirname = tempfile.mkdtemp()
+        cache = SolverCache(os.path.join(dirname, 'cache'), max_size=100)
+        keys = [SolverCache.makeKey('FreeCell', i) for i in range(3)]
+        # TEST
+        self.assertTrue(cache.get(keys[0]) is None)
+        data = {'state': 'solved', 'moves': [[1, ['rows', 0], None]]}
+        cache.put(keys[0], data)
+        # TEST
+        self.assertEqual(cache.get(keys[0]), data)
+        # TEST
+        self.assertEqual(SolverCache(cache.dirname).get(keys[0]), data,
+                         'persistent')
+        cache.put(keys[1], data)
+        cache.get(keys[0])
+        cache.put(keys[2], data)
+        # TEST
+        self.assertEqual([cache.get(k) is not None for k in keys],
+                         [True, False, True], 'least recently used evicted')
+        cache.clear()
+        # TEST
+        self.assertEqual(os.listdir(cache.dirname), [])
+        shutil.rmtree(dirname)
@@ -0,0 +1,160 @@
+# Written by Shlomi Fish, under the MIT Expat License.
+
+import sys
+import time
+import unittest
+
+from pysollib.hint import Base_Solver_Hint, solver_pool
+from pysollib.ui.tktile.solverdialog import BaseSolverDialog
+
+SLEEP = [sys.executable, '-c', 'import time; time.sleep(30)']
+
+
+class MockWidget:
+    def __init__(self):
+        self.options = {}
+
+    def config(self, **kw):
+        self.options.update(kw)
+
+    def cget(self, key):
+        return self.options.get(key, '')
+
+    def __getitem__(self, key):
+        return self.cget(key)
+
+    def __setitem__(self, key, value):
+        self.options[key] = value
+
+    def focus(self):
+        pass
+
+
+class MockTop:
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, ms, func, *args):
+        self.callbacks.append((func, args))
+
+    def update_idletasks(self):
+        pass
+
+    def runCallbacks(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for func, args in callbacks:
+            func(*args)
+
+
+class MockVar:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class MockOpt:
+    solver_show_progress = False
+    solver_iterations_output_step = 100
+
+
+class MockApp:
+    def __init__(self):
+        self.opt = MockOpt()
+        self.game = None
+
+    def getSolverCache(self):
+        return None
+
+
+class SleepingSolver(Base_Solver_Hint):
+    # runs a command which does not finish by itself on the solver pool
+    def calcBoardString(self):
+        return ''
+
+    def computeSolution(self, board):
+        self.callSolver(('run', SLEEP, b''))
+        self.hints = [None]
+        self.solver_state = 'unsolved'
+
+
+class QuickSolver(SleepingSolver):
+    def computeSolution(self, board):
+        self.hints = [None]
+        self.solver_state = 'unsolved'
+
+
+class MockGame:
+    def __init__(self, app, solver_class):
+        self.app = app
+        self.Solver_Class = lambda game, dialog: solver_class(
+            game, dialog, base_rank=0)
+
+
+class MockSolverDialog(BaseSolverDialog):
+    # the dialog without its window
+    def __init__(self, app):
+        self.app = app
+        self.solver = None
+        self.solver_thread = None
+        self.top = MockTop()
+        self.start_button = MockWidget()
+        self.play_button = MockWidget()
+        self.result_label = MockWidget()
+        self.iter_label = MockWidget()
+        self.depth_label = MockWidget()
+        self.states_label = MockWidget()
+        self.start_text = 'Start'
+        self.start_underline = 0
+        self.preset_var = MockVar('none')
+        self.max_iters_var = MockVar(1000)
+        self.time_budget_var = MockVar(0)
+
+
+class SolverDialogTests(unittest.TestCase):
+    def _createDialog(self, solver_class):
+        app = MockApp()
+        app.game = MockGame(app, solver_class)
+        return MockSolverDialog(app)
+
+    def test_cancel(self):
+        dialog = self._createDialog(SleepingSolver)
+        dialog.startSolving()
+        solver, thread = dialog.solver, dialog.solver_thread
+        # TEST
+        self.assertTrue(thread.is_alive(), 'the solver runs in a thread')
+        deadline = time.time() + 10
+        while (solver._worker is None or
+               solver._worker.child_pid is None) and \
+                time.time() < deadline:
+            time.sleep(0.01)
+        worker = solver._worker
+        # TEST
+        self.assertTrue(worker is not None, 'the solver has a worker')
+        dialog.cancelSolving()
+        thread.join(10)
+        # TEST
+        self.assertFalse(thread.is_alive(), 'the thread has finished')
+        # TEST
+        self.assertTrue(worker.killed and solver._worker is None,
+                        'the worker is released')
+        # TEST
+        self.assertFalse(worker in solver_pool._idle,
+                         'a killed worker is not reused')
+        # TEST
+        self.assertEqual((dialog.solver, dialog.result_label['text']),
+                         (None, 'Solving cancelled'))
+        dialog.top.runCallbacks()
+        # TEST
+        self.assertEqual(dialog.top.callbacks, [],
+                         'the dialog stops polling a cancelled solver')
+
+    def test_finish(self):
+        dialog = self._createDialog(QuickSolver)
+        dialog.startSolving()
+        dialog.solver_thread.join(10)
+        dialog.top.runCallbacks()
+        # TEST
+        self.assertEqual((dialog.solver, dialog.result_label['text']),
+                         (None, 'I could not solve this game.'))
@@ -0,0 +1,120 @@
+# Written by Shlomi Fish, under the MIT Expat License.
+
+import sys
+import time
+import unittest
+
+import pysollib.solverpool
+from pysollib.solverpool import RESUME_SLICE, SolverPool
+
+UPPER = 'import sys; sys.stdout.write(sys.stdin.read().upper())'
+
+
+class MockMove:
+    def __init__(self, idx):
+        self.idx = idx
+
+    def get_column_idx(self):
+        return self.idx
+
+
+class MockBlackHoleSolver:
+    # checks RATE iterations per second, and has solved the board
+    # after solve_iters of them; a solve is suspended at the limit
+    RATE = 100000
+    SUSPENDED = 5
+
+    def __init__(self, solve_iters):
+        self.solve_iters = solve_iters
+        self.iters = self.limit = 0
+        self.moves = []
+
+    def recycle(self):
+        self.iters = 0
+
+    def read_board(self, board, **kw):
+        pass
+
+    def limit_iterations(self, max_iters):
+        self.limit = max_iters
+
+    def resume_solution(self):
+        target = min(self.limit, self.solve_iters)
+        time.sleep(max(0, target - self.iters) / self.RATE)
+        self.iters = max(self.iters, target)
+        if self.iters < self.solve_iters:
+            return self.SUSPENDED
+        self.moves = [MockMove(i) for i in (2, 1, 0)]
+        return 0
+
+    def ret_code_is_suspend(self, ret_code):
+        return ret_code == self.SUSPENDED
+
+    def get_num_times(self):
+        return self.iters
+
+    def get_num_states_in_collection(self):
+        return self.iters
+
+    def get_next_move(self):
+        return self.moves.pop() if self.moves else None
+
+
+class SolverPoolTests(unittest.TestCase):
+    def test_run(self):
+        pool = SolverPool(size=1)
+        worker = pool.acquire()
+        # TEST
+        self.assertEqual(worker.process._start_method, 'spawn',
+                         'the worker is not forked')
+        output = []
+        reply = worker.call(('run', [sys.executable, '-c', UPPER], b'abc'),
+                            output.append)
+        # TEST
+        self.assertEqual((b''.join(output),) + reply, (b'ABC', b'', 0))
+        reply = worker.call(('run', ['no-such-solver-command'], b''))
+        # TEST
+        self.assertEqual(reply[1], 127, 'command not found')
+        # TEST
+        self.assertRaises(RuntimeError, worker.call, ('no-such-request',))
+        pool.release(worker)
+        # TEST
+        self.assertTrue(pool.acquire() is worker, 'the worker is reused')
+        worker.kill()
+        pool.release(worker)
+        new_worker = pool.acquire()
+        # TEST
+        self.assertTrue(new_worker is not worker, 'killed worker replaced')
+        new_worker.close()
+
+    def _solveBHS(self, solve_iters, time_budget):
+        # returns the reply and the time it took
+        solvers = pysollib.solverpool._library_solvers
+        old = solvers.get('bhs')
+        solvers['bhs'] = MockBlackHoleSolver(solve_iters)
+        try:
+            start = time.time()
+            reply = pysollib.solverpool._solveBHS({}, '', 1000, time_budget)
+            return reply, time.time() - start
+        finally:
+            solvers['bhs'] = old
+
+    def test_resume_solution(self):
+        reply, t = self._solveBHS(20000, 2.0)
+        # TEST
+        self.assertEqual(reply, ('bhs', 'solved', 20000, 20000, [0, 1, 2]),
+                         'solved in the later rounds')
+        # TEST
+        self.assertTrue(t < 1.0, 'stops when solved')
+        reply, t = self._solveBHS(10 ** 9, 0.5)
+        # TEST
+        self.assertEqual(reply[:2], ('bhs', 'intractable'))
+        # TEST
+        self.assertTrue(reply[2] > 10000, 'the solve was resumed')
+        # TEST
+        self.assertTrue(0.5 <= t < 0.5 + 2 * RESUME_SLICE,
+                        'the time budget is kept (%.2f sec)' % t)
+        reply, t = self._solveBHS(10 ** 9, 0)
+        # TEST
+        self.assertEqual(reply[1:3], ('intractable', 1000),
+                         'no budget: max_iters only')